@@ -13,10 +13,9 @@ Usage:
 
 import sys
 import argparse
-import subprocess
-import difflib
+import functools
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional
 
 # Add the local 'setup' directory to the Python import path
 current_dir = Path(__file__).parent
@@ -77,6 +76,14 @@ def create_global_parser() -> argparse.ArgumentParser:
                                help="Skip checking for updates")
     global_parser.add_argument("--auto-update", action="store_true",
                                help="Automatically install updates without prompting")
+    global_parser.add_argument("--trace", type=Path, metavar="FILE",
+                               help="Write a Chrome/Perfetto trace of the operation's phases to FILE")
+    global_parser.add_argument("--profile", choices=["cpu", "mem", "both"],
+                               help="Profile the operation's CPU time and/or memory allocations "
+                                    "(reports are written to <install-dir>/logs/profiles)")
+    global_parser.add_argument("--progress", choices=["bar", "json", "none"], default="bar",
+                               help="Progress display: console bar, JSON lines on stdout for automation "
+                                    "(implies --quiet), or none (default: bar)")
 
     return global_parser
 
@@ -107,7 +114,13 @@ Examples:
         description="Framework operations to perform"
     )
 
-    return parser, subparsers, global_parser
+    # Operations accept the global flags too; without defaults of their own, so
+    # that flags given before the operation name are not reset by the subparser
+    operation_global_parser = create_global_parser()
+    for action in operation_global_parser._actions:
+        action.default = argparse.SUPPRESS
+
+    return parser, subparsers, operation_global_parser
 
 
 def setup_global_environment(args: argparse.Namespace):
@@ -123,6 +136,9 @@ def setup_global_environment(args: argparse.Namespace):
     # Define log directory unless it's a dry run
     log_dir = args.install_dir / "logs" if not args.dry_run else None
     setup_logging("superclaude_hub", log_dir=log_dir, console_level=level)
+    if args.progress == "json":
+        # stdout carries the JSON progress records; errors go to stderr
+        get_logger().set_console_stream(sys.stderr)
 
     # Log startup context
     logger = get_logger()
@@ -152,10 +168,49 @@ def load_operation_module(name: str):
         return None
 
 
-def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
-    """Register subcommand parsers and map operation names to their run functions"""
+def find_selected_operation(argv: List[str], global_parser: argparse.ArgumentParser) -> Optional[str]:
+    """
+    Find the operation named on the command line without parsing it fully
+    
+    Only the selected operation's module needs to be imported; all other
+    operations are registered with lightweight placeholder parsers.
+    """
+    operations = get_operation_modules()
+    # Values of global options (--install-dir DIR, --trace FILE, ...) may look like operation names
+    value_options = {
+        option for action in global_parser._actions if action.nargs != 0
+        for option in action.option_strings
+    }
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in value_options:
+            skip_next = True
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg if arg in operations else None
+    return None
+
+
+def register_operation_parsers(subparsers, global_parser,
+                               selected: Optional[str] = None) -> Dict[str, Callable]:
+    """
+    Register subcommand parsers and map operation names to their run functions
+    
+    Only the selected operation's module is imported. The other operations
+    get placeholder parsers declaring their help text, which is all the
+    top-level --help output needs.
+    """
     operations = {}
     for name, desc in get_operation_modules().items():
+        if name != selected:
+            subparsers.add_parser(name, help=desc, parents=[global_parser])
+            operations[name] = None
+            continue
+
         module = load_operation_module(name)
         if module and hasattr(module, 'register_parser') and hasattr(module, 'run'):
             module.register_parser(subparsers, global_parser)
@@ -168,6 +223,46 @@ def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]
     return operations
 
 
+def run_traced(run_func: Callable, args: argparse.Namespace) -> int:
+    """Run an operation with span tracing on and write the trace file afterwards"""
+    from setup.utils.tracing import get_tracer
+
+    tracer = get_tracer()
+    tracer.start()
+    try:
+        with tracer.span(args.operation, "operation"):
+            return run_func(args)
+    finally:
+        tracer.stop()
+        try:
+            count = tracer.write(args.trace)
+            if not args.quiet:
+                display_info(f"Trace with {count} spans written to {args.trace} (open in https://ui.perfetto.dev)")
+        except OSError as e:
+            display_error(f"Could not write trace file {args.trace}: {e}")
+
+
+def run_profiled(run_func: Callable, args: argparse.Namespace) -> int:
+    """Run an operation under cProfile and/or tracemalloc and write the reports afterwards"""
+    from setup.utils.profiling import OperationProfiler
+
+    profiler = OperationProfiler(args.profile, args.install_dir / "logs" / "profiles", args.operation)
+    try:
+        with profiler:
+            return run_func(args)
+    finally:
+        try:
+            files = profiler.write()
+            if not args.quiet:
+                print()
+                for line in profiler.summary:
+                    print(line)
+                for path in files:
+                    display_info(f"Profile written to {path}")
+        except OSError as e:
+            display_error(f"Could not write profile reports: {e}")
+
+
 def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
     """Run a legacy operation script if module is unavailable"""
     script_path = Path(__file__).parent / f"{op}.py"
@@ -178,6 +273,7 @@ def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
 
     display_warning(f"Falling back to legacy script for '{op}'...")
 
+    import subprocess
     cmd = [sys.executable, str(script_path)]
 
     # Convert args into CLI flags
@@ -201,9 +297,22 @@ def main() -> int:
     """Main entry point"""
     try:
         parser, subparsers, global_parser = create_parser()
-        operations = register_operation_parsers(subparsers, global_parser)
+        selected = find_selected_operation(sys.argv[1:], global_parser)
+        operations = register_operation_parsers(subparsers, global_parser, selected)
+        # Placeholder parsers reject operation options, so only check the operation name first
+        args, _ = parser.parse_known_args()
+
+        # The quick scan can miss the operation (e.g. abbreviated options);
+        # rebuild the parser with the operation argparse actually selected
+        if args.operation and args.operation != selected:
+            parser, subparsers, global_parser = create_parser()
+            operations = register_operation_parsers(subparsers, global_parser, args.operation)
         args = parser.parse_args()
         
+        # Keep stdout to the JSON progress records
+        if args.progress == "json":
+            args.quiet = True
+        
         # Check for updates unless disabled
         if not args.quiet and not getattr(args, 'no_update_check', False):
             try:
@@ -237,6 +346,7 @@ def main() -> int:
 
         # Handle unknown operations and suggest corrections
         if args.operation not in operations:
+            import difflib
             close = difflib.get_close_matches(args.operation, operations.keys(), n=1)
             suggestion = f"Did you mean: {close[0]}?" if close else ""
             display_error(f"Unknown operation: '{args.operation}'. {suggestion}")
@@ -251,7 +361,12 @@ def main() -> int:
         if run_func:
             if logger:
                 logger.info(f"Executing operation: {args.operation}")
-            return run_func(args)
+            operation = run_func
+            if getattr(args, 'trace', None):
+                operation = functools.partial(run_traced, operation)
+            if getattr(args, 'profile', None):
+                operation = functools.partial(run_profiled, operation)
+            return operation(args)
         else:
             # Fallback to legacy script
             if logger:
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+SuperClaude install/update/backup/restore/uninstall benchmark
+
+Builds a synthetic project (a copy of setup/ with a generated SuperClaude/
+source tree of N markdown files) and a synthetic home directory with a
+~/.claude.json of several megabytes, then runs each operation in its own
+worker process against them and records wall time, read/write syscalls
+and peak RSS. Results are compared against a saved baseline.
+
+Usage:
+    python benchmarks/operations.py                          # print results
+    python benchmarks/operations.py --sizes 10,1k            # smaller trees only
+    python benchmarks/operations.py --save baseline.json     # record a baseline
+    python benchmarks/operations.py --compare baseline.json  # fail on regression
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Size label -> (synthetic source files, size of ~/.claude.json in bytes)
+SIZES = {
+    "10": (10, 128 * 1024),
+    "1k": (1000, 2 * 1024 * 1024),
+    "10k": (10000, 8 * 1024 * 1024),
+}
+
+# Operations in the order they run against one synthetic tree
+OPERATIONS = ("install", "update", "backup", "restore", "uninstall")
+
+COMPONENTS = ["core", "commands", "agents", "modes", "mcp"]
+MCP_SERVERS = ["context7", "sequential"]
+
+# Source directories the synthetic files are spread over
+SOURCE_DIRS = ("Core", "Commands", "Agents", "Modes")
+
+# Share of source files changed before the update run
+UPDATE_FRACTION = 0.1
+
+# Metric -> smallest absolute increase counted as a regression, so that
+# noise on very small values does not fail a comparison
+METRICS = {
+    "wall_ms": 20.0,
+    "read_syscalls": 100,
+    "write_syscalls": 100,
+    "peak_rss_kb": 2048,
+}
+
+WORDS = ("agent", "command", "context", "flag", "mode", "persona", "principle", "rule",
+         "server", "session", "task", "token", "tool", "workflow", "validate", "analyze")
+
+
+def markdown_text(rng: random.Random, title: str) -> str:
+    """Generate a markdown document of 1-6 KB"""
+    lines = [f"# {title}", ""]
+    for section in range(rng.randint(2, 6)):
+        lines.append(f"## Section {section + 1}")
+        for _ in range(rng.randint(3, 10)):
+            lines.append("- " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 16))))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def build_project(project: Path, file_count: int, seed: int = 0) -> None:
+    """
+    Create a synthetic project: setup/ and the MCP templates copied from
+    the repository, plus file_count generated markdown sources
+    """
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    shutil.copytree(PROJECT_ROOT / "setup", project / "setup", ignore=ignore)
+    shutil.copy2(PROJECT_ROOT / "VERSION", project / "VERSION")
+
+    package = project / "SuperClaude"
+    package.mkdir()
+    for name in ("__init__.py", "__main__.py"):
+        shutil.copy2(PROJECT_ROOT / "SuperClaude" / name, package / name)
+    shutil.copytree(PROJECT_ROOT / "SuperClaude" / "MCP", package / "MCP", ignore=ignore)
+
+    rng = random.Random(seed)
+    for source_dir in SOURCE_DIRS:
+        (package / source_dir).mkdir()
+    for index in range(file_count):
+        source_dir = SOURCE_DIRS[index % len(SOURCE_DIRS)]
+        title = f"{source_dir.upper()}_{index:05d}"
+        (package / source_dir / f"{title}.md").write_text(markdown_text(rng, title), encoding="utf-8")
+
+
+def build_home(home: Path, config_size: int, seed: int = 0) -> None:
+    """Create a home directory with a ~/.claude.json of about config_size bytes"""
+    rng = random.Random(seed)
+    projects = {}
+    size = 0
+    index = 0
+    while size < config_size:
+        history = [
+            {"display": " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 40))), "pastedContents": {}}
+            for _ in range(rng.randint(5, 30))
+        ]
+        project = {
+            "allowedTools": [],
+            "history": history,
+            "mcpContextUris": [],
+            "mcpServers": {},
+            "hasTrustDialogAccepted": True,
+            "lastCost": round(rng.random(), 4),
+        }
+        projects[f"/home/user/projects/project-{index:05d}"] = project
+        size += len(json.dumps(project, indent=2)) + 48
+        index += 1
+
+    config = {
+        "numStartups": 42,
+        "projects": projects,
+        "mcpServers": {},
+    }
+    home.mkdir(parents=True, exist_ok=True)
+    (home / ".claude.json").write_text(json.dumps(config, indent=2), encoding="utf-8")
+
+
+def touch_sources(project: Path, fraction: float, seed: int = 1) -> int:
+    """Append a line to a fraction of the generated sources; returns the number changed"""
+    sources = sorted(path for source_dir in SOURCE_DIRS
+                     for path in (project / "SuperClaude" / source_dir).glob("*.md"))
+    rng = random.Random(seed)
+    changed = rng.sample(sources, max(1, int(len(sources) * fraction)))
+    for path in changed:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n- updated " + " ".join(rng.choice(WORDS) for _ in range(8)) + "\n")
+    return len(changed)
+
+
+def read_io_counters() -> Optional[Tuple[int, int]]:
+    """Get (read syscalls, write syscalls) of this process, None where /proc is unavailable"""
+    try:
+        counters = {}
+        with open("/proc/self/io", "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                counters[name] = int(value)
+        return counters["syscr"], counters["syscw"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def parse_cli(argv: List[str]) -> argparse.Namespace:
+    """Parse an operation command line with the real SuperClaude parser"""
+    from SuperClaude.__main__ import create_parser, register_operation_parsers
+
+    parser, subparsers, global_parser = create_parser()
+    register_operation_parsers(subparsers, global_parser, selected=argv[0])
+    return parser.parse_args(argv)
+
+
+def operation_install(install_dir: Path) -> bool:
+    """Installer.install_components for all benchmarked components"""
+    from setup.core.installer import Installer
+    from setup.core.registry import ComponentRegistry
+
+    args = parse_cli(["install", "--install-dir", str(install_dir), "--yes", "--no-backup"])
+    installer = Installer(install_dir)
+    registry = ComponentRegistry(Path("setup") / "components")
+    registry.discover_components()
+    instances = registry.create_component_instances(COMPONENTS, install_dir)
+    installer.register_components(list(instances.values()))
+    config = {
+        "force": False,
+        "incremental": True,
+        "link_strategy": args.link_strategy,
+        "staged": args.staged,
+        "backup": False,
+        "dry_run": False,
+        "selected_mcp_servers": MCP_SERVERS,
+    }
+    return installer.install_components(registry.resolve_dependencies(COMPONENTS), config)
+
+
+def operation_update(install_dir: Path) -> bool:
+    """Incremental component update after part of the sources changed"""
+    from setup.core.installer import Installer
+    from setup.core.registry import ComponentRegistry
+
+    args = parse_cli(["update", "--install-dir", str(install_dir), "--yes", "--no-backup"])
+    installer = Installer(install_dir)
+    registry = ComponentRegistry(Path("setup") / "components")
+    registry.discover_components()
+    instances = registry.create_component_instances(COMPONENTS, install_dir)
+    installer.register_components(list(instances.values()))
+    config = {
+        "force": False,
+        "incremental": True,
+        "link_strategy": args.link_strategy,
+        "staged": args.staged,
+        "backup": False,
+        "dry_run": False,
+        "update_mode": True,
+        "selected_mcp_servers": MCP_SERVERS,
+    }
+    return installer.update_components(COMPONENTS, config)
+
+
+def operation_backup(install_dir: Path) -> bool:
+    """create_backup with the CLI defaults"""
+    from setup.cli.commands.backup import create_backup
+
+    args = parse_cli(["backup", "--create", "--install-dir", str(install_dir), "--yes"])
+    return create_backup(args)
+
+
+def operation_restore(install_dir: Path) -> bool:
+    """restore_backup of the newest backup over the installation"""
+    from setup.cli.commands.backup import get_backup_directory, list_backups, restore_backup
+
+    args = parse_cli(["backup", "--restore", "--install-dir", str(install_dir), "--yes", "--overwrite"])
+    backups = list_backups(get_backup_directory(args))
+    if not backups:
+        return False
+    return restore_backup(Path(backups[0]["path"]), args)
+
+
+def operation_uninstall(install_dir: Path) -> bool:
+    """perform_uninstall of all benchmarked components"""
+    from setup.cli.commands.uninstall import get_installation_info, perform_uninstall
+
+    args = parse_cli(["uninstall", "--install-dir", str(install_dir), "--yes", "--progress", "none",
+                      "--components", *COMPONENTS])
+    return perform_uninstall(COMPONENTS, args, get_installation_info(install_dir), {})
+
+
+OPERATION_FUNCTIONS = {
+    "install": operation_install,
+    "update": operation_update,
+    "backup": operation_backup,
+    "restore": operation_restore,
+    "uninstall": operation_uninstall,
+}
+
+
+def worker(operation: str) -> int:
+    """Run one operation in this process and print its measurements as JSON"""
+    from setup.utils.logger import LogLevel, setup_logging
+
+    install_dir = Path.home() / ".claude"
+    setup_logging("benchmark", console_level=LogLevel.ERROR)
+
+    io_before = read_io_counters()
+    start = time.perf_counter()
+    success = OPERATION_FUNCTIONS[operation](install_dir)
+    wall_ms = (time.perf_counter() - start) * 1000
+    io_after = read_io_counters()
+
+    result = {
+        "success": bool(success),
+        "wall_ms": wall_ms,
+        "read_syscalls": io_after[0] - io_before[0] if io_before and io_after else None,
+        "write_syscalls": io_after[1] - io_before[1] if io_before and io_after else None,
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // (1024 if sys.platform == "darwin" else 1),
+    }
+    print(json.dumps(result))
+    return 0 if success else 1
+
+
+def run_operation(operation: str, project: Path, home: Path) -> Dict[str, Any]:
+    """Run one operation in a worker process against the synthetic project and home"""
+    env = dict(os.environ, HOME=str(home), PYTHONPATH=str(project), PYTHONDONTWRITEBYTECODE="1")
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--worker", operation]
+    result = subprocess.run(cmd, cwd=project, env=env, capture_output=True, text=True)
+    lines = result.stdout.strip().splitlines()
+    if not lines:
+        raise RuntimeError(f"{operation} worker failed:\n{result.stderr}")
+    measurement = json.loads(lines[-1])
+    if not measurement["success"]:
+        raise RuntimeError(f"{operation} did not succeed:\n{result.stderr}")
+    return measurement
+
+
+def measure_size(label: str, repeat: int, work_dir: Path, keep: bool) -> Dict[str, Dict[str, Any]]:
+    """Run all operations repeat times on fresh synthetic trees of one size"""
+    file_count, config_size = SIZES[label]
+    samples: Dict[str, List[Dict[str, Any]]] = {operation: [] for operation in OPERATIONS}
+
+    for _ in range(repeat):
+        root = Path(tempfile.mkdtemp(prefix=f"superclaude-bench-{label}-", dir=work_dir))
+        try:
+            project, home = root / "project", root / "home"
+            build_project(project, file_count)
+            build_home(home, config_size)
+            for operation in OPERATIONS:
+                if operation == "update":
+                    touch_sources(project, UPDATE_FRACTION)
+                samples[operation].append(run_operation(operation, project, home))
+        finally:
+            if keep:
+                print(f"Kept synthetic tree {root}")
+            else:
+                shutil.rmtree(root, ignore_errors=True)
+
+    results = {}
+    for operation, runs in samples.items():
+        result = {}
+        for metric in METRICS:
+            values = [run[metric] for run in runs if run[metric] is not None]
+            result[metric] = round(statistics.median(values), 2) if values else None
+        results[f"{operation}@{label}"] = result
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[str]:
+    """Return regressions where a metric grew by more than threshold and its minimum delta"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric, min_delta in METRICS.items():
+            before, after = previous.get(metric), current.get(metric)
+            if not before or after is None:
+                continue
+            if after > before * (1 + threshold) and after - before >= min_delta:
+                regressions.append(
+                    f"{name}: {metric} {before:.1f} -> {after:.1f} "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SuperClaude operations on synthetic trees")
+    parser.add_argument("--sizes", default=",".join(SIZES),
+                        help=f"Comma-separated tree sizes (default: {','.join(SIZES)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (median is reported)")
+    parser.add_argument("--save", type=Path, help="Write results as a new baseline")
+    parser.add_argument("--compare", type=Path, help="Compare results against a baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative increase of any metric before failing (default: 0.25)")
+    parser.add_argument("--work-dir", type=Path, default=Path.home(),
+                        help="Where the synthetic trees are created; the installer refuses system "
+                             "directories such as /tmp (default: home directory)")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic trees for inspection")
+    parser.add_argument("--worker", choices=OPERATIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return worker(args.worker)
+
+    labels = [label.strip() for label in args.sizes.split(",") if label.strip()]
+    unknown = [label for label in labels if label not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)} (choose from {', '.join(SIZES)})")
+
+    results = {}
+    for label in labels:
+        results.update(measure_size(label, max(1, args.repeat), args.work_dir, args.keep))
+
+    def show(value: Any) -> str:
+        return "n/a" if value is None else f"{value:.1f}" if isinstance(value, float) else str(value)
+
+    print(f"{'operation':<16} {'wall ms':>10} {'read sys':>10} {'write sys':>10} {'peak RSS KB':>12}")
+    for name, result in results.items():
+        print(f"{name:<16} {show(result['wall_ms']):>10} {show(result['read_syscalls']):>10} "
+              f"{show(result['write_syscalls']):>10} {show(result['peak_rss_kb']):>12}")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Operation regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("No operation regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+SuperClaude CLI startup benchmark
+
+Measures import time (python -X importtime) and wall time of common
+SuperClaude invocations and compares them against a saved baseline.
+Also checks that global options are accepted before the operation name,
+which the operation pre-scan in SuperClaude/__main__.py has to skip over.
+
+Usage:
+    python benchmarks/startup.py                          # print results
+    python benchmarks/startup.py --save baseline.json     # record a baseline
+    python benchmarks/startup.py --compare baseline.json  # fail on regression
+"""
+
+import argparse
+import json
+import os
+import statistics
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Invocations whose startup cost is tracked
+SCENARIOS = {
+    "help": ["--help"],
+    "version": ["--version"],
+    "install-help": ["install", "--help"],
+    "update-help": ["update", "--help"],
+    "uninstall-help": ["uninstall", "--help"],
+    "backup-help": ["backup", "--help"],
+}
+
+# Invocations with global options before the operation that must succeed, run
+# in a scratch home ("{home}" is replaced), with an optional output check
+# returning an error message
+ARGUMENT_CHECKS: Dict[str, Tuple[List[str], Optional[Callable[[Path, str], Optional[str]]]]] = {
+    "install-dir-first": (
+        ["--install-dir", "{home}/.claude/custom", "install", "--components", "core", "--yes", "--quiet"],
+        lambda home, stdout: None if (home / ".claude" / "custom" / "CLAUDE.md").exists()
+        else "nothing installed to --install-dir",
+    ),
+    "trace-first": (
+        ["--trace", "{home}/trace.json", "install", "--components", "core", "--yes", "--quiet"],
+        lambda home, stdout: None if (home / "trace.json").exists() else "no trace file written",
+    ),
+    "profile-first": (
+        ["--profile", "cpu", "install", "--components", "core", "--yes", "--quiet"],
+        lambda home, stdout: None if list((home / ".claude" / "logs" / "profiles").glob("install_*.prof"))
+        else "no profile written",
+    ),
+    "progress-json-first": (
+        ["--progress", "json", "install", "--components", "core", "--yes"],
+        lambda home, stdout: check_ndjson(stdout),
+    ),
+}
+
+
+def check_ndjson(stdout: str) -> Optional[str]:
+    """Check that stdout consists of JSON records only, ending with a finish record"""
+    records = []
+    for line in stdout.splitlines():
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            return f"non-JSON line on stdout: {line[:80]!r}"
+    if not records or records[-1].get("event") != "finish":
+        return "no finish record on stdout"
+    return None
+
+
+def check_arguments() -> List[str]:
+    """Run ARGUMENT_CHECKS and return the failures"""
+    failures = []
+    for name, (args, verify) in ARGUMENT_CHECKS.items():
+        home = Path(tempfile.mkdtemp(prefix="superclaude-args-", dir=Path.home()))
+        try:
+            env = dict(os.environ, HOME=str(home), PYTHONDONTWRITEBYTECODE="1")
+            cmd = [sys.executable, "-m", "SuperClaude",
+                   *[arg.replace("{home}", str(home)) for arg in args], "--no-update-check"]
+            result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+            if result.returncode != 0:
+                failures.append(f"{name}: exit code {result.returncode}: {result.stderr.strip()[-200:]}")
+                continue
+            error = verify(home, result.stdout) if verify else None
+            if error:
+                failures.append(f"{name}: {error}")
+        finally:
+            shutil.rmtree(home, ignore_errors=True)
+    return failures
+
+
+def parse_importtime(stderr: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Parse -X importtime output
+    
+    Returns:
+        Tuple of (total import time in us, cumulative us per top-level import)
+    """
+    total = 0
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header line
+        total += int(self_us.strip())
+        # Nested imports are indented below the module importing them
+        if not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative.strip())
+    return total, top_level
+
+
+def run_scenario(args: List[str]) -> Tuple[float, int, Dict[str, int]]:
+    """Run one SuperClaude invocation and return (wall ms, import us, top-level imports)"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    cmd = [sys.executable, "-X", "importtime", "-m", "SuperClaude", *args, "--no-update-check"]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    import_us, top_level = parse_importtime(result.stderr)
+    return wall_ms, import_us, top_level
+
+
+def measure(repeat: int) -> Dict[str, Dict[str, float]]:
+    """Measure all scenarios, keeping the median of several runs"""
+    results = {}
+    for name, args in SCENARIOS.items():
+        walls, imports = [], []
+        top_level = {}
+        for _ in range(repeat):
+            wall_ms, import_us, top_level = run_scenario(args)
+            walls.append(wall_ms)
+            imports.append(import_us / 1000)
+        heaviest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:5]
+        results[name] = {
+            "wall_ms": round(statistics.median(walls), 2),
+            "import_ms": round(statistics.median(imports), 2),
+            "heaviest_imports": {module: round(us / 1000, 2) for module, us in heaviest},
+        }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """Return regressions where import or wall time grew by more than threshold"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ("import_ms", "wall_ms"):
+            if previous.get(metric) and current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {previous[metric]:.1f} -> {current[metric]:.1f} "
+                    f"(+{(current[metric] / previous[metric] - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SuperClaude CLI startup")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario (median is reported)")
+    parser.add_argument("--save", type=Path, help="Write results as a new baseline")
+    parser.add_argument("--compare", type=Path, help="Compare results against a baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative slowdown before failing (default: 0.25)")
+    args = parser.parse_args()
+
+    failures = check_arguments()
+    for failure in failures:
+        print(f"Argument check failed: {failure}")
+
+    results = measure(max(1, args.repeat))
+
+    print(f"{'scenario':<16} {'import ms':>10} {'wall ms':>10}  heaviest imports")
+    for name, result in results.items():
+        heaviest = ", ".join(f"{module} {ms:.1f}" for module, ms in result["heaviest_imports"].items())
+        print(f"{name:<16} {result['import_ms']:>10.1f} {result['wall_ms']:>10.1f}  {heaviest}")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Startup regressions:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("No startup regressions")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
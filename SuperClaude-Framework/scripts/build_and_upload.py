@@ -95,6 +95,43 @@ def validate_project_structure() -> bool:
     print("✅ Project structure validation passed")
     return True
 
+def generate_component_manifest() -> bool:
+    """Regenerate the static component manifest shipped in setup/data"""
+    print("🧩 Generating component manifest...")
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from setup.core.registry import ComponentRegistry
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        if not registry.write_manifest():
+            print("❌ Could not write component manifest")
+            return False
+    except Exception as e:
+        print(f"❌ Component manifest generation failed: {e}")
+        return False
+    
+    print("✅ Component manifest generated")
+    return True
+
+def generate_mcp_template_bundle() -> bool:
+    """Precompile the MCP server templates into setup/data/mcp_templates.json"""
+    print("🧩 Compiling MCP server templates...")
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from setup.services.mcp_templates import MCPTemplateRegistry, compute_source_hash, write_bundle
+        config_dir = PROJECT_ROOT / "SuperClaude" / "MCP" / "configs"
+        registry, errors = MCPTemplateRegistry.compile(config_dir, compute_source_hash(config_dir))
+        for error in errors:
+            print(f"❌ {error}")
+        if errors or not write_bundle(registry):
+            print("❌ Could not write MCP template bundle")
+            return False
+    except Exception as e:
+        print(f"❌ MCP template compilation failed: {e}")
+        return False
+    
+    print(f"✅ Compiled {len(registry)} MCP server templates")
+    return True
+
 def build_package() -> bool:
     """Build the package"""
     return run_command(
@@ -209,6 +246,14 @@ def main():
     
     # Step 4: Build package
     if not args.skip_build:
+        if not generate_component_manifest():
+            print("❌ Component manifest generation failed")
+            sys.exit(1)
+        
+        if not generate_mcp_template_bundle():
+            print("❌ MCP template compilation failed")
+            sys.exit(1)
+        
         if not build_package():
             print("❌ Package build failed")
             sys.exit(1)
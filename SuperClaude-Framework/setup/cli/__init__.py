@@ -3,8 +3,18 @@ SuperClaude CLI Module
 Command-line interface operations for SuperClaude installation system
 """
 
+import importlib
+
 from .base import OperationBase
-from .commands import *
+
+
+def __getattr__(name):
+    # Operation classes are resolved lazily through the commands package
+    commands = importlib.import_module(".commands", __name__)
+    if name in commands.__all__:
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'OperationBase',
@@ -1,13 +1,30 @@
 """
 SuperClaude CLI Commands
 Individual command implementations for the CLI interface
+
+Operation classes are imported on first access so that loading one
+command module does not pull in all the others.
 """
 
+import importlib
+
 from ..base import OperationBase
-from .install import InstallOperation
-from .uninstall import UninstallOperation
-from .update import UpdateOperation
-from .backup import BackupOperation
+
+# Lazily exported operation classes and the modules defining them
+_LAZY_OPERATIONS = {
+    'InstallOperation': '.install',
+    'UninstallOperation': '.uninstall',
+    'UpdateOperation': '.update',
+    'BackupOperation': '.backup',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_OPERATIONS:
+        module = importlib.import_module(_LAZY_OPERATIONS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'OperationBase',
@@ -5,20 +5,22 @@ Refactored from backup.py for unified CLI hub
 
 import sys
 import time
-import tarfile
 import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
+from ...services.backup import (
+    BackupService, BackupStore, ZSTD_AVAILABLE, METADATA_ARCNAME, CATALOG_SUFFIX, get_catalog_path
+)
 from ...services.settings import SettingsService
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ...utils.logger import get_logger
-from ... import DEFAULT_INSTALL_DIR
+from ... import DEFAULT_INSTALL_DIR, __version__
 from . import OperationBase
 
 
@@ -40,9 +42,12 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
         epilog="""
 Examples:
   SuperClaude backup --create               # Create new backup
+  SuperClaude backup --create --compress zstd  # Multi-threaded zstd backup
+  SuperClaude backup --create --format snapshot  # Deduplicated snapshot
   SuperClaude backup --list --verbose       # List available backups (verbose)
   SuperClaude backup --restore              # Interactive restore
   SuperClaude backup --restore backup.tar.gz  # Restore specific backup
+  SuperClaude backup --restore backup.tar.gz --path commands/sc/analyze.md  # Restore one file
   SuperClaude backup --info backup.tar.gz   # Show backup information
   SuperClaude backup --cleanup --force      # Clean up old backups (forced)
         """,
@@ -97,11 +102,24 @@ Examples:
         help="Custom backup name (for --create)"
     )
     
+    parser.add_argument(
+        "--format",
+        choices=["archive", "snapshot"],
+        default="archive",
+        help="Backup format: standalone archive or deduplicated snapshot in <backup-dir>/store (default: archive)"
+    )
+    
     parser.add_argument(
         "--compress",
-        choices=["none", "gzip", "bzip2"],
+        choices=["none", "gzip", "bzip2", "zstd"],
         default="gzip",
-        help="Compression method (default: gzip)"
+        help="Compression method (default: gzip; zstd requires the zstandard package)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of compression/restore threads (default: CPU count, up to 8)"
     )
     
     # Restore options
@@ -111,6 +129,14 @@ Examples:
         help="Overwrite existing files during restore"
     )
     
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        metavar="PATH",
+        help="Restore only this file, relative to the install dir (repeatable)"
+    )
+    
     # Cleanup options
     parser.add_argument(
         "--keep",
@@ -156,24 +182,28 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     if not backup_path.exists():
         return info
     
+    if backup_path.suffix == ".json":
+        return get_snapshot_info(backup_path)
+    
     try:
         # Get file stats
         stats = backup_path.stat()
         info["size"] = stats.st_size
         info["created"] = datetime.fromtimestamp(stats.st_mtime)
         
-        # Try to read metadata from backup
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
+        # The sidecar catalog describes the archive without decompressing it
+        catalog = BackupService(backup_path.parent).load_catalog(backup_path)
+        if catalog is not None:
+            info["metadata"] = catalog.get("metadata", {})
+            info["files"] = len(catalog["files"])
+            info["catalog"] = catalog
+            return info
         
-        with tarfile.open(backup_path, mode) as tar:
+        # Try to read metadata from backup
+        with BackupService(backup_path.parent).open_archive(backup_path) as tar:
             # Look for metadata file
             try:
-                metadata_member = tar.getmember("backup_metadata.json")
+                metadata_member = tar.getmember(METADATA_ARCNAME)
                 metadata_file = tar.extractfile(metadata_member)
                 if metadata_file:
                     info["metadata"] = json.loads(metadata_file.read().decode())
@@ -189,6 +219,45 @@ def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     return info
 
 
+def get_snapshot_info(manifest_path: Path) -> Dict[str, Any]:
+    """Get information about a snapshot from its manifest"""
+    info = {
+        "path": manifest_path,
+        "exists": manifest_path.exists(),
+        "type": "snapshot",
+        "size": 0,
+        "created": None,
+        "metadata": {}
+    }
+    
+    manifest = BackupStore.for_snapshot(manifest_path).load_snapshot(manifest_path)
+    if manifest is None:
+        info["error"] = f"Unreadable snapshot manifest: {manifest_path.name}"
+        return info
+    
+    info["size"] = sum(record.get("size", 0) for record in manifest["files"].values())
+    info["created"] = datetime.fromisoformat(manifest["created"])
+    info["metadata"] = manifest.get("metadata", {})
+    info["files"] = len(manifest["files"])
+    info["manifest"] = manifest
+    return info
+
+
+def resolve_backup_path(backup_dir: Path, name: str) -> Path:
+    """Resolve a backup argument to an archive file or a snapshot manifest"""
+    backup_path = Path(name)
+    if backup_path.is_absolute():
+        return backup_path
+    
+    archive_path = backup_dir / backup_path
+    if archive_path.exists():
+        return archive_path
+    
+    snapshot_name = backup_path.stem if backup_path.suffix == ".json" else backup_path.name
+    snapshot_path = BackupStore(backup_dir).get_snapshot_path(snapshot_name)
+    return snapshot_path if snapshot_path.exists() else archive_path
+
+
 def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     """List all available backups"""
     backups = []
@@ -198,10 +267,14 @@ def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
     
     # Find all backup files
     for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
+        if backup_file.is_file() and not backup_file.name.endswith(CATALOG_SUFFIX):
             info = get_backup_info(backup_file)
             backups.append(info)
     
+    # Snapshots are listed from their manifests
+    for manifest in BackupStore(backup_dir).list_snapshots():
+        backups.append(get_snapshot_info(manifest["path"]))
+    
     # Sort by creation date (newest first)
     backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
     
@@ -281,54 +354,29 @@ def create_backup(args: argparse.Namespace) -> bool:
         else:
             backup_name = f"superclaude_backup_{timestamp}"
         
+        if args.format == "snapshot":
+            return create_snapshot(args, backup_dir, backup_name)
+        
         # Determine compression
-        if args.compress == "gzip":
-            backup_file = backup_dir / f"{backup_name}.tar.gz"
-            mode = "w:gz"
-        elif args.compress == "bzip2":
-            backup_file = backup_dir / f"{backup_name}.tar.bz2"
-            mode = "w:bz2"
-        else:
-            backup_file = backup_dir / f"{backup_name}.tar"
-            mode = "w"
+        if args.compress == "zstd" and not ZSTD_AVAILABLE:
+            logger.error("zstd compression requires the 'zstandard' package (pip install zstandard)")
+            return False
+        backup_file = backup_dir / f"{backup_name}{BackupService.get_archive_extension(args.compress)}"
         
         logger.info(f"Creating backup: {backup_file}")
         
         # Create metadata
         metadata = create_backup_metadata(args.install_dir)
         
-        # Create backup
+        # Stream installation directory contents (excluding backups and local dirs)
         start_time = time.time()
-        
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
-            
-            # Add installation directory contents (excluding backups and local dirs)
-            files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
-                        
-                        # Skip files in excluded directories
-                        if rel_path.parts and rel_path.parts[0] in ["backups", "local"]:
-                            continue
-                            
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
-                        
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+        stats = BackupService(args.install_dir).create_archive(
+            backup_file,
+            compression=args.compress,
+            metadata=metadata,
+            workers=args.workers
+        )
+        files_added = stats["files"]
         
         duration = time.time() - start_time
         file_size = backup_file.stat().st_size
@@ -337,6 +385,7 @@ def create_backup(args: argparse.Namespace) -> bool:
         logger.info(f"Backup file: {backup_file}")
         logger.info(f"Files archived: {files_added}")
         logger.info(f"Backup size: {format_size(file_size)}")
+        logger.info(f"Throughput: {stats['throughput']:.1f} MB/s")
         
         return True
         
@@ -345,6 +394,24 @@ def create_backup(args: argparse.Namespace) -> bool:
         return False
 
 
+def create_snapshot(args: argparse.Namespace, backup_dir: Path, backup_name: str) -> bool:
+    """Create a new deduplicated snapshot in the backup store"""
+    logger = get_logger()
+    
+    store = BackupStore(backup_dir)
+    logger.info(f"Creating snapshot: {backup_name}")
+    
+    metadata = create_backup_metadata(args.install_dir)
+    stats = store.create_snapshot(args.install_dir, backup_name, metadata=metadata, workers=args.workers)
+    
+    logger.success(f"Snapshot created successfully in {stats['duration']:.1f} seconds")
+    logger.info(f"Snapshot manifest: {store.get_snapshot_path(backup_name)}")
+    logger.info(f"Files: {stats['files']} ({stats['new_objects']} new objects, {format_size(stats['new_bytes'])} written)")
+    logger.info(f"Throughput: {stats['throughput']:.1f} MB/s")
+    
+    return True
+
+
 def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
     """Restore from a backup file"""
     logger = get_logger()
@@ -362,46 +429,19 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
         
         logger.info(f"Restoring from backup: {backup_path}")
         
-        # Determine compression
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
-        
-        # Create backup of current installation if it exists
-        if check_installation_exists(args.install_dir) and not args.dry_run:
-            logger.info("Creating backup of current installation before restore")
-            # This would call create_backup internally
-        
-        # Extract backup
+        # Files about to be replaced are hardlinked into backups/.pre_restore
+        # first, put back if any file fails to restore and kept until the next restore
         start_time = time.time()
-        files_restored = 0
         
-        with tarfile.open(backup_path, mode) as tar:
-            # Extract all files except metadata
-            for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
-                    continue
-                
-                try:
-                    target_path = args.install_dir / member.name
-                    
-                    # Check if file exists and overwrite flag
-                    if target_path.exists() and not args.overwrite:
-                        logger.warning(f"Skipping existing file: {target_path}")
-                        continue
-                    
-                    # Extract file
-                    tar.extract(member, args.install_dir)
-                    files_restored += 1
-                    
-                    if files_restored % 10 == 0:
-                        logger.debug(f"Restored {files_restored} files")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not restore {member.name}: {e}")
+        if info.get("type") == "snapshot":
+            store = BackupStore.for_snapshot(backup_path)
+            files_restored = store.restore_snapshot(info["manifest"], args.install_dir,
+                                                    overwrite=args.overwrite, paths=args.paths,
+                                                    workers=args.workers)
+        else:
+            files_restored = BackupService(args.install_dir).restore_archive(
+                backup_path, overwrite=args.overwrite, paths=args.paths, workers=args.workers
+            )
         
         duration = time.time() - start_time
         
@@ -410,6 +450,9 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
         
         return True
         
+    except ValueError as e:
+        logger.error(f"Failed to restore backup: {e}")
+        return False
     except Exception as e:
         logger.exception(f"Failed to restore backup: {e}")
         return False
@@ -477,10 +520,16 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         for backup in to_remove:
             try:
                 backup["path"].unlink()
+                get_catalog_path(backup["path"]).unlink(missing_ok=True)
                 logger.info(f"Removed backup: {backup['path'].name}")
             except Exception as e:
                 logger.warning(f"Could not remove {backup['path'].name}: {e}")
         
+        # Free store objects no longer referenced by any snapshot
+        if any(backup.get("type") == "snapshot" for backup in to_remove):
+            removed, freed = BackupStore(backup_dir).prune()
+            logger.info(f"Pruned {removed} unreferenced objects ({format_size(freed)})")
+        
         return True
         
     except Exception as e:
@@ -539,17 +588,13 @@ def run(args: argparse.Namespace) -> int:
                     logger.info("Restore cancelled by user")
                     return 0
             else:
-                # Specific backup file
-                backup_path = Path(args.restore)
-                if not backup_path.is_absolute():
-                    backup_path = backup_dir / backup_path
+                # Specific backup file or snapshot name
+                backup_path = resolve_backup_path(backup_dir, args.restore)
             
             success = restore_backup(backup_path, args)
             
         elif args.info:
-            backup_path = Path(args.info)
-            if not backup_path.is_absolute():
-                backup_path = backup_dir / backup_path
+            backup_path = resolve_backup_path(backup_dir, args.info)
             
             info = get_backup_info(backup_path)
             if info["exists"]:
@@ -13,12 +13,14 @@ from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
 from ...services.config import ConfigService
 from ...core.validator import Validator
+from ...services.files import FileService
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size, prompt_api_key
+    display_warning, Menu, confirm, Colors, format_size, prompt_api_key
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
+from ...utils.progress import report_progress
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, DATA_DIR
 from . import OperationBase
 
@@ -77,6 +79,23 @@ Examples:
         help="Run system diagnostics and show installation help"
     )
     
+    parser.add_argument(
+        "--link-strategy",
+        choices=FileService.LINK_STRATEGIES,
+        default="copy",
+        help="How files are installed: copy (default), reflink (copy-on-write clone, "
+             "falls back to copy), hardlink or symlink (share the package files; edits "
+             "to installed files change the package and vice versa)"
+    )
+    
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Build changed files in a staging directory and switch them in only if "
+             "every component succeeds; replaced files are kept for 'update --rollback' "
+             "instead of taking a full backup"
+    )
+    
     return parser
 
 
@@ -449,34 +468,22 @@ def perform_installation(components: List[str], args: argparse.Namespace, config
         # Resolve dependencies
         ordered_components = registry.resolve_dependencies(components)
         
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(ordered_components),
-            prefix="Installing: ",
-            suffix=""
-        )
-        
         # Install components
         logger.info(f"Installing {len(ordered_components)} components...")
         
         config = {
             "force": args.force,
+            "incremental": not args.force,
+            "link_strategy": args.link_strategy,
+            "staged": args.staged,
             "backup": not args.no_backup,
             "dry_run": args.dry_run,
             "selected_mcp_servers": getattr(config_manager, '_installation_context', {}).get("selected_mcp_servers", [])
         }
         
-        success = installer.install_components(ordered_components, config)
-        
-        # Update progress
-        for i, component_name in enumerate(ordered_components):
-            if component_name in installer.installed_components:
-                progress.update(i + 1, f"Installed {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-        
-        progress.finish("Installation complete")
+        # Progress is reported from the installer's events while it runs
+        with report_progress(args.progress, "Installing: ", "Installation complete"):
+            success = installer.install_components(ordered_components, config)
         
         # Show results
         duration = time.time() - start_time
@@ -587,7 +594,7 @@ def run(args: argparse.Namespace) -> int:
         
         # Handle diagnostic mode
         if args.diagnose:
-            validator = Validator()
+            validator = Validator(args.install_dir, dry_run=args.dry_run)
             run_system_diagnostics(validator)
             return 0
         
@@ -598,7 +605,7 @@ def run(args: argparse.Namespace) -> int:
         registry.discover_components()
         
         config_manager = ConfigService(DATA_DIR)
-        validator = Validator()
+        validator = Validator(args.install_dir, dry_run=args.dry_run)
         
         # Validate configuration
         config_errors = config_manager.validate_config_files()
@@ -6,117 +6,27 @@ Refactored from uninstall.py for unified CLI hub
 import sys
 import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
+from ...core.base import Component
 from ...core.registry import ComponentRegistry
+from ...core.removal import UninstallPlan
 from ...services.settings import SettingsService
 from ...services.files import FileService
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors
+    display_warning, Menu, confirm, Colors, format_size
 )
 from ...utils.environment import get_superclaude_environment_variables, cleanup_environment_variables
+from ...utils import events
 from ...utils.logger import get_logger
+from ...utils.progress import report_progress
+from ...utils.tracing import span
 from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
 
-def verify_superclaude_file(file_path: Path, component: str) -> bool:
-    """
-    Verify this is a SuperClaude file before removal
-    
-    Args:
-        file_path: Path to the file to verify
-        component: Component name this file belongs to
-        
-    Returns:
-        True if safe to remove, False if uncertain (preserve by default)
-    """
-    try:
-        # Known SuperClaude file patterns by component
-        superclaude_patterns = {
-            'core': [
-                'CLAUDE.md', 'FLAGS.md', 'PRINCIPLES.md', 'RULES.md', 
-                'ORCHESTRATOR.md', 'SESSION_LIFECYCLE.md'
-            ],
-            'commands': [
-                # Commands are only in sc/ subdirectory
-            ],
-            'agents': [
-                'backend-engineer.md', 'brainstorm-PRD.md', 'code-educator.md',
-                'code-refactorer.md', 'devops-engineer.md', 'frontend-specialist.md',
-                'performance-optimizer.md', 'python-ultimate-expert.md', 'qa-specialist.md',
-                'root-cause-analyzer.md', 'security-auditor.md', 'system-architect.md',
-                'technical-writer.md'
-            ],
-            'modes': [
-                'MODE_Brainstorming.md', 'MODE_Introspection.md', 
-                'MODE_Task_Management.md', 'MODE_Token_Efficiency.md'
-            ],
-            'mcp_docs': [
-                'MCP_Context7.md', 'MCP_Sequential.md', 'MCP_Magic.md',
-                'MCP_Playwright.md', 'MCP_Morphllm.md', 'MCP_Serena.md'
-            ]
-        }
-        
-        # For commands component, verify it's in the sc/ subdirectory
-        if component == 'commands':
-            return 'commands/sc/' in str(file_path)
-        
-        # For other components, check against known file lists
-        if component in superclaude_patterns:
-            filename = file_path.name
-            return filename in superclaude_patterns[component]
-        
-        # For MCP component, it doesn't remove files but modifies .claude.json
-        if component == 'mcp':
-            return True  # MCP component has its own safety logic
-        
-        # Default to preserve if uncertain
-        return False
-        
-    except Exception:
-        # If any error occurs in verification, preserve the file
-        return False
-
-
-def verify_directory_safety(directory: Path, component: str) -> bool:
-    """
-    Verify it's safe to remove a directory
-    
-    Args:
-        directory: Directory path to verify
-        component: Component name
-        
-    Returns:
-        True if safe to remove (only if empty or only contains SuperClaude files)
-    """
-    try:
-        if not directory.exists():
-            return True
-        
-        # Check if directory is empty
-        contents = list(directory.iterdir())
-        if not contents:
-            return True
-        
-        # Check if all contents are SuperClaude files for this component
-        for item in contents:
-            if item.is_file():
-                if not verify_superclaude_file(item, component):
-                    return False
-            elif item.is_dir():
-                # Don't remove directories that contain non-SuperClaude subdirectories
-                return False
-        
-        return True
-        
-    except Exception:
-        # If any error occurs, preserve the directory
-        return False
-
-
 class UninstallOperation(OperationBase):
     """Uninstall operation implementation"""
     
@@ -278,7 +188,6 @@ def display_uninstall_info(info: Dict[str, Any]) -> None:
     print(f"{Colors.BLUE}Directories:{Colors.RESET} {len(info['directories'])}")
     
     if info["total_size"] > 0:
-        from ...utils.ui import format_size
         print(f"{Colors.BLUE}Total Size:{Colors.RESET} {format_size(info['total_size'])}")
     
     print()
@@ -530,7 +439,27 @@ def display_component_details(component: str, info: Dict[str, Any]) -> Dict[str,
     return details
 
 
-def display_uninstall_plan(components: List[str], args: argparse.Namespace, info: Dict[str, Any], env_vars: Dict[str, str]) -> None:
+def create_uninstall_plan(components: List[str], install_dir: Path) -> Tuple[Dict[str, Component], UninstallPlan]:
+    """
+    Create component instances and work out the files to remove for all of them
+    
+    Args:
+        components: Component names to uninstall
+        install_dir: Installation directory
+        
+    Returns:
+        Tuple of (component instances by name, uninstall plan)
+    """
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+    registry.discover_components()
+    
+    component_instances = registry.create_component_instances(components, install_dir)
+    plan = UninstallPlan.build(install_dir, component_instances)
+    return component_instances, plan
+
+
+def display_uninstall_plan(components: List[str], args: argparse.Namespace, info: Dict[str, Any], env_vars: Dict[str, str],
+                           plan: Optional[UninstallPlan] = None) -> None:
     """Display detailed uninstall plan"""
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}Uninstall Plan{Colors.RESET}")
     print("=" * 60)
@@ -552,13 +481,20 @@ def display_uninstall_plan(components: List[str], args: argparse.Namespace, info
                 version_str = str(version)
                 file_count = details.get('file_count', '?')
             
+            if plan is not None and component_name in plan.components:
+                # Files actually present, rather than the count recorded at install time
+                file_count = len(plan.get_files(component_name))
+            
             print(f"  {i}. {component_name} (v{version_str}) - {file_count} files")
             print(f"     {details['description']}")
             
             if isinstance(file_count, int):
                 total_files += file_count
         
-        print(f"\n{Colors.YELLOW}Total estimated files to remove: {total_files}{Colors.RESET}")
+        if plan is not None:
+            print(f"\n{Colors.YELLOW}Total files to remove: {len(plan)} ({format_size(plan.total_size)}){Colors.RESET}")
+        else:
+            print(f"\n{Colors.YELLOW}Total estimated files to remove: {total_files}{Colors.RESET}")
     
     # Show detailed preservation information
     print(f"\n{Colors.GREEN}{Colors.BRIGHT}Safety Guarantees - Will Preserve:{Colors.RESET}")
@@ -632,55 +568,68 @@ def create_uninstall_backup(install_dir: Path, components: List[str]) -> Optiona
         return None
 
 
-def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dict[str, Any], env_vars: Dict[str, str]) -> bool:
-    """Perform the actual uninstall"""
+def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dict[str, Any], env_vars: Dict[str, str],
+                      component_instances: Optional[Dict[str, Component]] = None,
+                      plan: Optional[UninstallPlan] = None) -> bool:
+    """
+    Perform the actual uninstall
+    
+    The files of all components are removed in one batch from the uninstall
+    plan; each component's uninstall() then only unregisters it.
+    """
     logger = get_logger()
     start_time = time.time()
     
     try:
-        # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
-        
-        # Create component instances
-        component_instances = registry.create_component_instances(components, args.install_dir)
+        if component_instances is None or plan is None:
+            component_instances, plan = create_uninstall_plan(components, args.install_dir)
         
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(components),
-            prefix="Uninstalling: ",
-            suffix=""
-        )
-        
-        # Uninstall components
-        logger.info(f"Uninstalling {len(components)} components...")
+        if args.dry_run:
+            removed_count = plan.execute(dry_run=True)
+            logger.info(f"[DRY RUN] Would uninstall {', '.join(components)} ({removed_count} files)")
+            return True
         
         uninstalled_components = []
         failed_components = []
         
-        for i, component_name in enumerate(components):
-            progress.update(i, f"Uninstalling {component_name}")
+        with report_progress(args.progress, "Uninstalling: ", "Uninstall complete"):
+            events.emit(events.PLAN, components=len(components), files=len(plan), bytes=plan.total_size)
             
-            try:
-                if component_name in component_instances:
-                    instance = component_instances[component_name]
-                    if instance.uninstall():
-                        uninstalled_components.append(component_name)
-                        logger.debug(f"Successfully uninstalled {component_name}")
-                    else:
+            # Remove the files of all selected components in one pass
+            events.emit(events.PHASE, phase="remove")
+            removed_count = plan.execute()
+            logger.info(f"Removed {removed_count} files ({format_size(plan.total_size)})")
+            
+            # Uninstall components
+            logger.info(f"Uninstalling {len(components)} components...")
+            events.emit(events.PHASE, phase="unregister")
+            
+            # Collect all metadata changes of this run into a single atomic write
+            with span("unregister components", "uninstall"), \
+                    SettingsService(args.install_dir).metadata_transaction():
+                for component_name in components:
+                    events.emit(events.COMPONENT_START, component=component_name)
+                    success = False
+                    
+                    try:
+                        if component_name in component_instances:
+                            instance = component_instances[component_name]
+                            if instance.uninstall(plan):
+                                uninstalled_components.append(component_name)
+                                success = True
+                                logger.debug(f"Successfully uninstalled {component_name}")
+                            else:
+                                failed_components.append(component_name)
+                                logger.error(f"Failed to uninstall {component_name}")
+                        else:
+                            success = True
+                            logger.warning(f"Component {component_name} not found, skipping")
+                        
+                    except Exception as e:
+                        logger.error(f"Error uninstalling {component_name}: {e}")
                         failed_components.append(component_name)
-                        logger.error(f"Failed to uninstall {component_name}")
-                else:
-                    logger.warning(f"Component {component_name} not found, skipping")
                     
-            except Exception as e:
-                logger.error(f"Error uninstalling {component_name}: {e}")
-                failed_components.append(component_name)
-            
-            progress.update(i + 1, f"Processed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-        
-        progress.finish("Uninstall complete")
+                    events.emit(events.COMPONENT_DONE, component=component_name, success=success)
         
         # Handle complete uninstall cleanup
         if args.complete:
@@ -837,9 +786,12 @@ def run(args: argparse.Namespace) -> int:
             args.cleanup_env = cleanup_options.get('cleanup_env_vars', False)
             args.no_restore_script = not cleanup_options.get('create_restore_script', True)
         
+        # Work out the files to remove across all selected components
+        component_instances, plan = create_uninstall_plan(components, args.install_dir)
+        
         # Display uninstall plan
         if not args.quiet:
-            display_uninstall_plan(components, args, info, env_vars)
+            display_uninstall_plan(components, args, info, env_vars, plan)
         
         # Confirmation
         if not args.no_confirm and not args.yes:
@@ -857,7 +809,7 @@ def run(args: argparse.Namespace) -> int:
             create_uninstall_backup(args.install_dir, components)
         
         # Perform uninstall
-        success = perform_uninstall(components, args, info, env_vars)
+        success = perform_uninstall(components, args, info, env_vars, component_instances, plan)
         
         if success:
             if not args.quiet:
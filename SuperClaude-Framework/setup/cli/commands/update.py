@@ -13,13 +13,15 @@ from ...core.installer import Installer
 from ...core.registry import ComponentRegistry
 from ...services.settings import SettingsService
 from ...core.validator import Validator
+from ...services.files import FileService
 from ...utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size, prompt_api_key
+    display_warning, Menu, confirm, Colors, format_size, prompt_api_key
 )
 from ...utils.environment import setup_environment_variables
 from ...utils.logger import get_logger
-from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT
+from ...utils.progress import report_progress
+from ... import DEFAULT_INSTALL_DIR, PROJECT_ROOT, __version__
 from . import OperationBase
 
 
@@ -83,6 +85,29 @@ Examples:
         help="Reinstall components even if versions match"
     )
     
+    parser.add_argument(
+        "--link-strategy",
+        choices=FileService.LINK_STRATEGIES,
+        default="copy",
+        help="How files are installed: copy (default), reflink (copy-on-write clone, "
+             "falls back to copy), hardlink or symlink (share the package files; edits "
+             "to installed files change the package and vice versa)"
+    )
+    
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="Build changed files in a staging directory and switch them in only if "
+             "every component succeeds; replaced files are kept for --rollback "
+             "instead of taking a full backup"
+    )
+    
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Switch back to the files replaced by the last staged install or update"
+    )
+    
     return parser
 
 def check_installation_exists(install_dir: Path) -> bool:
@@ -318,13 +343,6 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         # Register components with installer
         installer.register_components(list(component_instances.values()))
         
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(components),
-            prefix="Updating: ",
-            suffix=""
-        )
-        
         # Update components
         logger.info(f"Updating {len(components)} components...")
         
@@ -333,23 +351,18 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         
         config = {
             "force": args.force,
+            "incremental": not (args.force or args.reinstall),
+            "link_strategy": args.link_strategy,
+            "staged": args.staged,
             "backup": backup,
             "dry_run": args.dry_run,
             "update_mode": True,
             "selected_mcp_servers": list(mcp_instance.mcp_servers.keys()) if "mcp" in component_instances else []
         }
         
-        success = installer.update_components(components, config)
-        
-        # Update progress
-        for i, component_name in enumerate(components):
-            if component_name in installer.updated_components:
-                progress.update(i + 1, f"Updated {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-        
-        progress.finish("Update complete")
+        # Progress is reported from the installer's events while it runs
+        with report_progress(args.progress, "Updating: ", "Update complete"):
+            success = installer.update_components(components, config)
         
         # Show results
         duration = time.time() - start_time
@@ -409,6 +422,15 @@ def run(args: argparse.Namespace) -> int:
                 "Updating SuperClaude framework components"
             )
         
+        # Switch back to the files replaced by the last staged update
+        if args.rollback:
+            installer = Installer(args.install_dir, dry_run=args.dry_run)
+            if not installer.rollback_staged():
+                return 1
+            if not args.quiet:
+                display_success("Rolled back to the previous version")
+            return 0
+        
         # Check if SuperClaude is installed
         if not check_installation_exists(args.install_dir):
             logger.error(f"SuperClaude installation not found in {args.install_dir}")
@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..core.base import Component
+from ..core.removal import UninstallPlan
 from setup import __version__
 
 
@@ -77,28 +78,13 @@ class AgentsComponent(Component):
             self.logger.error(f"Failed to complete agents post-install: {e}")
             return False
     
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """Uninstall agents component"""
         try:
             self.logger.info("Uninstalling SuperClaude agents component...")
             
-            # Remove agent files
-            removed_count = 0
-            for filename in self.component_files:
-                file_path = self.install_component_subdir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed agent: {filename}")
-                else:
-                    self.logger.warning(f"Could not remove agent: {filename}")
-            
-            # Remove agents directory if empty
-            try:
-                if self.install_component_subdir.exists() and not any(self.install_component_subdir.iterdir()):
-                    self.install_component_subdir.rmdir()
-                    self.logger.debug("Removed empty agents directory")
-            except Exception as e:
-                self.logger.warning(f"Could not remove agents directory: {e}")
+            # Remove agent files; the agents directory is pruned if left empty
+            removed_count = self._remove_files(plan)
             
             # Update metadata to remove agents component
             try:
@@ -134,32 +120,14 @@ class AgentsComponent(Component):
             
             self.logger.info(f"Updating agents component from {current_version} to {target_version}")
             
-            # Create backup of existing agents
-            backup_files = []
-            for filename in self.component_files:
-                file_path = self.install_component_subdir / filename
-                if file_path.exists():
-                    backup_path = self.file_manager.backup_file(file_path)
-                    if backup_path:
-                        backup_files.append(backup_path)
-                        self.logger.debug(f"Backed up agent: {filename}")
+            # Within a staged installer run (config["staging"]) the files are staged too
+            success = self.install(config)
             
-            # Perform installation (will overwrite existing files)
-            if self._install(config):
+            if success:
                 self.logger.success(f"Agents component updated to version {target_version}")
-                return True
-            else:
-                # Restore backups on failure
-                self.logger.error("Agents update failed, restoring backups...")
-                for backup_path in backup_files:
-                    try:
-                        original_path = self.install_component_subdir / backup_path.name.replace('.backup', '')
-                        self.file_manager.copy_file(backup_path, original_path)
-                        self.logger.debug(f"Restored {original_path.name}")
-                    except Exception as e:
-                        self.logger.warning(f"Could not restore {backup_path}: {e}")
-                return False
-                
+            
+            return success
+            
         except Exception as e:
             self.logger.exception(f"Unexpected error during agents update: {e}")
             return False
@@ -173,13 +141,7 @@ class AgentsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Add overhead for directories and metadata
         total_size += 5120  # ~5KB overhead
@@ -209,10 +171,9 @@ class AgentsComponent(Component):
         
         # Check if all agent files exist
         missing_agents = []
-        for filename in self.component_files:
-            agent_path = self.install_component_subdir / filename
-            if not agent_path.exists():
-                missing_agents.append(filename)
+        for planned in self.get_install_plan():
+            if not planned.target.exists():
+                missing_agents.append(planned.target.name)
         
         if missing_agents:
             errors.append(f"Missing agent files: {missing_agents}")
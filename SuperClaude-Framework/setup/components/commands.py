@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..core.base import Component
+from ..core.removal import UninstallPlan
 from setup import __version__
 
 class CommandsComponent(Component):
@@ -70,58 +71,13 @@ class CommandsComponent(Component):
 
         return True
     
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """Uninstall commands component"""
         try:
             self.logger.info("Uninstalling SuperClaude commands component...")
             
-            # Remove command files from sc subdirectory
-            commands_dir = self.install_dir / "commands" / "sc"
-            removed_count = 0
-            
-            for filename in self.component_files:
-                file_path = commands_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
-                else:
-                    self.logger.warning(f"Could not remove {filename}")
-            
-            # Also check and remove any old commands in root commands directory
-            old_commands_dir = self.install_dir / "commands"
-            old_removed_count = 0
-            
-            for filename in self.component_files:
-                old_file_path = old_commands_dir / filename
-                if old_file_path.exists() and old_file_path.is_file():
-                    if self.file_manager.remove_file(old_file_path):
-                        old_removed_count += 1
-                        self.logger.debug(f"Removed old {filename}")
-                    else:
-                        self.logger.warning(f"Could not remove old {filename}")
-            
-            if old_removed_count > 0:
-                self.logger.info(f"Also removed {old_removed_count} commands from old location")
-            
-            removed_count += old_removed_count
-            
-            # Remove sc subdirectory if empty
-            try:
-                if commands_dir.exists():
-                    remaining_files = list(commands_dir.iterdir())
-                    if not remaining_files:
-                        commands_dir.rmdir()
-                        self.logger.debug("Removed empty sc commands directory")
-                        
-                        # Also remove parent commands directory if empty
-                        parent_commands_dir = self.install_dir / "commands"
-                        if parent_commands_dir.exists():
-                            remaining_files = list(parent_commands_dir.iterdir())
-                            if not remaining_files:
-                                parent_commands_dir.rmdir()
-                                self.logger.debug("Removed empty parent commands directory")
-            except Exception as e:
-                self.logger.warning(f"Could not remove commands directory: {e}")
+            # Remove command files (sc/ and the old root location); empty directories are pruned
+            removed_count = self._remove_files(plan)
             
             # Update metadata to remove commands component
             try:
@@ -143,6 +99,11 @@ class CommandsComponent(Component):
             self.logger.exception(f"Unexpected error during commands uninstallation: {e}")
             return False
     
+    def get_uninstall_targets(self) -> List[Path]:
+        """Get command files, including copies left in the old commands/ location"""
+        old_commands_dir = self.install_dir / "commands"
+        return super().get_uninstall_targets() + [old_commands_dir / filename for filename in self.component_files]
+    
     def get_dependencies(self) -> List[str]:
         """Get dependencies"""
         return ["core"]
@@ -162,41 +123,11 @@ class CommandsComponent(Component):
             
             self.logger.info(f"Updating commands component from {current_version} to {target_version}")
             
-            # Create backup of existing command files
-            commands_dir = self.install_dir / "commands" / "sc"
-            backup_files = []
-            
-            if commands_dir.exists():
-                for filename in self.component_files:
-                    file_path = commands_dir / filename
-                    if file_path.exists():
-                        backup_path = self.file_manager.backup_file(file_path)
-                        if backup_path:
-                            backup_files.append(backup_path)
-                            self.logger.debug(f"Backed up {filename}")
-            
-            # Perform installation (overwrites existing files)
+            # Within a staged installer run (config["staging"]) the files are staged too
             success = self.install(config)
             
             if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
                 self.logger.success(f"Commands component updated to version {target_version}")
-            else:
-                # Restore from backup on failure
-                self.logger.warning("Update failed, restoring from backup...")
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        backup_path.rename(original_path)
-                        self.logger.debug(f"Restored {original_path.name}")
-                    except Exception as e:
-                        self.logger.error(f"Could not restore {backup_path}: {e}")
             
             return success
             
@@ -215,12 +146,13 @@ class CommandsComponent(Component):
             return False, errors
         
         # Check if all command files exist
-        for filename in self.component_files:
-            file_path = commands_dir / filename
-            if not file_path.exists():
-                errors.append(f"Missing command file: {filename}")
-            elif not file_path.is_file():
-                errors.append(f"Command file is not a regular file: {filename}")
+        for planned in self.get_install_plan():
+            file_path = planned.target
+            if not file_path.is_file():
+                if file_path.exists():
+                    errors.append(f"Command file is not a regular file: {file_path.name}")
+                else:
+                    errors.append(f"Missing command file: {file_path.name}")
         
         # Check metadata registration
         if not self.settings_manager.is_component_installed("commands"):
@@ -243,13 +175,7 @@ class CommandsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Add overhead for directory and settings
         total_size += 5120  # ~5KB overhead
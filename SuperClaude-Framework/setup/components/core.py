@@ -4,9 +4,9 @@ Core component for SuperClaude framework files installation
 
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
-import shutil
 
 from ..core.base import Component
+from ..core.removal import UninstallPlan
 from ..services.claude_md import CLAUDEMdService
 from setup import __version__
 
@@ -92,20 +92,13 @@ class CoreComponent(Component):
         return True
 
     
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """Uninstall core component"""
         try:
             self.logger.info("Uninstalling SuperClaude core component...")
             
             # Remove framework files
-            removed_count = 0
-            for filename in self.component_files:
-                file_path = self.install_dir / filename
-                if self.file_manager.remove_file(file_path):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
-                else:
-                    self.logger.warning(f"Could not remove {filename}")
+            removed_count = self._remove_files(plan)
             
             # Update metadata to remove core component
             try:
@@ -148,38 +141,11 @@ class CoreComponent(Component):
             
             self.logger.info(f"Updating core component from {current_version} to {target_version}")
             
-            # Create backup of existing files
-            backup_files = []
-            for filename in self.component_files:
-                file_path = self.install_dir / filename
-                if file_path.exists():
-                    backup_path = self.file_manager.backup_file(file_path)
-                    if backup_path:
-                        backup_files.append(backup_path)
-                        self.logger.debug(f"Backed up {filename}")
-            
-            # Perform installation (overwrites existing files)
+            # Within a staged installer run (config["staging"]) the files are staged too
             success = self.install(config)
             
             if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
                 self.logger.success(f"Core component updated to version {target_version}")
-            else:
-                # Restore from backup on failure
-                self.logger.warning("Update failed, restoring from backup...")
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        shutil.move(str(backup_path), str(original_path))
-                        self.logger.debug(f"Restored {original_path.name}")
-                    except Exception as e:
-                        self.logger.error(f"Could not restore {backup_path}: {e}")
             
             return success
             
@@ -192,12 +158,13 @@ class CoreComponent(Component):
         errors = []
         
         # Check if all framework files exist
-        for filename in self.component_files:
-            file_path = self.install_dir / filename
-            if not file_path.exists():
-                errors.append(f"Missing framework file: {filename}")
-            elif not file_path.is_file():
-                errors.append(f"Framework file is not a regular file: {filename}")
+        for planned in self.get_install_plan():
+            file_path = planned.target
+            if not file_path.is_file():
+                if file_path.exists():
+                    errors.append(f"Framework file is not a regular file: {file_path.name}")
+                else:
+                    errors.append(f"Missing framework file: {file_path.name}")
         
         # Check metadata registration
         if not self.settings_manager.is_component_installed("core"):
@@ -233,13 +200,7 @@ class CoreComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Add overhead for settings.json and directories
         total_size += 10240  # ~10KB overhead
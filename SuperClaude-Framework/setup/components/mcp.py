@@ -2,25 +2,14 @@
 MCP component for MCP server configuration via .claude.json
 """
 
-import json
-import shutil
 import time
-import sys
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
-# Platform-specific file locking imports
-try:
-    if sys.platform == "win32":
-        import msvcrt
-        LOCKING_AVAILABLE = "windows"
-    else:
-        import fcntl
-        LOCKING_AVAILABLE = "unix"
-except ImportError:
-    LOCKING_AVAILABLE = None
-
 from ..core.base import Component
+from ..core.removal import UninstallPlan
+from ..services.claude_config import ClaudeConfigService
+from ..services.mcp_templates import MCPTemplateRegistry, get_mcp_templates
 from setup import __version__
 from ..utils.ui import display_info, display_warning
 
@@ -80,25 +69,6 @@ class MCPComponent(Component):
         # Store collected API keys for configuration
         self.collected_api_keys: Dict[str, str] = {}
     
-    def _lock_file(self, file_handle, exclusive: bool = False):
-        """Cross-platform file locking"""
-        if LOCKING_AVAILABLE == "unix":
-            lock_type = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
-            fcntl.flock(file_handle.fileno(), lock_type)
-        elif LOCKING_AVAILABLE == "windows":
-            # Windows locking using msvcrt
-            if exclusive:
-                msvcrt.locking(file_handle.fileno(), msvcrt.LK_LOCK, 1)
-        # If no locking available, continue without locking
-    
-    def _unlock_file(self, file_handle):
-        """Cross-platform file unlocking"""
-        if LOCKING_AVAILABLE == "unix":
-            fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
-        elif LOCKING_AVAILABLE == "windows":
-            msvcrt.locking(file_handle.fileno(), msvcrt.LK_UNLCK, 1)
-        # If no locking available, continue without unlocking
-    
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
         return {
@@ -151,47 +121,38 @@ class MCPComponent(Component):
         """Override parent method - MCP component doesn't use traditional file installation"""
         return self._get_config_source_dir()
     
-    def _load_claude_config(self) -> Tuple[Optional[Dict], Path]:
-        """Load user's Claude configuration with file locking"""
-        claude_config_path = Path.home() / ".claude.json"
+    def _get_templates(self) -> Optional[MCPTemplateRegistry]:
+        """Get the compiled MCP server templates (shared by all instances of a process)"""
+        config_source_dir = self._get_config_source_dir()
+        if not config_source_dir:
+            return None
         
         try:
-            with open(claude_config_path, 'r') as f:
-                # Apply shared lock for reading
-                self._lock_file(f, exclusive=False)
-                try:
-                    config = json.load(f)
-                    return config, claude_config_path
-                finally:
-                    self._unlock_file(f)
+            return get_mcp_templates(config_source_dir)
+        except OSError as e:
+            self.logger.error(f"Failed to load MCP templates: {e}")
+            return None
+    
+    def _load_mcp_servers(self) -> Optional[Dict]:
+        """Load the mcpServers section of the user's Claude configuration"""
+        try:
+            return ClaudeConfigService().read_key("mcpServers", {})
         except Exception as e:
             self.logger.error(f"Failed to load Claude config: {e}")
-            return None, claude_config_path
+            return None
     
-    def _save_claude_config(self, config: Dict, config_path: Path) -> bool:
-        """Save user's Claude configuration with backup and file locking"""
+    def _save_mcp_servers(self, servers: Dict) -> bool:
+        """Patch the mcpServers section of the user's Claude configuration in place"""
         max_retries = 3
         retry_delay = 0.1
         
         for attempt in range(max_retries):
             try:
-                # Create backup first
-                if config_path.exists():
-                    backup_path = config_path.with_suffix('.json.backup')
-                    shutil.copy2(config_path, backup_path)
-                    self.logger.debug(f"Created backup: {backup_path}")
-                
-                # Save updated config with exclusive lock
-                with open(config_path, 'w') as f:
-                    # Apply exclusive lock for writing
-                    self._lock_file(f, exclusive=True)
-                    try:
-                        json.dump(config, f, indent=2)
-                        f.flush()  # Ensure data is written
-                    finally:
-                        self._unlock_file(f)
-                
-                self.logger.debug("Updated Claude configuration")
+                # Only the mcpServers value is rewritten, the rest of the file is kept verbatim
+                if ClaudeConfigService().patch_key("mcpServers", servers):
+                    self.logger.debug("Updated Claude configuration")
+                else:
+                    self.logger.debug("Claude configuration already up to date")
                 return True
                 
             except (OSError, IOError) as e:
@@ -254,21 +215,15 @@ class MCPComponent(Component):
         if server_key not in self.mcp_servers:
             return None
         
-        server_info = self.mcp_servers[server_key]
-        config_file = server_info["config_file"]
-        config_source_dir = self._get_config_source_dir()
-        
-        if not config_source_dir:
+        templates = self._get_templates()
+        if templates is None:
             return None
         
-        config_path = config_source_dir / config_file
-        
-        try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Failed to load MCP config for {server_key}: {e}")
-            return None
+        config_file = self.mcp_servers[server_key]["config_file"]
+        server_config = templates.get_template(config_file)
+        if server_config is None:
+            self.logger.error(f"Failed to load MCP config for {server_key}: no valid template {config_file}")
+        return server_config
     
     def _install(self, config: Dict[str, Any]) -> bool:
         """Install MCP component by configuring .claude.json"""
@@ -293,15 +248,11 @@ class MCPComponent(Component):
                 self.logger.error(error)
             return False
         
-        # Load Claude configuration
-        claude_config, config_path = self._load_claude_config()
-        if claude_config is None:
+        # Load the mcpServers section of the Claude configuration
+        mcp_servers = self._load_mcp_servers()
+        if mcp_servers is None:
             return False
         
-        # Ensure mcpServers section exists
-        if "mcpServers" not in claude_config:
-            claude_config["mcpServers"] = {}
-        
         # Configure each selected server
         configured_count = 0
         for server_key in selected_servers:
@@ -324,7 +275,7 @@ class MCPComponent(Component):
                     display_info("You can set this environment variable later")
             
             # Precisely merge server config, preserving user customizations
-            self._merge_mcp_server_config(claude_config["mcpServers"], server_config, server_key)
+            self._merge_mcp_server_config(mcp_servers, server_config, server_key)
             configured_count += 1
             
             self.logger.info(f"Configured MCP server: {server_info['name']}")
@@ -334,7 +285,7 @@ class MCPComponent(Component):
             return False
         
         # Save updated configuration
-        success = self._save_claude_config(claude_config, config_path)
+        success = self._save_mcp_servers(mcp_servers)
         
         if success:
             self.logger.success(f"Successfully configured {configured_count} MCP servers")
@@ -364,18 +315,18 @@ class MCPComponent(Component):
             self.logger.error(f"Failed to update metadata: {e}")
             return False
     
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """Uninstall MCP component by removing servers from .claude.json"""
         try:
             self.logger.info("Removing MCP server configurations...")
             
             # Load Claude configuration
-            claude_config, config_path = self._load_claude_config()
-            if claude_config is None:
+            mcp_servers = self._load_mcp_servers()
+            if mcp_servers is None:
                 self.logger.warning("Could not load Claude config for cleanup")
                 return True  # Not a failure if config doesn't exist
             
-            if "mcpServers" not in claude_config:
+            if not mcp_servers:
                 self.logger.info("No MCP servers configured")
                 return True
             
@@ -383,11 +334,24 @@ class MCPComponent(Component):
             removed_count = 0
             installed_servers = self._get_installed_servers()
             
-            for server_name in installed_servers:
-                if server_name in claude_config["mcpServers"]:
+            templates = self._get_templates()
+            if templates is None and installed_servers:
+                # Without the templates, SuperClaude's servers cannot be told apart from the user's
+                self.logger.warning(
+                    f"MCP server templates not found, leaving MCP servers in place: {', '.join(installed_servers)}"
+                )
+            server_names = []
+            for server_key in installed_servers:
+                # Metadata records server keys; mcpServers uses the names defined in the templates
+                config_file = self.mcp_servers.get(server_key, {}).get("config_file", f"{server_key}.json")
+                if templates is not None:
+                    server_names.extend(templates.get_server_names(config_file))
+            
+            for server_name in server_names:
+                if server_name in mcp_servers:
                     # Check if this server was installed by SuperClaude by comparing with our configs
-                    if self._is_superclaude_managed_server(claude_config["mcpServers"][server_name], server_name):
-                        del claude_config["mcpServers"][server_name]
+                    if self._is_superclaude_managed_server(mcp_servers[server_name], server_name):
+                        del mcp_servers[server_name]
                         removed_count += 1
                         self.logger.debug(f"Removed SuperClaude-managed MCP server: {server_name}")
                     else:
@@ -395,7 +359,7 @@ class MCPComponent(Component):
             
             # Save updated configuration
             if removed_count > 0:
-                success = self._save_claude_config(claude_config, config_path)
+                success = self._save_mcp_servers(mcp_servers)
                 if not success:
                     self.logger.warning("Failed to save updated Claude configuration")
             
@@ -432,37 +396,13 @@ class MCPComponent(Component):
         
         This helps determine if a server was installed by SuperClaude or manually
         configured by the user, allowing us to preserve user customizations.
+        A server counts as ours while its name and command match a template.
         """
-        # Find the server key that maps to this server name
-        server_key = None
-        for key, info in self.mcp_servers.items():
-            if info["name"] == server_name:
-                server_key = key
-                break
-        
-        if not server_key:
-            return False  # Unknown server, don't remove
-        
-        # Load our template config for comparison
-        template_config = self._load_mcp_server_config(server_key)
-        if not template_config or server_name not in template_config:
-            return False
-        
-        template_server = template_config[server_name]
-        
-        # Check if the current config has the same structure as our template
-        # If user has customized it, the structure might be different
-        required_keys = {"command", "args"}
-        
-        # Check if all required keys exist and match our template
-        for key in required_keys:
-            if key not in server_config or key not in template_server:
-                return False
-            # For command and basic structure, they should match our template
-            if key == "command" and server_config[key] != template_server[key]:
-                return False
+        templates = self._get_templates()
+        if templates is None:
+            return False  # No templates to compare with, don't remove
         
-        return True
+        return templates.is_managed(server_name, server_config)
     
     def get_dependencies(self) -> List[str]:
         """Get dependencies"""
@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..core.base import Component
+from ..core.removal import UninstallPlan
 from setup import __version__
 from ..services.claude_md import CLAUDEMdService
 
@@ -43,6 +44,7 @@ class MCPDocsComponent(Component):
     def set_selected_servers(self, selected_servers: List[str]) -> None:
         """Set which MCP servers were selected for documentation installation"""
         self.selected_servers = selected_servers
+        self.reset_install_plan()
         self.logger.debug(f"MCP docs will be installed for: {selected_servers}")
     
     def get_files_to_install(self) -> List[Tuple[Path, Path]]:
@@ -104,22 +106,14 @@ class MCPDocsComponent(Component):
             return False
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = self.get_install_plan().pairs()
 
         if not files_to_install:
             self.logger.warning("No MCP documentation files found to install")
             return True  # Not an error - just no docs to install
 
-        # Copy documentation files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy new and changed documentation files
+        success_count = self._install_files(files_to_install, config)
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} documentation files copied successfully")
@@ -160,32 +154,13 @@ class MCPDocsComponent(Component):
             self.logger.error(f"Failed to update metadata: {e}")
             return False
     
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """Uninstall MCP documentation component"""
         try:
             self.logger.info("Uninstalling MCP documentation component...")
             
-            # Remove all MCP documentation files
-            removed_count = 0
-            source_dir = self._get_source_dir()
-            
-            if source_dir and source_dir.exists():
-                # Remove all possible MCP doc files
-                for doc_file in self.server_docs_map.values():
-                    file_path = self.install_component_subdir / doc_file
-                    if self.file_manager.remove_file(file_path):
-                        removed_count += 1
-                        self.logger.debug(f"Removed {doc_file}")
-            
-            # Remove mcp directory if empty
-            try:
-                if self.install_component_subdir.exists():
-                    remaining_files = list(self.install_component_subdir.iterdir())
-                    if not remaining_files:
-                        self.install_component_subdir.rmdir()
-                        self.logger.debug("Removed empty mcp directory")
-            except Exception as e:
-                self.logger.warning(f"Could not remove mcp directory: {e}")
+            # Remove all MCP documentation files; the mcp directory is pruned if left empty
+            removed_count = self._remove_files(plan)
             
             # Update settings.json
             try:
@@ -202,6 +177,10 @@ class MCPDocsComponent(Component):
             self.logger.exception(f"Unexpected error during MCP docs uninstallation: {e}")
             return False
     
+    def get_uninstall_targets(self) -> List[Path]:
+        """Get every MCP documentation file, whichever servers were selected"""
+        return [self.install_component_subdir / doc_file for doc_file in self.server_docs_map.values()]
+    
     def get_dependencies(self) -> List[str]:
         """Get dependencies"""
         return ["core"]
@@ -221,16 +200,7 @@ class MCPDocsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        source_dir = self._get_source_dir()
-        total_size = 0
-        
-        if source_dir and source_dir.exists() and self.selected_servers:
-            for server_name in self.selected_servers:
-                if server_name in self.server_docs_map:
-                    doc_file = self.server_docs_map[server_name]
-                    file_path = source_dir / doc_file
-                    if file_path.exists():
-                        total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Minimum size estimate
         total_size = max(total_size, 10240)  # At least 10KB
@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..core.base import Component
+from ..core.removal import UninstallPlan
 from setup import __version__
 from ..services.claude_md import CLAUDEMdService
 
@@ -38,22 +39,14 @@ class ModesComponent(Component):
             return False
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = self.get_install_plan().pairs()
 
         if not files_to_install:
             self.logger.warning("No mode files found to install")
             return False
 
-        # Copy mode files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy new and changed mode files
+        success_count = self._install_files(files_to_install, config)
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} mode files copied successfully")
@@ -93,27 +86,13 @@ class ModesComponent(Component):
             self.logger.error(f"Failed to update metadata: {e}")
             return False
     
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """Uninstall modes component"""
         try:
             self.logger.info("Uninstalling SuperClaude modes component...")
             
-            # Remove mode files
-            removed_count = 0
-            for _, target in self.get_files_to_install():
-                if self.file_manager.remove_file(target):
-                    removed_count += 1
-                    self.logger.debug(f"Removed {target.name}")
-            
-            # Remove modes directory if empty
-            try:
-                if self.install_component_subdir.exists():
-                    remaining_files = list(self.install_component_subdir.iterdir())
-                    if not remaining_files:
-                        self.install_component_subdir.rmdir()
-                        self.logger.debug("Removed empty modes directory")
-            except Exception as e:
-                self.logger.warning(f"Could not remove modes directory: {e}")
+            # Remove mode files; the modes directory is pruned if left empty
+            removed_count = self._remove_files(plan)
             
             # Update settings.json
             try:
@@ -149,14 +128,7 @@ class ModesComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        source_dir = self._get_source_dir()
-        total_size = 0
-        
-        if source_dir and source_dir.exists():
-            for filename in self.component_files:
-                file_path = source_dir / filename
-                if file_path.exists():
-                    total_size += file_path.stat().st_size
+        total_size = self.get_install_plan().total_size
         
         # Minimum size estimate
         total_size = max(total_size, 20480)  # At least 20KB
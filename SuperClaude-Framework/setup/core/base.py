@@ -3,13 +3,17 @@ Abstract base class for installable components
 """
 
 from abc import ABC, abstractmethod
+import os
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
-import json
+from .plan import InstallPlan, PlannedFile, scan_directory
+from .removal import UninstallPlan
 from ..services.files import FileService
 from ..services.settings import SettingsService
+from ..utils import events
 from ..utils.logger import get_logger
 from ..utils.security import SecurityValidator
+from ..utils.tracing import span, traced
 
 
 class Component(ABC):
@@ -28,6 +32,10 @@ class Component(ABC):
         # Resolve path safely
         self.install_dir = self._resolve_path_safely(install_dir or DEFAULT_INSTALL_DIR)
         self.settings_manager = SettingsService(self.install_dir)
+        # Per-operation caches: source directory scans and the install plan
+        self._directory_scans: Dict[Path, Dict[str, os.stat_result]] = {}
+        self._install_plan: Optional[InstallPlan] = None
+        self._validated_plan: Optional[InstallPlan] = None
         self.component_files = self._discover_component_files()
         self.file_manager = FileService()
         self.install_component_subdir = self.install_dir / component_subdir
@@ -55,6 +63,11 @@ class Component(ABC):
         """
         errors = []
 
+        # Installer.install_component and _install both validate; check a plan once
+        plan = self.get_install_plan()
+        if self._validated_plan is plan:
+            return True, []
+
         # Check if we have read access to source files
         source_dir = self._get_source_dir()
         if not source_dir or (source_dir and not source_dir.exists()):
@@ -62,11 +75,7 @@ class Component(ABC):
             return False, errors
 
         # Check if all required framework files exist
-        missing_files = []
-        for filename in self.component_files:
-            source_file = source_dir / filename
-            if not source_file.exists():
-                missing_files.append(filename)
+        missing_files = [source.name for source in plan.missing]
 
         if missing_files:
             errors.append(f"Missing component files: {missing_files}")
@@ -84,7 +93,7 @@ class Component(ABC):
             errors.extend(validation_errors)
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = plan.pairs()
 
         # Validate all files for security
         is_safe, security_errors = SecurityValidator.validate_component_files(
@@ -96,6 +105,9 @@ class Component(ABC):
         if not self.file_manager.ensure_directory(self.install_component_subdir):
             errors.append(f"Could not create install directory: {self.install_component_subdir}")
 
+        if not errors:
+            self._validated_plan = plan
+
         return len(errors) == 0, errors
     
     def get_files_to_install(self) -> List[Tuple[Path, Path]]:
@@ -116,6 +128,76 @@ class Component(ABC):
 
         return files
     
+    def get_install_plan(self) -> InstallPlan:
+        """
+        Get the install plan of this component for the current operation
+        
+        The plan is built on first use and shared by prerequisite validation,
+        copying, size estimation and post-install validation.
+        
+        Returns:
+            Immutable install plan
+        """
+        if self._install_plan is None:
+            self._install_plan = self._build_install_plan()
+        return self._install_plan
+
+    def reset_install_plan(self) -> None:
+        """Drop the cached plan and scans (e.g. after the file selection changed)"""
+        self._install_plan = None
+        self._validated_plan = None
+        self._directory_scans.clear()
+
+    @traced("discover", "component")
+    def _build_install_plan(self) -> InstallPlan:
+        """
+        Build the install plan from one scan per source directory
+        
+        The plan only holds stat data; content hashes are computed by
+        _install_files when it decides whether a file must be copied.
+        
+        Returns:
+            Install plan for the files of get_files_to_install()
+        """
+        files = []
+        missing = []
+
+        for source, target in self.get_files_to_install():
+            stat = self._stat_source(source)
+            if stat is None:
+                missing.append(source)
+                continue
+
+            files.append(PlannedFile(source, target, stat.st_size, stat.st_mode, stat.st_mtime_ns))
+
+        return InstallPlan(self._get_source_dir(), files, missing)
+
+    def _scan_source_directory(self, directory: Path) -> Dict[str, os.stat_result]:
+        """
+        Scan a source directory once per operation
+        
+        Args:
+            directory: Directory to scan
+            
+        Returns:
+            Dict mapping regular file names to their stat results
+            
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        scanned = self._directory_scans.get(directory)
+        if scanned is None:
+            scanned = scan_directory(directory)
+            self._directory_scans[directory] = scanned
+        return scanned
+
+    def _stat_source(self, source: Path) -> Optional[os.stat_result]:
+        """Get the stat result of a source file from its directory scan"""
+        try:
+            return self._scan_source_directory(source.parent).get(source.name)
+        except OSError:
+            return None
+
     def get_settings_modifications(self) -> Dict[str, Any]:
         """
         Return settings.json modifications to apply
@@ -129,7 +211,8 @@ class Component(ABC):
     
     def install(self, config: Dict[str, Any]) -> bool:
         try:
-            return self._install(config)
+            with span(f"install {self.get_metadata()['name']}", "component"):
+                return self._install(config)
         except Exception as e:
             self.logger.exception(f"Unexpected error during {repr(self)} installation: {e}")
             return False
@@ -153,27 +236,219 @@ class Component(ABC):
             return False
 
         # Get files to install
-        files_to_install = self.get_files_to_install()
+        files_to_install = self.get_install_plan().pairs()
+
+        # Copy new and changed framework files
+        success_count = self._install_files(files_to_install, config)
+
+        if success_count != len(files_to_install):
+            self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
+            return False
+
+        self.logger.success(f"{repr(self)} component installed successfully ({success_count} files)")
+
+        return self._post_install()
+
+
+    @traced("copy", "component")
+    def _install_files(self, files_to_install: List[Tuple[Path, Path]], config: Dict[str, Any]) -> int:
+        """
+        Copy component files, skipping files unchanged since the last install
+        
+        Compares the source files against the content hash manifest recorded
+        in .superclaude-metadata.json, copies new and changed files, removes
+        files that are no longer shipped and records the updated manifest.
+        
+        Args:
+            files_to_install: List of tuples (source_path, target_path)
+            config: Installation configuration ("incremental": False copies every file,
+                    "link_strategy": one of FileService.LINK_STRATEGIES,
+                    "staging": StagedInstall collecting the changes instead of
+                    writing the live installation)
+            
+        Returns:
+            Number of files in place (copied or already up to date)
+        """
+        component_name = self.get_metadata()['name']
+        incremental = config.get("incremental", True)
+        strategy = config.get("link_strategy", "copy")
+        staging = config.get("staging")
+        plan = self.get_install_plan()
+        previous = self.settings_manager.get_file_manifest(component_name)
+        manifest = {}
 
-        # Copy framework files
         success_count = 0
+        copied_count = 0
+        linked = False
         for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
+            relative = self._manifest_key(target)
+            recorded = previous.get(relative)
 
-            if self.file_manager.copy_file(source, target):
+            try:
+                entry = self._get_manifest_entry(source, recorded, plan.get(source))
+            except OSError as e:
+                self.logger.error(f"Could not read {source}: {e}")
+                continue
+            entry["link_strategy"] = strategy
+
+            if incremental and self._is_file_current(target, entry, recorded):
+                self.logger.debug("Unchanged %s, skipping copy", relative)
+                self._record_target_stat(entry, target)
+                entry["installed_as"] = recorded.get("installed_as", "copy")
+                manifest[relative] = entry
+                success_count += 1
+                events.emit(events.FILE_DONE, component=component_name, bytes=entry["size"], copied=False)
+                continue
+
+            self.logger.debug("Installing %s to %s (%s)", source.name, target, strategy)
+            install_target = staging.get_staging_path(relative) if staging is not None else target
+            method = self.file_manager.install_file(source, install_target, strategy)
+            if method:
+                # Recorded before staging: staged files keep their stat when moved into place
+                self._record_target_stat(entry, install_target)
+                if staging is not None:
+                    staging.stage(relative)
+                # Record how the file was materialized so update/uninstall can handle links
+                entry["installed_as"] = method
+                linked = linked or method == "symlink"
+                manifest[relative] = entry
                 success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
+                copied_count += 1
+                self.logger.debug("Successfully installed %s as %s", source.name, method)
+                events.emit(events.FILE_DONE, component=component_name, bytes=entry["size"], copied=True)
             else:
                 self.logger.error(f"Failed to copy {source.name}")
 
-        if success_count != len(files_to_install):
-            self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
-            return False
+        # Remove files installed previously that are no longer shipped
+        removed_count = 0
+        for relative, recorded in previous.items():
+            if relative in manifest:
+                continue
+            target = self.install_dir / relative
+            if not os.path.lexists(target):
+                continue
+            # Symlinks into the package data are ours as long as they are still links;
+            # leave files alone that were modified after we installed them
+            is_own_link = recorded.get("installed_as") == "symlink" and target.is_symlink()
+            if not is_own_link and not self._is_target_unmodified(target, recorded):
+                self.logger.warning(f"Keeping modified file no longer shipped: {target}")
+                continue
+            if staging is not None:
+                staging.stage_removal(relative)
+                removed_count += 1
+            elif self.file_manager.remove_file(target):
+                removed_count += 1
+                self.logger.debug("Removed stale file %s", relative)
+
+        if linked:
+            # Path resolutions memoized before the links existed are outdated
+            SecurityValidator.clear_cache()
+
+        if manifest != previous:
+            self.settings_manager.set_file_manifest(component_name, manifest)
+
+        self.logger.info(
+            f"{repr(self)}: {copied_count} copied, {success_count - copied_count} unchanged, "
+            f"{removed_count} removed"
+        )
+        return success_count
 
-        self.logger.success(f"{repr(self)} component installed successfully ({success_count} files)")
+    def _manifest_key(self, target: Path) -> str:
+        """Get the manifest key (install-dir relative POSIX path) for a target file"""
+        try:
+            return target.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            return target.as_posix()
 
-        return self._post_install()
+    def _get_manifest_entry(self, source: Path, recorded: Optional[Dict[str, Any]],
+                            planned: Optional[PlannedFile] = None) -> Dict[str, Any]:
+        """
+        Build the manifest entry for a source file
+        
+        The content hash is only recomputed when the source size or
+        modification time differ from the recorded entry.
+        
+        Args:
+            source: Source file path
+            recorded: Manifest entry from the previous install (if any)
+            planned: Planned file carrying the source stat (stats source if None)
+            
+        Returns:
+            Dict with sha256, size and mtime_ns of the source file
+        """
+        if planned is not None:
+            size, mtime_ns = planned.size, planned.mtime_ns
+        else:
+            stat = source.stat()
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        if (recorded and recorded.get("size") == size and
+                recorded.get("mtime_ns") == mtime_ns and recorded.get("sha256")):
+            digest = recorded["sha256"]
+        else:
+            digest = self.file_manager.get_file_hash(source)
+            if digest is None:
+                raise OSError(f"Could not hash {source}")
+
+        return {
+            "sha256": digest,
+            "size": size,
+            "mtime_ns": mtime_ns
+        }
+
+    def _record_target_stat(self, entry: Dict[str, Any], target: Path) -> None:
+        """Record size and mtime of the installed file, used to detect later edits"""
+        try:
+            stat = os.stat(target)
+        except OSError:
+            return
+        entry["target_size"] = stat.st_size
+        entry["target_mtime_ns"] = stat.st_mtime_ns
 
+    def _is_target_unmodified(self, target: Path, recorded: Dict[str, Any]) -> bool:
+        """
+        Check whether an installed file still has the content it was installed with
+        
+        A size and mtime matching the values recorded at install time are
+        trusted; otherwise (or for manifests without them) the file is hashed.
+        
+        Args:
+            target: Installed file path
+            recorded: Manifest entry written when the file was installed
+            
+        Returns:
+            True if the file was not modified since
+        """
+        try:
+            stat = os.stat(target)
+        except OSError:
+            return False
+        if stat.st_size != recorded.get("size"):
+            return False
+        if (recorded.get("target_size") == stat.st_size and
+                recorded.get("target_mtime_ns") == stat.st_mtime_ns):
+            return True
+        return self.file_manager.get_file_hash(target) == recorded.get("sha256")
+
+    def _is_file_current(self, target: Path, entry: Dict[str, Any], recorded: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check whether an installed file already matches its source
+        
+        Args:
+            target: Installed file path
+            entry: Manifest entry of the current source file
+            recorded: Manifest entry from the previous install (if any)
+            
+        Returns:
+            True if the target can be left untouched
+        """
+        if not recorded or recorded.get("sha256") != entry["sha256"]:
+            return False
+        # Switching strategies (e.g. copy -> symlink) reinstalls the file
+        if recorded.get("link_strategy", "copy") != entry.get("link_strategy", "copy"):
+            return False
+        if (recorded.get("installed_as") == "symlink") != os.path.islink(target):
+            return False
+        return self._is_target_unmodified(target, recorded)
     
     @abstractmethod
     def _post_install(self) -> bool:
@@ -181,15 +456,48 @@ class Component(ABC):
 
 
     @abstractmethod
-    def uninstall(self) -> bool:
+    def uninstall(self, plan: Optional[UninstallPlan] = None) -> bool:
         """
         Remove component
         
+        Args:
+            plan: Uninstall plan that already removed the files of this and
+                  other components in one batch (None removes them here)
+        
         Returns:
             True if successful, False otherwise
         """
         pass
     
+    def get_uninstall_targets(self) -> List[Path]:
+        """
+        Get files this component removes on uninstall
+        
+        Files recorded in the component's file manifest are always included
+        by the uninstall plan; this adds the files of the current install plan.
+        
+        Returns:
+            List of target paths (missing files are ignored)
+        """
+        return [planned.target for planned in self.get_install_plan()]
+    
+    @traced("remove", "component")
+    def _remove_files(self, plan: Optional[UninstallPlan] = None) -> int:
+        """
+        Remove the installed files of this component
+        
+        Args:
+            plan: Uninstall plan that was already executed for several components
+            
+        Returns:
+            Number of files removed
+        """
+        name = self.get_metadata()['name']
+        if plan is None:
+            plan = UninstallPlan.build(self.install_dir, {name: self})
+            plan.execute()
+        return plan.get_removed_count(name)
+    
     @abstractmethod
     def get_dependencies(self) -> List[str]:
         """
@@ -228,20 +536,13 @@ class Component(ABC):
             Version string if installed, None otherwise
         """
         self.logger.debug("Checking installed version")
-        metadata_file = self.install_dir / ".superclaude-metadata.json"
-        if metadata_file.exists():
-            self.logger.debug("Metadata file exists, reading version")
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                component_name = self.get_metadata()['name']
-                version = metadata.get('components', {}).get(component_name, {}).get('version')
-                self.logger.debug(f"Found version: {version}")
-                return version
-            except Exception as e:
-                self.logger.warning(f"Failed to read version from metadata: {e}")
-        else:
-            self.logger.debug("Metadata file does not exist")
+        try:
+            component_name = self.get_metadata()['name']
+            version = self.settings_manager.get_component_version(component_name)
+            self.logger.debug(f"Found version: {version}")
+            return version
+        except Exception as e:
+            self.logger.warning(f"Failed to read version from metadata: {e}")
         return None
     
     def is_installed(self) -> bool:
@@ -253,6 +554,7 @@ class Component(ABC):
         """
         return self.get_installed_version() is not None
     
+    @traced("post-validate", "component")
     def validate_installation(self) -> Tuple[bool, List[str]]:
         """
         Validate that component is correctly installed
@@ -263,7 +565,8 @@ class Component(ABC):
         errors = []
         
         # Check if all files exist
-        for _, target in self.get_files_to_install():
+        for planned in self.get_install_plan():
+            target = planned.target
             if not target.exists():
                 errors.append(f"Missing file: {target}")
         
@@ -280,14 +583,7 @@ class Component(ABC):
         Returns:
             Estimated size in bytes
         """
-        total_size = 0
-        for source, _ in self.get_files_to_install():
-            if source.exists():
-                if source.is_file():
-                    total_size += source.stat().st_size
-                elif source.is_dir():
-                    total_size += sum(f.stat().st_size for f in source.rglob('*') if f.is_file())
-        return total_size
+        return self.get_install_plan().total_size
 
     def _discover_component_files(self) -> List[str]:
         """
@@ -324,37 +620,34 @@ class Component(ABC):
             exclude_patterns = []
 
         try:
-            if not directory.exists():
-                self.logger.warning(f"Source directory not found: {directory}")
-                return []
-
-            if not directory.is_dir():
-                self.logger.warning(f"Source path is not a directory: {directory}")
-                return []
-
-            # Discover files with the specified extension
-            files = []
-            for file_path in directory.iterdir():
-                if (file_path.is_file() and
-                    file_path.suffix.lower() == extension.lower() and
-                    file_path.name not in exclude_patterns):
-                    files.append(file_path.name)
-
-            # Sort for consistent ordering
-            files.sort()
-
-            self.logger.debug(f"Discovered {len(files)} {extension} files in {directory}")
-            if files:
-                self.logger.debug(f"Files found: {files}")
-
-            return files
-
+            scanned = self._scan_source_directory(directory)
+        except FileNotFoundError:
+            self.logger.warning(f"Source directory not found: {directory}")
+            return []
+        except NotADirectoryError:
+            self.logger.warning(f"Source path is not a directory: {directory}")
+            return []
         except PermissionError:
             self.logger.error(f"Permission denied accessing directory: {directory}")
             return []
         except Exception as e:
             self.logger.error(f"Error discovering files in {directory}: {e}")
             return []
+
+        # Discover files with the specified extension
+        files = [
+            name for name in scanned
+            if os.path.splitext(name)[1].lower() == extension.lower() and name not in exclude_patterns
+        ]
+
+        # Sort for consistent ordering
+        files.sort()
+
+        self.logger.debug("Discovered %d %s files in %s", len(files), extension, directory)
+        if files:
+            self.logger.debug("Files found: %s", files)
+
+        return files
     
     def __str__(self) -> str:
         """String representation of component"""
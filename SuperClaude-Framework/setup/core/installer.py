@@ -4,29 +4,44 @@ Base installer logic for SuperClaude installation system fixed some issues
 
 from typing import List, Dict, Optional, Set, Tuple, Any
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import shutil
-import tempfile
+import threading
 from datetime import datetime
 from .base import Component
+from .staging import StagedInstall, StagingError
+from ..services.backup import BackupStore
+from ..services.claude_md import CLAUDEMdService
+from ..services.settings import SettingsService
+from ..utils import events
 from ..utils.logger import get_logger
+from ..utils.security import SecurityValidator
+from ..utils.tracing import span, traced
 
 
 class Installer:
     """Main installer orchestrator"""
 
+    # Upper bound on components installed concurrently within one dependency level
+    DEFAULT_MAX_WORKERS = 4
+
     def __init__(self,
                  install_dir: Optional[Path] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 max_workers: Optional[int] = None):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            max_workers: Maximum number of components installed in parallel
+                         within a dependency level (1 disables parallelism)
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers or self.DEFAULT_MAX_WORKERS)
         self.components: Dict[str, Component] = {}
         self.installed_components: Set[str] = set()
         self.updated_components: Set[str] = set()
@@ -35,6 +50,7 @@ class Installer:
         self.skipped_components: Set[str] = set()
         self.backup_path: Optional[Path] = None
         self.logger = get_logger()
+        self._state_lock = threading.Lock()
 
     def register_component(self, component: Component) -> None:
         """
@@ -98,6 +114,44 @@ class Installer:
 
         return resolved
 
+    def get_installation_levels(self, component_names: List[str]) -> List[List[str]]:
+        """
+        Group components into dependency levels
+        
+        Components within one level only depend on components from earlier
+        levels, so each level can be installed in parallel.
+        
+        Args:
+            component_names: List of component names to install
+            
+        Returns:
+            List of levels, each a list of component names in resolution order
+            
+        Raises:
+            ValueError: If circular dependencies detected or unknown component
+        """
+        ordered_names = self.resolve_dependencies(component_names)
+
+        levels = []
+        remaining = list(ordered_names)
+
+        while remaining:
+            pending = set(remaining)
+            current_level = [
+                name for name in remaining
+                if not set(self.components[name].get_dependencies()) & pending
+            ]
+
+            if not current_level:
+                # This shouldn't happen after successful dependency resolution
+                raise ValueError(
+                    "Circular dependency detected in installation order calculation")
+
+            levels.append(current_level)
+            remaining = [name for name in remaining if name not in current_level]
+
+        return levels
+
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
         Validate system requirements for all registered components
@@ -134,7 +188,7 @@ class Installer:
         Create backup of existing installation
         
         Returns:
-            Path to backup archive or None if no existing installation
+            Path to the backup snapshot manifest or None if no existing installation
         """
         if not self.install_dir.exists():
             return None
@@ -142,45 +196,18 @@ class Installer:
         if self.dry_run:
             return self.install_dir / "backup_dryrun.tar.gz"
 
-        # Create backup directory
-        backup_dir = self.install_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-
-        # Create timestamped backup
+        # Create timestamped snapshot in the deduplicating backup store
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"superclaude_backup_{timestamp}"
-        backup_path = backup_dir / f"{backup_name}.tar.gz"
-
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_backup = Path(temp_dir) / backup_name
-
-            # Ensure temp backup directory exists
-            temp_backup.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files except backups and local directories
-            for item in self.install_dir.iterdir():
-                if item.name not in ["backups", "local"]:
-                    try:
-                        if item.is_file():
-                            shutil.copy2(item, temp_backup / item.name)
-                        elif item.is_dir():
-                            shutil.copytree(item, temp_backup / item.name)
-                    except Exception as e:
-                        # Log warning but continue backup process
-                        self.logger.warning(f"Could not backup {item.name}: {e}")
-
-            # Create archive only if there are files to backup
-            if any(temp_backup.iterdir()):
-                # shutil.make_archive adds .tar.gz automatically, so use base name without extensions
-                base_path = backup_dir / backup_name
-                shutil.make_archive(str(base_path), 'gztar', temp_backup)
-            else:
-                # Create empty backup file to indicate backup was attempted
-                backup_path.touch()
-                self.logger.warning(
-                    f"No files to backup, created empty backup marker: {backup_path.name}"
-                )
+
+        # Only contents changed since the last snapshot are written (excluding backups and local directories)
+        store = BackupStore(self.install_dir / "backups")
+        stats = store.create_snapshot(self.install_dir, backup_name)
+        backup_path = store.get_snapshot_path(backup_name)
+        if stats["files"] == 0:
+            self.logger.warning(
+                f"No files to backup, created empty snapshot: {backup_path.name}"
+            )
 
         self.backup_path = backup_path
         return backup_path
@@ -206,13 +233,18 @@ class Installer:
         if component_name in self.installed_components:
             return True
 
+        events.emit(events.COMPONENT_START, component=component_name)
+
         # Check prerequisites
-        success, errors = component.validate_prerequisites()
+        with span(f"validate {component_name}", "installer"):
+            success, errors = component.validate_prerequisites()
         if not success:
             self.logger.error(f"Prerequisites failed for {component_name}:")
             for error in errors:
                 self.logger.error(f"  - {error}")
-            self.failed_components.add(component_name)
+            with self._state_lock:
+                self.failed_components.add(component_name)
+            events.emit(events.COMPONENT_DONE, component=component_name, success=False)
             return False
 
         # Perform installation
@@ -221,27 +253,65 @@ class Installer:
                 self.logger.info(f"[DRY RUN] Would install {component_name}")
                 success = True
             else:
-                success = component.install(config)
+                with span(f"component {component_name}", "installer"):
+                    success = component.install(config)
 
-            if success:
-                self.installed_components.add(component_name)
-                self.updated_components.add(component_name)
-            else:
-                self.failed_components.add(component_name)
+            with self._state_lock:
+                if success:
+                    self.installed_components.add(component_name)
+                    self.updated_components.add(component_name)
+                else:
+                    self.failed_components.add(component_name)
 
+            events.emit(events.COMPONENT_DONE, component=component_name, success=success)
             return success
 
         except Exception as e:
             self.logger.error(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            with self._state_lock:
+                self.failed_components.add(component_name)
+            events.emit(events.COMPONENT_DONE, component=component_name, success=False)
             return False
 
+    def install_level(self, level: List[str], config: Dict[str, Any]) -> bool:
+        """
+        Install one dependency level, running its components in parallel
+        
+        Returns only after every component of the level has finished.
+        
+        Args:
+            level: Component names without dependencies on each other
+            config: Installation configuration
+            
+        Returns:
+            True if all components of the level succeeded, False otherwise
+        """
+        for name in level:
+            self.logger.info(f"Installing {name}...")
+
+        workers = min(len(level), self.max_workers)
+        with span("level", "installer", components=level, workers=workers):
+            if workers <= 1:
+                return all([self.install_component(name, config) for name in level])
+
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="superclaude-install") as executor:
+                results = list(executor.map(
+                    lambda name: self.install_component(name, config), level))
+
+        return all(results)
+
+    @traced("install components", "installer")
     def install_components(self,
                            component_names: List[str],
                            config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Install multiple components in dependency order
         
+        With config["staged"] the component files are built in a staging
+        directory and switched in only once every component succeeded; the
+        replaced files are kept for rollback instead of taking a full backup.
+        
         Args:
             component_names: List of component names to install
             config: Installation configuration
@@ -250,44 +320,93 @@ class Installer:
             True if all successful, False if any failed
         """
         config = config or {}
+        # Path resolutions memoized by earlier operations may be outdated
+        SecurityValidator.clear_cache()
 
-        # Resolve dependencies
+        # Resolve dependencies into parallelizable levels
         try:
-            ordered_names = self.resolve_dependencies(component_names)
+            with span("resolve dependencies", "installer"):
+                levels = self.get_installation_levels(component_names)
         except ValueError as e:
             self.logger.error(f"Dependency resolution error: {e}")
             return False
 
+        if events.progress_active():
+            self._emit_plan(levels)
+
         # Validate system requirements
-        success, errors = self.validate_system_requirements()
+        events.emit(events.PHASE, phase="validate")
+        with span("validate system", "installer"):
+            success, errors = self.validate_system_requirements()
         if not success:
             self.logger.error("System requirements not met:")
             for error in errors:
                 self.logger.error(f"  - {error}")
             return False
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        staging = None
+        if config.get("staged") and not self.dry_run:
+            # The previous files are kept by the staged install, no full backup needed
+            staging = StagedInstall(self.install_dir)
+            config = dict(config, staging=staging)
+        elif self.install_dir.exists() and not self.dry_run and config.get("backup", True):
+            # Create backup if updating
             self.logger.info("Creating backup of existing installation...")
+            events.emit(events.PHASE, phase="backup")
             try:
-                self.create_backup()
+                with span("backup", "installer"):
+                    self.create_backup()
             except Exception as e:
                 self.logger.error(f"Failed to create backup: {e}")
                 return False
 
-        # Install each component
+        # Collect all metadata and CLAUDE.md changes of this run into one write each
         all_success = True
-        for name in ordered_names:
-            self.logger.info(f"Installing {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
-
-        if not self.dry_run:
-            self._run_post_install_validation()
+        try:
+            with SettingsService(self.install_dir).metadata_transaction(), \
+                    CLAUDEMdService(self.install_dir).document_session():
+                # Install level by level; a level starts once the previous one finished
+                events.emit(events.PHASE, phase="install")
+                for level in levels:
+                    if not self.install_level(level, config):
+                        all_success = False
+                        # Continue installing other components even if one fails
+
+                if staging is not None:
+                    if not all_success:
+                        raise StagingError("Staged installation failed, installed files left unchanged")
+                    events.emit(events.PHASE, phase="commit")
+                    with span("staging commit", "installer"):
+                        changed = staging.commit()
+                    self.logger.info(f"Switched in {changed} changed files (previous version kept for rollback)")
+
+                if not self.dry_run:
+                    events.emit(events.PHASE, phase="post-validate")
+                    with span("post-validate", "installer"):
+                        self._run_post_install_validation()
+        except StagingError as e:
+            self.logger.error(str(e))
+            return False
+        finally:
+            if staging is not None:
+                staging.discard()
 
         return all_success
 
+    def _emit_plan(self, levels: List[List[str]]) -> None:
+        """Announce the number of components, files and bytes an install will process"""
+        names = [name for level in levels for name in level]
+        files = 0
+        size = 0
+        for name in names:
+            try:
+                plan = self.components[name].get_install_plan()
+            except OSError:
+                continue  # Reported when the component is installed
+            files += len(plan)
+            size += plan.total_size
+        events.emit(events.PLAN, components=len(names), files=files, bytes=size)
+
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         self.logger.info("Running post-installation validation...")
@@ -313,6 +432,27 @@ class Installer:
         """Alias for update operation (uses install logic)"""
         return self.install_components(component_names, config)
 
+    def rollback_staged(self) -> bool:
+        """
+        Switch back to the files replaced by the last staged install or update
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        staging = StagedInstall(self.install_dir)
+        if self.dry_run:
+            self.logger.info(f"[DRY RUN] Would roll back to {staging.previous_dir}")
+            return staging.has_previous()
+
+        try:
+            restored = staging.rollback()
+        except StagingError as e:
+            self.logger.error(str(e))
+            return False
+
+        self.logger.info(f"Rolled back {restored} files to the previous version")
+        return True
+
 
     def get_installation_summary(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,98 @@
+"""
+Install plan: the files of one component, scanned once per operation
+"""
+
+import os
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from pathlib import Path
+
+
+class PlannedFile(NamedTuple):
+    """One source file of a component and where it is installed"""
+    source: Path
+    target: Path
+    size: int
+    mode: int
+    mtime_ns: int
+
+
+class InstallPlan:
+    """
+    Immutable list of the files a component installs
+
+    Built once per component per operation from a single scan of the source
+    directory, so prerequisite validation, copying, size estimation and
+    post-install validation all see the same files without re-statting them.
+    """
+
+    __slots__ = ("_source_dir", "_files", "_missing", "_by_source")
+
+    def __init__(self, source_dir: Optional[Path], files: Sequence[PlannedFile],
+                 missing: Sequence[Path] = ()):
+        """
+        Initialize plan
+
+        Args:
+            source_dir: Source directory of the component
+            files: Planned files in installation order
+            missing: Source files that were expected but not found
+        """
+        self._source_dir = source_dir
+        self._files = tuple(files)
+        self._missing = tuple(missing)
+        self._by_source = {planned.source: planned for planned in self._files}
+
+    @property
+    def source_dir(self) -> Optional[Path]:
+        """Source directory of the component"""
+        return self._source_dir
+
+    @property
+    def files(self) -> Tuple[PlannedFile, ...]:
+        """Planned files in installation order"""
+        return self._files
+
+    @property
+    def missing(self) -> Tuple[Path, ...]:
+        """Expected source files that do not exist"""
+        return self._missing
+
+    @property
+    def total_size(self) -> int:
+        """Total size of all planned files in bytes"""
+        return sum(planned.size for planned in self._files)
+
+    def get(self, source: Path) -> Optional[PlannedFile]:
+        """Look up the planned file for a source path"""
+        return self._by_source.get(source)
+
+    def pairs(self) -> List[Tuple[Path, Path]]:
+        """Get (source, target) tuples as returned by get_files_to_install"""
+        return [(planned.source, planned.target) for planned in self._files]
+
+    def __iter__(self) -> Iterator[PlannedFile]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def scan_directory(directory: Path) -> Dict[str, os.stat_result]:
+    """
+    Stat every regular file of a directory in one os.scandir pass
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Dict mapping file names to their stat results
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    files = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                files[entry.name] = entry.stat()
+    return files
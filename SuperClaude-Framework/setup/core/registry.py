@@ -2,34 +2,55 @@
 Component registry for auto-discovery and dependency resolution
 """
 
+import hashlib
 import importlib
-import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+from typing import Dict, List, Set, Optional, Type, Any
 from pathlib import Path
 from .base import Component
 from ..utils.logger import get_logger
+from ..utils.tracing import traced
+
+
+# Static component manifest shipped with the package (regenerated at build time
+# by scripts/build_and_upload.py, never at runtime: the package may be read-only)
+MANIFEST_FILE = Path(__file__).parent.parent / "data" / "components.json"
+
+# Component metadata discovered by import when the manifest was stale, keyed
+# by source hash, so other registries of the same process skip the imports
+_discovered_metadata: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
 
 class ComponentRegistry:
     """Auto-discovery and management of installable components"""
     
-    def __init__(self, components_dir: Path):
+    def __init__(self, components_dir: Path, manifest_file: Optional[Path] = None):
         """
         Initialize component registry
         
         Args:
             components_dir: Directory containing component modules
+            manifest_file: Static component manifest (defaults to setup/data/components.json)
         """
         self.components_dir = components_dir
+        self.manifest_file = manifest_file or MANIFEST_FILE
         self.component_classes: Dict[str, Type[Component]] = {}
         self.component_instances: Dict[str, Component] = {}
+        self.component_metadata: Dict[str, Dict[str, Any]] = {}
         self.dependency_graph: Dict[str, Set[str]] = {}
         self._discovered = False
         self.logger = get_logger()
     
+    @traced("discover components", "registry")
     def discover_components(self, force_reload: bool = False) -> None:
         """
-        Auto-discover all component classes in components directory
+        Discover available components
+        
+        Component metadata and dependencies come from the static component
+        manifest, so nothing is imported or instantiated here; component
+        modules are loaded on first use. If the manifest is missing or out of
+        date, components are discovered by importing their modules and the
+        result is kept in memory for the rest of the process.
         
         Args:
             force_reload: Force rediscovery even if already done
@@ -39,11 +60,29 @@ class ComponentRegistry:
         
         self.component_classes.clear()
         self.component_instances.clear()
+        self.component_metadata.clear()
         self.dependency_graph.clear()
         
         if not self.components_dir.exists():
             return
         
+        source_hash = self._compute_source_hash()
+        manifest = self._load_manifest(source_hash)
+        if manifest is not None:
+            self.component_metadata.update(manifest["components"])
+        elif source_hash in _discovered_metadata:
+            self.component_metadata.update(_discovered_metadata[source_hash])
+        else:
+            self.logger.debug("Component manifest missing or stale, importing component modules")
+            self._discover_by_import()
+            _discovered_metadata[source_hash] = dict(self.component_metadata)
+        
+        # Build dependency graph
+        self._build_dependency_graph()
+        self._discovered = True
+    
+    def _discover_by_import(self) -> None:
+        """Import every component module and instantiate its components to read metadata"""
         # Add components directory to Python path temporarily
         import sys
         original_path = sys.path.copy()
@@ -65,10 +104,6 @@ class ComponentRegistry:
         finally:
             # Restore original Python path
             sys.path = original_path
-        
-        # Build dependency graph
-        self._build_dependency_graph()
-        self._discovered = True
     
     def _load_component_module(self, module_name: str) -> None:
         """
@@ -77,6 +112,8 @@ class ComponentRegistry:
         Args:
             module_name: Name of module to load
         """
+        import inspect
+        
         try:
             # Import the module
             full_module_name = f"setup.components.{module_name}"
@@ -91,11 +128,15 @@ class ComponentRegistry:
                     # Create instance to get metadata
                     try:
                         instance = obj()
-                        metadata = instance.get_metadata()
+                        metadata = dict(instance.get_metadata())
                         component_name = metadata["name"]
+                        metadata["dependencies"] = list(instance.get_dependencies())
+                        metadata["module"] = obj.__module__.rsplit(".", 1)[-1]
+                        metadata["class"] = obj.__name__
                         
                         self.component_classes[component_name] = obj
                         self.component_instances[component_name] = instance
+                        self.component_metadata[component_name] = metadata
                         
                     except Exception as e:
                         self.logger.warning(f"Could not instantiate component {name}: {e}")
@@ -105,17 +146,85 @@ class ComponentRegistry:
     
     def _build_dependency_graph(self) -> None:
         """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
-            try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                self.logger.warning(f"Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+        for name, metadata in self.component_metadata.items():
+            self.dependency_graph[name] = set(metadata.get("dependencies", []))
+    
+    def _compute_source_hash(self) -> str:
+        """
+        Hash the component module sources the manifest was generated from
+        
+        Returns:
+            Hex digest over all component module names and contents
+        """
+        digest = hashlib.sha256()
+        for py_file in sorted(self.components_dir.glob("*.py")):
+            if py_file.name.startswith("__"):
+                continue
+            digest.update(py_file.name.encode("utf-8"))
+            digest.update(py_file.read_bytes())
+        return digest.hexdigest()
+    
+    def _load_manifest(self, source_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the static component manifest if it matches the installed sources
+        
+        Args:
+            source_hash: Current hash of the component module sources
+            
+        Returns:
+            Manifest dict or None if missing, unreadable or stale
+        """
+        from .. import __version__
+        
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            
+            if (manifest.get("framework_version") != __version__ or
+                    manifest.get("source_hash") != source_hash or
+                    not isinstance(manifest.get("components"), dict)):
+                return None
+            
+            return manifest
+        except (OSError, ValueError):
+            return None
+    
+    def write_manifest(self, manifest_file: Optional[Path] = None) -> bool:
+        """
+        Generate the static component manifest from the discovered components
+        
+        Used at build time (scripts/build_and_upload.py).
+        
+        Args:
+            manifest_file: Output path (defaults to the registry manifest file)
+            
+        Returns:
+            True if written, False otherwise
+        """
+        from .. import __version__
+        
+        if not self.component_metadata:
+            self._discover_by_import()
+        
+        manifest = {
+            "framework_version": __version__,
+            "source_hash": self._compute_source_hash(),
+            "components": self.component_metadata
+        }
+        
+        target = manifest_file or self.manifest_file
+        try:
+            with open(target, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+                f.write("\n")
+            return True
+        except OSError as e:
+            self.logger.debug(f"Could not write component manifest {target}: {e}")
+            return False
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
-        Get component class by name
+        Get component class by name, importing its module on first use
         
         Args:
             component_name: Name of component
@@ -124,7 +233,23 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        
+        if component_name in self.component_classes:
+            return self.component_classes[component_name]
+        
+        metadata = self.component_metadata.get(component_name)
+        if not metadata:
+            return None
+        
+        try:
+            module = importlib.import_module(f"setup.components.{metadata['module']}")
+            component_class = getattr(module, metadata["class"])
+        except (ImportError, AttributeError, KeyError) as e:
+            self.logger.warning(f"Could not load component {component_name}: {e}")
+            return None
+        
+        self.component_classes[component_name] = component_class
+        return component_class
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
@@ -139,17 +264,22 @@ class ComponentRegistry:
         """
         self.discover_components()
         
-        if install_dir is not None:
-            # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
-            if component_class:
-                try:
-                    return component_class(install_dir)
-                except Exception as e:
-                    self.logger.error(f"Error creating component instance {component_name}: {e}")
-                    return None
-        
-        return self.component_instances.get(component_name)
+        if install_dir is None and component_name in self.component_instances:
+            return self.component_instances[component_name]
+        
+        component_class = self.get_component_class(component_name)
+        if not component_class:
+            return None
+        
+        try:
+            instance = component_class(install_dir)
+        except Exception as e:
+            self.logger.error(f"Error creating component instance {component_name}: {e}")
+            return None
+        
+        if install_dir is None:
+            self.component_instances[component_name] = instance
+        return instance
     
     def list_components(self) -> List[str]:
         """
@@ -159,7 +289,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.component_metadata.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -172,13 +302,10 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
-        return None
+        metadata = self.component_metadata.get(component_name)
+        if metadata is None:
+            return None
+        return {key: metadata[key] for key in ("name", "version", "description", "category") if key in metadata}
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
@@ -292,17 +419,10 @@ class ComponentRegistry:
             List of component names in the category
         """
         self.discover_components()
-        components = []
-        
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
-        
-        return components
+        return [
+            name for name, metadata in self.component_metadata.items()
+            if metadata.get("category") == category
+        ]
     
     def get_installation_order(self, component_names: List[str]) -> List[List[str]]:
         """
@@ -343,6 +463,7 @@ class ComponentRegistry:
         
         return levels
     
+    @traced("create components", "registry")
     def create_component_instances(self, component_names: List[str], install_dir: Optional[Path] = None) -> Dict[str, Component]:
         """
         Create instances for multiple components
@@ -377,20 +498,14 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, metadata in self.component_metadata.items():
+            category = metadata.get("category", "unknown")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.component_metadata),
             "categories": categories,
             "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
             "validation_errors": self.validate_dependency_graph()
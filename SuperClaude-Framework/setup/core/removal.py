@@ -0,0 +1,191 @@
+"""
+Uninstall plan: the files of all selected components, removed in one batch
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from ..services.settings import SettingsService
+from ..utils import events
+from ..utils.logger import get_logger
+from ..utils.tracing import traced
+
+
+class UninstallPlan:
+    """
+    Files to remove for a set of components
+
+    Candidate paths come from the file manifests recorded at install time
+    and from each component's get_uninstall_targets(). Every directory that
+    may hold candidates is listed once with os.scandir, so the plan only
+    contains files that exist. execute() then unlinks them directory by
+    directory and prunes directories left empty, deepest first.
+    """
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize empty plan
+
+        Args:
+            install_dir: Installation directory
+        """
+        self.install_dir = install_dir
+        self.logger = get_logger()
+        # Component name -> [(path, size)] of existing files to remove
+        self._files: Dict[str, List[Tuple[Path, int]]] = {}
+        self._removed: Dict[str, int] = {}
+
+    @classmethod
+    @traced("uninstall plan", "uninstall")
+    def build(cls, install_dir: Path, components: Dict[str, Any]) -> "UninstallPlan":
+        """
+        Work out the removal set of several components
+
+        Args:
+            install_dir: Installation directory
+            components: Component instances by name (see Component.get_uninstall_targets)
+
+        Returns:
+            UninstallPlan with the existing files of every component
+        """
+        plan = cls(install_dir)
+        root = install_dir.resolve()
+        settings_manager = SettingsService(install_dir)
+
+        # Candidate paths per directory; a file claimed by two components goes to the first
+        owners: Dict[Path, Dict[str, str]] = {}
+        for name, component in components.items():
+            candidates = [install_dir / relative for relative in settings_manager.get_file_manifest(name)]
+            candidates.extend(component.get_uninstall_targets())
+            for path in candidates:
+                if path.name in ('', '.', '..'):
+                    continue
+                owners.setdefault(path.parent, {}).setdefault(path.name, name)
+            plan._files.setdefault(name, [])
+
+        # One directory listing per directory instead of one stat per candidate
+        for directory in sorted(owners):
+            names = owners[directory]
+            if not plan._is_inside(directory, root):
+                plan.logger.warning(f"Not removing files from {directory}: outside {install_dir}")
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        owner = names.get(entry.name)
+                        if owner is None or entry.is_dir(follow_symlinks=False):
+                            continue
+                        size = entry.stat(follow_symlinks=False).st_size
+                        plan._files[owner].append((Path(entry.path), size))
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                plan.logger.warning(f"Could not scan {directory}: {e}")
+
+        return plan
+
+    @property
+    def components(self) -> List[str]:
+        """Names of the planned components"""
+        return list(self._files)
+
+    @property
+    def total_size(self) -> int:
+        """Total size of all files to remove in bytes"""
+        return sum(size for files in self._files.values() for _, size in files)
+
+    def get_files(self, component: str) -> List[Path]:
+        """Get the files planned for removal for a component"""
+        return [path for path, _ in self._files.get(component, [])]
+
+    def get_size(self, component: str) -> int:
+        """Get the size of the files planned for removal for a component"""
+        return sum(size for _, size in self._files.get(component, []))
+
+    def get_removed_count(self, component: str) -> int:
+        """Get the number of files execute() removed for a component"""
+        return self._removed.get(component, 0)
+
+    def __len__(self) -> int:
+        return sum(len(files) for files in self._files.values())
+
+    @traced("remove files", "uninstall")
+    def execute(self, dry_run: bool = False) -> int:
+        """
+        Remove all planned files and prune the directories left empty
+
+        Args:
+            dry_run: Only log what would be removed
+
+        Returns:
+            Number of files removed
+        """
+        by_dir: Dict[Path, List[Tuple[str, str, int]]] = {}
+        for component, files in self._files.items():
+            for path, size in files:
+                by_dir.setdefault(path.parent, []).append((path.name, component, size))
+
+        if dry_run:
+            for directory, names in sorted(by_dir.items()):
+                self.logger.info(f"[DRY RUN] Would remove {len(names)} files from {directory}")
+            return len(self)
+
+        removed = 0
+        for directory, names in sorted(by_dir.items()):
+            for component, size in self._unlink_batch(directory, names):
+                self._removed[component] = self._removed.get(component, 0) + 1
+                removed += 1
+                events.emit(events.FILE_REMOVED, component=component, bytes=size)
+
+        self._prune_directories(by_dir)
+        return removed
+
+    def _unlink_batch(self, directory: Path,
+                      names: List[Tuple[str, str, int]]) -> Iterable[Tuple[str, int]]:
+        """Unlink files of one directory, relative to a single directory handle; yields (component, size)"""
+        dir_fd: Optional[int] = None
+        if os.unlink in os.supports_dir_fd:
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            except OSError:
+                dir_fd = None
+
+        try:
+            for name, component, size in names:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(name, dir_fd=dir_fd)
+                    else:
+                        os.unlink(directory / name)
+                    yield component, size
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    self.logger.warning(f"Could not remove {directory / name}: {e}")
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    def _prune_directories(self, directories: Iterable[Path]) -> None:
+        """Remove now-empty directories bottom-up, never the install directory itself"""
+        candidates = set()
+        for directory in directories:
+            while directory != self.install_dir and self.install_dir in directory.parents:
+                candidates.add(directory)
+                directory = directory.parent
+
+        for directory in sorted(candidates, key=lambda path: len(path.parts), reverse=True):
+            try:
+                os.rmdir(directory)
+                self.logger.debug("Removed empty directory %s", directory)
+            except OSError:
+                pass  # Not empty (user files) or already gone
+
+    @staticmethod
+    def _is_inside(directory: Path, root: Path) -> bool:
+        """Check that a directory resolves to root or a directory inside it"""
+        try:
+            directory.resolve().relative_to(root)
+            return True
+        except ValueError:
+            return False
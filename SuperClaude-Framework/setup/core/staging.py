@@ -0,0 +1,231 @@
+"""
+Staged installation: build changed files aside, then switch them in with renames
+"""
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from ..services.settings import SettingsService
+from ..utils.logger import get_logger
+from ..utils.security import SecurityValidator
+
+
+STAGING_DIRNAME = ".staging"
+PREVIOUS_DIRNAME = ".previous"
+JOURNAL_NAME = "journal.json"
+
+
+class StagingError(Exception):
+    """Raised when a staged installation cannot be switched in or rolled back"""
+
+
+class StagedInstall:
+    """
+    Install transaction that keeps the live installation untouched until commit
+
+    Components write new and changed files into a staging directory next to
+    the installation (same filesystem, so every switch is a rename). On
+    commit the staged tree is validated, each live file being replaced is
+    moved into the "previous" directory and the staged file renamed over it.
+    The cost is proportional to the number of changed files, not to the size
+    of the installation, and the previous version stays on disk until the
+    next staged install so it can be switched back with rollback().
+
+    Only component files are staged; settings.json, CLAUDE.md and MCP
+    configuration are still edited in place.
+    """
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize staged install
+
+        Args:
+            install_dir: Installation directory
+        """
+        self.install_dir = install_dir
+        backup_dir = install_dir / "backups"
+        self.staging_dir = backup_dir / STAGING_DIRNAME
+        self.previous_dir = backup_dir / PREVIOUS_DIRNAME
+        self.metadata_file = SettingsService(install_dir).metadata_file
+        self.logger = get_logger()
+        # Install-dir relative path -> size of the staged file (None: remove the live file)
+        self._changes: Dict[str, Optional[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def get_staging_path(self, relative: str) -> Path:
+        """Get the path a file is staged at before it is switched in"""
+        return self.staging_dir / relative
+
+    def stage(self, relative: str) -> None:
+        """
+        Record a file written to its staging path
+
+        Args:
+            relative: Install-dir relative POSIX path of the file
+        """
+        staged = self.get_staging_path(relative)
+        # Symlinks are recorded with size -1 and only checked for presence
+        size = -1 if staged.is_symlink() else staged.stat().st_size
+        with self._lock:
+            self._changes[relative] = size
+
+    def stage_removal(self, relative: str) -> None:
+        """
+        Record a live file to remove on commit
+
+        Args:
+            relative: Install-dir relative POSIX path of the file
+        """
+        with self._lock:
+            self._changes[relative] = None
+
+    def validate(self) -> Tuple[bool, List[str]]:
+        """
+        Check that every staged file is still present and complete
+
+        Returns:
+            Tuple of (success: bool, error_messages: List[str])
+        """
+        errors = []
+        for relative, size in self._changes.items():
+            if size is None:
+                continue
+            staged = self.get_staging_path(relative)
+            try:
+                if size >= 0 and staged.lstat().st_size != size:
+                    errors.append(f"Staged file changed size: {relative}")
+            except OSError:
+                errors.append(f"Staged file missing: {relative}")
+        return len(errors) == 0, errors
+
+    def commit(self) -> int:
+        """
+        Switch the staged files into the live installation
+
+        On failure every file switched so far is put back before raising.
+
+        Returns:
+            Number of files replaced, added or removed
+
+        Raises:
+            StagingError: If validation fails or a file cannot be switched
+        """
+        if not self._changes:
+            # Nothing changed; keep the previous version available for rollback
+            return 0
+
+        success, errors = self.validate()
+        if not success:
+            raise StagingError("Staged installation is incomplete: " + "; ".join(errors[:5]))
+
+        if self.previous_dir.exists():
+            shutil.rmtree(self.previous_dir)
+        self.previous_dir.mkdir(parents=True)
+
+        journal = []
+        try:
+            for relative, size in sorted(self._changes.items()):
+                target = self.install_dir / relative
+                change = {"path": relative, "previous": os.path.lexists(target), "installed": False}
+                if change["previous"]:
+                    saved = self.previous_dir / relative
+                    saved.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(target, saved)
+                journal.append(change)
+
+                if size is not None:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(self.get_staging_path(relative), target)
+                    change["installed"] = True
+
+            # Keep the metadata describing the previous files for rollback
+            if self.metadata_file.exists():
+                shutil.copy2(self.metadata_file, self.previous_dir / self.metadata_file.name)
+            self._write_journal(journal)
+        except OSError as e:
+            self._undo(journal)
+            raise StagingError(f"Could not switch in staged files, installation left unchanged: {e}")
+        finally:
+            # Switched-in paths may be symlinks now
+            SecurityValidator.clear_cache()
+
+        self.logger.debug(f"Switched in {len(journal)} staged files")
+        return len(journal)
+
+    def discard(self) -> None:
+        """Remove the staging directory and anything left in it"""
+        if self.staging_dir.exists():
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def has_previous(self) -> bool:
+        """Check whether a previous version can be rolled back to"""
+        return (self.previous_dir / JOURNAL_NAME).exists()
+
+    def rollback(self) -> int:
+        """
+        Switch back to the files replaced by the last staged install
+
+        Returns:
+            Number of files restored or removed
+
+        Raises:
+            StagingError: If there is nothing to roll back or a file cannot be restored
+        """
+        journal_path = self.previous_dir / JOURNAL_NAME
+        try:
+            with open(journal_path, 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+        except FileNotFoundError:
+            raise StagingError("No previous staged installation to roll back to")
+        except (OSError, json.JSONDecodeError) as e:
+            raise StagingError(f"Could not read rollback journal {journal_path}: {e}")
+
+        try:
+            self._undo(journal["changes"], strict=True)
+
+            saved_metadata = self.previous_dir / self.metadata_file.name
+            if saved_metadata.exists():
+                os.replace(saved_metadata, self.metadata_file)
+            elif self.metadata_file.exists():
+                # The staged install was the first one
+                self.metadata_file.unlink()
+        except OSError as e:
+            raise StagingError(f"Rollback failed: {e}")
+        finally:
+            SecurityValidator.clear_cache()
+
+        shutil.rmtree(self.previous_dir, ignore_errors=True)
+        return len(journal["changes"])
+
+    def _undo(self, changes: List[Dict[str, object]], strict: bool = False) -> None:
+        """Put back the previous files of the given journal entries, newest first"""
+        for change in reversed(changes):
+            target = self.install_dir / str(change["path"])
+            try:
+                if change["installed"] and os.path.lexists(target):
+                    os.unlink(target)
+                if change["previous"]:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(self.previous_dir / str(change["path"]), target)
+            except OSError as e:
+                if strict:
+                    raise
+                self.logger.error(f"Could not restore {target}: {e}")
+
+    def _write_journal(self, changes: List[Dict[str, object]]) -> None:
+        """Write the rollback journal (last, so a partial commit has none)"""
+        journal = {
+            "created": datetime.now().isoformat(),
+            "changes": changes
+        }
+        temp_path = self.previous_dir / f".{JOURNAL_NAME}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(journal, f, indent=2)
+        os.replace(temp_path, self.previous_dir / JOURNAL_NAME)
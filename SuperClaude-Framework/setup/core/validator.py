@@ -2,13 +2,19 @@
 System validation for SuperClaude installation requirements
 """
 
+import json
+import os
 import subprocess
 import sys
 import shutil
+import signal
+import time
 from typing import Tuple, List, Dict, Any, Optional
 from pathlib import Path
 import re
 
+from ..utils.tracing import traced
+
 # Handle packaging import - if not available, use a simple version comparison
 try:
     from packaging import version
@@ -53,9 +59,193 @@ except ImportError:
 class Validator:
     """System requirements validator"""
     
-    def __init__(self):
-        """Initialize validator"""
+    # Persistent results of external tool probes, keyed by command
+    PROBE_CACHE_NAME = ".probe_cache.json"
+    PROBE_TIMEOUT = 10  # overall deadline in seconds for one batch of probes
+    
+    def __init__(self, install_dir: Optional[Path] = None, dry_run: bool = False):
+        """
+        Initialize validator
+        
+        Args:
+            install_dir: Installation directory holding the probe cache
+            dry_run: If True, probe results are not written to the probe cache
+        """
+        from .. import DEFAULT_INSTALL_DIR
+        self.probe_cache_file = (install_dir or DEFAULT_INSTALL_DIR) / self.PROBE_CACHE_NAME
+        self.dry_run = dry_run
         self.validation_cache: Dict[str, Any] = {}
+        self.probe_results: Dict[str, Any] = {}
+        self._probe_cache: Optional[Dict[str, Any]] = None
+    
+    @traced("probe tools", "validator")
+    def probe_commands(self, commands: List[List[str]], timeout: Optional[float] = None) -> None:
+        """
+        Run version probes for several external tools at once
+        
+        Probes whose binary (path, size and mtime) is unchanged since a
+        previous run are answered from the persistent probe cache; binaries
+        missing from PATH are answered without spawning a process. All
+        remaining probes run as parallel child processes under one overall
+        deadline; children still running at the deadline are killed.
+        Results are picked up by check_node, check_claude_cli and
+        check_external_tool.
+        
+        Args:
+            commands: Command lines to probe (e.g. [['node', '--version']])
+            timeout: Overall deadline in seconds (defaults to PROBE_TIMEOUT)
+        """
+        timeout = timeout if timeout is not None else self.PROBE_TIMEOUT
+        cache = self._load_probe_cache()
+        pending = {}
+        
+        for cmd in commands:
+            key = " ".join(cmd)
+            if key in self.probe_results or key in pending:
+                continue
+            
+            binary = shutil.which(cmd[0])
+            if binary is None:
+                self.probe_results[key] = {"error": "not_found"}
+                continue
+            
+            identity = self._get_binary_identity(binary)
+            cached = cache.get(key)
+            if cached and identity and cached.get("binary") == identity:
+                self.probe_results[key] = cached["result"]
+                continue
+            
+            pending[key] = (cmd, identity)
+        
+        if not pending:
+            return
+        
+        deadline = time.monotonic() + timeout
+        processes = {}
+        for key, (cmd, _) in pending.items():
+            try:
+                processes[key] = self._start_probe(cmd)
+            except FileNotFoundError:
+                self.probe_results[key] = {"error": "not_found"}
+            except Exception as e:
+                self.probe_results[key] = {"error": str(e)}
+        
+        # Version output is small, so collecting one child at a time cannot stall the others
+        for key, process in processes.items():
+            result = self._finish_probe(process, max(0, deadline - time.monotonic()))
+            self.probe_results[key] = result
+            identity = pending[key][1]
+            if identity and "error" not in result:
+                cache[key] = {"binary": identity, "result": result}
+        
+        self._save_probe_cache(cache)
+    
+    def _start_probe(self, cmd: List[str]) -> subprocess.Popen:
+        """Start one probe command with its output captured"""
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            shell=(sys.platform == "win32"),
+            # Own process group, so a wrapper script is killed with its children
+            start_new_session=(sys.platform != "win32")
+        )
+    
+    def _finish_probe(self, process: subprocess.Popen, timeout: float) -> Dict[str, Any]:
+        """Wait for a probe and capture its outcome as a serializable dict, killing it at the deadline"""
+        try:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                if process.poll() is None:
+                    self._kill_probe(process)
+                    return {"error": "timeout"}
+                # Finished by the deadline; only its output was not collected yet
+                stdout, stderr = process.communicate(timeout=1)
+            return {"returncode": process.returncode, "stdout": stdout, "stderr": stderr}
+        except Exception as e:
+            self._kill_probe(process)
+            return {"error": "timeout" if isinstance(e, subprocess.TimeoutExpired) else str(e)}
+    
+    def _kill_probe(self, process: subprocess.Popen) -> None:
+        """Kill a probe (and its process group) without waiting for its output"""
+        try:
+            if sys.platform != "win32":
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass
+        # Descendants that escaped the kill may keep the pipes open; don't read them
+        for pipe in (process.stdout, process.stderr):
+            if pipe is not None:
+                pipe.close()
+        process.wait()
+    
+    def _run_probe(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Get the result of a probe, running it if it was not prefetched
+        
+        Args:
+            cmd: Command line to probe
+            
+        Returns:
+            Completed process with returncode, stdout and stderr
+            
+        Raises:
+            subprocess.TimeoutExpired: If the probe did not finish in time
+            FileNotFoundError: If the command is not in PATH
+            OSError: If the probe could not be run
+        """
+        key = " ".join(cmd)
+        if key not in self.probe_results:
+            self.probe_commands([cmd])
+        
+        result = self.probe_results[key]
+        error = result.get("error")
+        if error == "timeout":
+            raise subprocess.TimeoutExpired(cmd, self.PROBE_TIMEOUT)
+        if error == "not_found":
+            raise FileNotFoundError(cmd[0])
+        if error:
+            raise OSError(error)
+        
+        return subprocess.CompletedProcess(cmd, result["returncode"], result["stdout"], result["stderr"])
+    
+    def _get_binary_identity(self, binary: str) -> Optional[List[Any]]:
+        """Identify a binary by resolved path, size and mtime for cache invalidation"""
+        try:
+            resolved = os.path.realpath(binary)
+            stat = os.stat(resolved)
+            return [resolved, stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            return None
+    
+    def _load_probe_cache(self) -> Dict[str, Any]:
+        """Load the persistent probe cache (once per validator)"""
+        if self._probe_cache is None:
+            try:
+                with open(self.probe_cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._probe_cache = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._probe_cache = {}
+        return self._probe_cache
+    
+    def _save_probe_cache(self, cache: Dict[str, Any]) -> None:
+        """Persist the probe cache, ignoring failures (it is only an optimization)"""
+        if self.dry_run:
+            return
+        try:
+            self.probe_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.probe_cache_file.with_name(f"{self.probe_cache_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2, sort_keys=True)
+            os.replace(temp_file, self.probe_cache_file)
+        except OSError:
+            pass
     
     def check_python(self, min_version: str = "3.8", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -114,14 +304,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if node is installed (prefetched by probe_commands when batched)
+            result = self._run_probe(['node', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("node")
@@ -182,14 +366,8 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if claude is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Check if claude is installed (prefetched by probe_commands when batched)
+            result = self._run_probe(['claude', '--version'])
             
             if result.returncode != 0:
                 help_msg = self.get_installation_help("claude_cli")
@@ -252,13 +430,7 @@ class Validator:
             # Split command into parts
             cmd_parts = command.split()
             
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = self._run_probe(cmd_parts)
             
             if result.returncode != 0:
                 result_tuple = (False, f"{tool_name} not found or command failed")
@@ -372,6 +544,7 @@ class Validator:
             self.validation_cache[cache_key] = result
             return result
     
+    @traced("validate requirements", "validator")
     def validate_requirements(self, requirements: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate all system requirements
@@ -384,6 +557,14 @@ class Validator:
         """
         errors = []
         
+        # Launch all tool probes at once instead of one after another
+        probes = []
+        if "node" in requirements:
+            probes.append(['node', '--version'])
+        for tool_req in requirements.get("external_tools", {}).values():
+            probes.append(tool_req["command"].split())
+        self.probe_commands(probes)
+        
         # Check Python requirements
         if "python" in requirements:
             python_req = requirements["python"]
@@ -430,6 +611,7 @@ class Validator:
         
         return len(errors) == 0, errors
     
+    @traced("validate component requirements", "validator")
     def validate_component_requirements(self, component_names: List[str], all_requirements: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate requirements for specific components
@@ -490,6 +672,8 @@ class Validator:
             "python_executable": sys.executable
         }
         
+        self.probe_commands([['node', '--version'], ['claude', '--version']])
+        
         # Add Node.js info if available
         node_success, node_msg = self.check_node()
         info["node_available"] = node_success
@@ -589,6 +773,8 @@ class Validator:
             "recommendations": []
         }
         
+        self.probe_commands([['node', '--version'], ['claude', '--version']])
+        
         # Check Python
         python_success, python_msg = self.check_python()
         diagnostics["checks"]["python"] = {
@@ -647,21 +833,8 @@ class Validator:
         ]
         
         for tool_alternatives, display_name in tool_checks:
-            tool_found = False
-            for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32")
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+            # PATH lookup only, no need to spawn which/where
+            tool_found = any(shutil.which(tool) for tool in tool_alternatives)
             
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -683,3 +856,4 @@ class Validator:
     def clear_cache(self) -> None:
         """Clear validation cache"""
         self.validation_cache.clear()
+        self.probe_results.clear()
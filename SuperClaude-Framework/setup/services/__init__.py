@@ -3,14 +3,21 @@ SuperClaude Services Module
 Business logic services for the SuperClaude installation system
 """
 
+from .backup import BackupService, BackupStore
+from .claude_config import ClaudeConfigService
 from .claude_md import CLAUDEMdService
 from .config import ConfigService
 from .files import FileService
+from .mcp_templates import MCPTemplateRegistry
 from .settings import SettingsService
 
 __all__ = [
+    'BackupService',
+    'BackupStore',
+    'ClaudeConfigService',
     'CLAUDEMdService',
     'ConfigService', 
     'FileService',
+    'MCPTemplateRegistry',
     'SettingsService'
 ]
\ No newline at end of file
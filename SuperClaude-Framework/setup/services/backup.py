@@ -0,0 +1,1010 @@
+"""
+Backup engine for SuperClaude installations
+Streams the installation directory into compressed archives, keeps a
+content-addressed, deduplicating snapshot store and restores either of
+them in parallel with rollback
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..utils.logger import get_logger
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+# Top-level directories of the install dir that are never archived
+DEFAULT_EXCLUDES = ("backups", "local")
+
+# Archive file extension per compression method
+ARCHIVE_EXTENSIONS = {
+    "gzip": ".tar.gz",
+    "bzip2": ".tar.bz2",
+    "zstd": ".tar.zst",
+    "none": ".tar"
+}
+
+METADATA_ARCNAME = "backup_metadata.json"
+
+# Sidecar catalog written next to every archive
+CATALOG_SUFFIX = ".catalog.json"
+
+# Location of the snapshot store inside a backup directory
+STORE_DIRNAME = "store"
+
+# Files replaced by the last restore, kept in the install dir's backups until the next one
+PRE_RESTORE_DIRNAME = ".pre_restore"
+
+
+def get_default_workers() -> int:
+    """Number of compression threads to use by default"""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def get_catalog_path(archive_path: Path) -> Path:
+    """Get the sidecar catalog path of an archive"""
+    return archive_path.with_name(f"{archive_path.name}{CATALOG_SUFFIX}")
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write bytes through a temp file in the same directory"""
+    fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _HashingReader:
+    """File wrapper hashing the data tarfile reads while archiving it"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self._hash.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class ParallelGzipWriter:
+    """
+    Write-only file object compressing fixed-size blocks on a thread pool
+
+    Every block becomes an independent gzip member, so the output is a
+    regular multi-member gzip file readable by gzip/tarfile. The block
+    index records where each block starts in the uncompressed stream and
+    in the compressed file.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, fileobj, level: int = 6, workers: Optional[int] = None,
+                 block_size: Optional[int] = None):
+        """
+        Initialize writer
+
+        Args:
+            fileobj: Binary file object receiving the compressed stream
+            level: gzip compression level
+            workers: Number of compression threads
+            block_size: Uncompressed size of each gzip member
+        """
+        self.fileobj = fileobj
+        self.level = level
+        self.workers = workers or get_default_workers()
+        self.block_size = block_size or self.BLOCK_SIZE
+        self.uncompressed_size = 0
+        self.compressed_size = 0
+        self.blocks: List[Tuple[int, int]] = []
+        self._buffer = bytearray()
+        self._pending: Deque[Tuple[int, Any]] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix="superclaude-gzip")
+        self._closed = False
+
+    def write(self, data: bytes) -> int:
+        """Buffer data and hand every full block to the compression pool"""
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def flush(self) -> None:
+        """Blocks are written as they complete; nothing to flush early"""
+
+    def close(self) -> None:
+        """Compress the remaining data and write all pending blocks"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._write_next()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _submit(self, block: bytes) -> None:
+        """Queue a block for compression, bounding the blocks held in memory"""
+        future = self._executor.submit(gzip.compress, block, self.level, mtime=0)
+        self._pending.append((self.uncompressed_size, future))
+        self.uncompressed_size += len(block)
+
+        while len(self._pending) > self.workers * 2:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        """Write the oldest compressed block, preserving stream order"""
+        start, future = self._pending.popleft()
+        data = future.result()
+        self.blocks.append((start, self.compressed_size))
+        self.fileobj.write(data)
+        self.compressed_size += len(data)
+
+
+class BackupService:
+    """Creates and opens backup archives of an installation directory"""
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize backup service
+
+        Args:
+            install_dir: Installation directory to back up
+        """
+        self.install_dir = install_dir
+        self.pre_restore_dir = install_dir / "backups" / PRE_RESTORE_DIRNAME
+        self.logger = get_logger()
+
+    @staticmethod
+    def get_archive_extension(compression: str) -> str:
+        """Get the archive file extension for a compression method"""
+        return ARCHIVE_EXTENSIONS[compression]
+
+    def iter_files(self, exclude: Tuple[str, ...] = DEFAULT_EXCLUDES,
+                   skip: Optional[Path] = None) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Walk the installation directory in a stable order
+
+        Args:
+            exclude: Top-level directory names to leave out
+            skip: A single file to leave out (e.g. the archive being written)
+
+        Yields:
+            Tuples of (archive name, directory entry) for files and symlinks
+        """
+        skip_path = os.path.abspath(skip) if skip else None
+        stack = [(str(self.install_dir), "")]
+
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                self.logger.warning(f"Could not read {directory}: {e}")
+                continue
+
+            subdirs = []
+            for entry in entries:
+                arcname = f"{prefix}{entry.name}"
+                if not prefix and entry.name in exclude:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, f"{arcname}/"))
+                elif skip_path is None or os.path.abspath(entry.path) != skip_path:
+                    yield arcname, entry
+
+            # Visit subdirectories in name order
+            stack.extend(reversed(subdirs))
+
+    def create_archive(self, archive_path: Path, compression: str = "gzip",
+                       metadata: Optional[Dict[str, Any]] = None,
+                       exclude: Tuple[str, ...] = DEFAULT_EXCLUDES,
+                       workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Stream the installation directory into an archive
+
+        Files are read straight into the archive without a staging copy and
+        hashed on the way. gzip compresses independent blocks in parallel,
+        zstd (if installed) uses its own worker threads, bzip2 and none are
+        single-threaded. A sidecar catalog (<archive>.catalog.json) records
+        every member's size, hash and offset plus the gzip block index.
+
+        Args:
+            archive_path: Archive file to create
+            compression: One of "gzip", "bzip2", "zstd" or "none"
+            metadata: Optional metadata stored as backup_metadata.json
+            exclude: Top-level directory names to leave out
+            workers: Number of compression threads
+
+        Returns:
+            Dict with files, bytes, archive_size, duration, throughput (MB/s)
+            and the gzip block index (empty for other compressions)
+
+        Raises:
+            ValueError: If the compression method is unknown or unavailable
+        """
+        if compression not in ARCHIVE_EXTENSIONS:
+            raise ValueError(f"Unknown compression method: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+
+        workers = workers or get_default_workers()
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        start_time = time.time()
+        files_added = 0
+        bytes_added = 0
+        blocks: List[Tuple[int, int]] = []
+        catalog_files: List[Dict[str, Any]] = []
+
+        with open(archive_path, "wb") as raw:
+            if compression == "gzip":
+                stream = ParallelGzipWriter(raw, workers=workers)
+                tar_mode = "w|"
+            elif compression == "zstd":
+                compressor = zstandard.ZstdCompressor(level=3, threads=workers)
+                stream = compressor.stream_writer(raw, closefd=False)
+                tar_mode = "w|"
+            elif compression == "bzip2":
+                stream = raw
+                tar_mode = "w|bz2"
+            else:
+                stream = raw
+                tar_mode = "w|"
+
+            try:
+                with tarfile.open(fileobj=stream, mode=tar_mode) as tar:
+                    if metadata is not None:
+                        data = json.dumps(metadata, indent=2).encode("utf-8")
+                        info = tarfile.TarInfo(METADATA_ARCNAME)
+                        info.size = len(data)
+                        info.mtime = int(time.time())
+                        tar.addfile(info, io.BytesIO(data))
+
+                    for arcname, entry in self.iter_files(exclude, skip=archive_path):
+                        try:
+                            record = self._add_to_archive(tar, entry.path, arcname)
+                            catalog_files.append(record)
+                            files_added += 1
+                            bytes_added += record.get("size", 0)
+                        except OSError as e:
+                            self.logger.warning(f"Could not add {arcname} to backup: {e}")
+            finally:
+                if stream is not raw:
+                    stream.close()
+
+            if isinstance(stream, ParallelGzipWriter):
+                blocks = stream.blocks
+
+        # Sidecar catalog: listing and single-file restore without decompressing
+        catalog = {
+            "archive": archive_path.name,
+            "compression": compression,
+            "created": datetime.now().isoformat(),
+            "metadata": metadata or {},
+            "blocks": blocks,
+            "files": catalog_files
+        }
+        write_bytes_atomic(get_catalog_path(archive_path),
+                           json.dumps(catalog, indent=2).encode("utf-8"))
+
+        duration = time.time() - start_time
+        throughput = bytes_added / (1024 * 1024) / duration if duration > 0 else 0.0
+        stats = {
+            "files": files_added,
+            "bytes": bytes_added,
+            "archive_size": archive_path.stat().st_size,
+            "duration": duration,
+            "throughput": throughput,
+            "blocks": blocks
+        }
+
+        self.logger.info(
+            f"Archived {files_added} files ({bytes_added / (1024 * 1024):.1f}MB) "
+            f"in {duration:.2f}s at {throughput:.1f} MB/s using {compression}"
+        )
+        return stats
+
+    def _add_to_archive(self, tar: tarfile.TarFile, path: str, arcname: str) -> Dict[str, Any]:
+        """
+        Add one file to the archive and describe it for the catalog
+
+        Args:
+            tar: Archive being written
+            path: File to add
+            arcname: Name inside the archive
+
+        Returns:
+            Catalog record with name, type, size, mode and, for regular
+            files, sha256 and the offset of the data in the uncompressed tar
+        """
+        tarinfo = tar.gettarinfo(path, arcname=arcname)
+        record = {"name": arcname, "size": 0, "mode": tarinfo.mode, "mtime": tarinfo.mtime}
+
+        if tarinfo.isreg():
+            with open(path, "rb") as f:
+                reader = _HashingReader(f)
+                tar.addfile(tarinfo, reader)
+            # Data ends on the (512-byte padded) boundary tar.offset now points at
+            padded_size = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+            record.update({
+                "type": "file",
+                "size": tarinfo.size,
+                "sha256": reader.hexdigest(),
+                "offset": tar.offset - padded_size
+            })
+        else:
+            tar.addfile(tarinfo)
+            if tarinfo.issym():
+                record.update({"type": "symlink", "target": tarinfo.linkname})
+            elif tarinfo.islnk():
+                record.update({"type": "hardlink", "target": tarinfo.linkname})
+            else:
+                record["type"] = "other"
+
+        return record
+
+    def load_catalog(self, archive_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load the sidecar catalog of an archive
+
+        Args:
+            archive_path: Archive file
+
+        Returns:
+            Catalog dict, or None for archives without a readable catalog
+        """
+        catalog_path = get_catalog_path(archive_path)
+        if not catalog_path.exists():
+            return None
+
+        try:
+            with open(catalog_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read backup catalog {catalog_path.name}: {e}")
+            return None
+
+    def read_member(self, archive_path: Path, name: str,
+                    catalog: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Read a single file from an archive
+
+        With a catalog, uncompressed and gzip archives are read by seeking
+        to the member (for gzip: to the block holding it) instead of
+        decompressing everything before it. Other archives are scanned.
+
+        Args:
+            archive_path: Archive file
+            name: Member name (path relative to the install dir)
+            catalog: Catalog of the archive (loaded if not given)
+
+        Returns:
+            Catalog-style record; regular files carry their bytes in "data"
+
+        Raises:
+            KeyError: If the archive has no such member
+            ValueError: If the data does not match the catalog hash
+        """
+        catalog = catalog or self.load_catalog(archive_path)
+        if catalog is None or catalog.get("compression") not in ("gzip", "none"):
+            return self._scan_member(archive_path, name)
+
+        records = {record["name"]: record for record in catalog["files"]}
+        record = records[name]
+        if record["type"] == "hardlink":
+            record = dict(records[record["target"]], name=name)
+        if record["type"] != "file":
+            return record
+
+        offset = record["offset"]
+        with open(archive_path, "rb") as raw:
+            if catalog["compression"] == "none":
+                raw.seek(offset)
+                data = raw.read(record["size"])
+            else:
+                # Every block is a gzip member, so decompression can start at any block
+                block_start, compressed_start = 0, 0
+                for start, compressed in catalog["blocks"]:
+                    if start > offset:
+                        break
+                    block_start, compressed_start = start, compressed
+                raw.seek(compressed_start)
+                with gzip.GzipFile(fileobj=raw, mode="rb") as stream:
+                    stream.read(offset - block_start)
+                    data = stream.read(record["size"])
+
+        if hashlib.sha256(data).hexdigest() != record["sha256"]:
+            raise ValueError(f"Backup member {name} does not match its catalog hash")
+        return dict(record, data=data)
+
+    def _scan_member(self, archive_path: Path, name: str) -> Dict[str, Any]:
+        """Read a single member by scanning the archive (no usable catalog)"""
+        with self.open_archive(archive_path) as tar:
+            member = tar.getmember(name)
+            record = {"name": name, "size": member.size, "mode": member.mode, "mtime": member.mtime}
+            if member.issym():
+                record.update({"type": "symlink", "target": member.linkname})
+            elif member.isreg() or member.islnk():
+                record.update({"type": "file", "data": tar.extractfile(member).read()})
+            else:
+                record["type"] = "other"
+            return record
+
+    def restore_archive(self, archive_path: Path, overwrite: bool = False,
+                        paths: Optional[List[str]] = None,
+                        workers: Optional[int] = None) -> int:
+        """
+        Restore an archive (or selected files of it) into the install dir
+
+        Args:
+            archive_path: Archive file to restore
+            overwrite: Replace files that already exist
+            paths: Restore only these relative paths, read through the catalog
+            workers: Number of restore threads
+
+        Returns:
+            Number of files restored
+
+        Raises:
+            ValueError: If one of the paths is not part of the archive
+        """
+        if paths:
+            catalog = self.load_catalog(archive_path)
+            entries = []
+            for path in paths:
+                try:
+                    entries.append(self.read_member(archive_path, path, catalog))
+                except KeyError:
+                    raise ValueError(f"{path} is not part of backup {archive_path.name}")
+            return self.restore(entries, overwrite=overwrite, workers=workers)
+
+        with self.open_archive(archive_path) as tar:
+            return self.restore(self._iter_archive_entries(tar),
+                                overwrite=overwrite, workers=workers)
+
+    def _iter_archive_entries(self, tar: tarfile.TarFile) -> Iterator[Dict[str, Any]]:
+        """Read archive members in order as restore entries"""
+        for member in tar:
+            if member.name == METADATA_ARCNAME:
+                continue
+
+            entry = {"name": member.name, "mode": member.mode, "mtime": member.mtime}
+            if member.isdir():
+                entry["type"] = "dir"
+            elif member.issym():
+                entry.update({"type": "symlink", "target": member.linkname})
+            elif member.isreg() or member.islnk():
+                entry.update({"type": "file", "data": tar.extractfile(member).read()})
+            else:
+                entry["type"] = "other"
+            yield entry
+
+    def restore(self, entries: Iterable[Dict[str, Any]], overwrite: bool = False,
+                workers: Optional[int] = None) -> int:
+        """
+        Restore entries into the installation directory with rollback
+
+        Before a path is written, its current file is captured by hardlinking
+        it into pre_restore_dir (no bytes are copied); only the restore
+        targets are captured. Files are then written on a worker pool through
+        temp files replaced into place, which leaves the hardlinked originals
+        untouched. If any entry fails, every path written so far is put back
+        (or removed if it did not exist), directories the restore created are
+        removed again and the error is re-raised. After a successful restore
+        the replaced files stay in pre_restore_dir until the next restore.
+
+        Args:
+            entries: Records with name, type ("file", "symlink", "dir" or
+                     "other"), mode, mtime/mtime_ns, target (symlinks) and
+                     either "data" bytes or a "load" callable (files)
+            overwrite: Replace files that already exist
+            workers: Number of restore threads
+
+        Returns:
+            Number of files restored
+        """
+        workers = workers or get_default_workers()
+        snapshot_dir = self.pre_restore_dir
+        if os.path.lexists(snapshot_dir):
+            shutil.rmtree(snapshot_dir)
+
+        written: List[str] = []
+        created_dirs: List[Path] = []
+        known_dirs: Set[Path] = set()
+        captured = 0
+        pending: Deque[Future] = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=workers,
+                                    thread_name_prefix="superclaude-restore") as executor:
+                try:
+                    for entry in entries:
+                        target_path = self._get_restore_target(entry["name"])
+                        if entry["type"] == "other":
+                            self.logger.warning(f"Skipping special file: {entry['name']}")
+                            continue
+                        if entry["type"] != "dir" and os.path.lexists(target_path) and not overwrite:
+                            self.logger.warning(f"Skipping existing file: {target_path}")
+                            continue
+
+                        directory = target_path if entry["type"] == "dir" else target_path.parent
+                        created_dirs.extend(self._find_missing_dirs(directory, known_dirs))
+                        if entry["type"] != "dir":
+                            if self._capture_path(snapshot_dir, entry["name"]):
+                                captured += 1
+                            written.append(entry["name"])
+                        pending.append(executor.submit(self._write_entry, target_path, entry))
+
+                        # Bound the file contents held in memory
+                        while len(pending) > workers * 4:
+                            pending.popleft().result()
+
+                    while pending:
+                        pending.popleft().result()
+                except BaseException:
+                    for future in pending:
+                        future.cancel()
+                    raise
+        except BaseException as e:
+            self.logger.error(f"Restore failed ({e}), rolling back {len(written)} files")
+            self._rollback(snapshot_dir, written, created_dirs)
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            raise
+
+        if captured:
+            self.logger.info(f"Replaced files kept in {snapshot_dir} until the next restore")
+        return len(written)
+
+    def _capture_path(self, snapshot_dir: Path, name: str) -> bool:
+        """
+        Capture the current file at a restore target before it is replaced
+
+        Files are hardlinked, falling back to copying where hardlinks are not
+        supported; symlinks are recreated as symlinks.
+
+        Args:
+            snapshot_dir: Pre-restore directory
+            name: Install-dir relative path of the restore target
+
+        Returns:
+            True if a file was captured, False if the target does not exist
+
+        Raises:
+            OSError: If an existing file cannot be captured
+        """
+        source = self.install_dir / name
+        if not os.path.lexists(source) or (os.path.isdir(source) and not os.path.islink(source)):
+            return False
+        destination = snapshot_dir / name
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if os.path.islink(source):
+            os.symlink(os.readlink(source), destination)
+        else:
+            try:
+                os.link(source, destination)
+            except OSError:
+                shutil.copy2(source, destination)
+        return True
+
+    def _find_missing_dirs(self, directory: Path, known: Set[Path]) -> List[Path]:
+        """Get the directories below the install dir a write into directory will create"""
+        missing = []
+        while directory != self.install_dir and directory not in known and not os.path.isdir(directory):
+            known.add(directory)
+            missing.append(directory)
+            directory = directory.parent
+        return missing
+
+    def _get_restore_target(self, name: str) -> Path:
+        """Map an entry name into the install dir, refusing paths that escape it"""
+        target_path = self.install_dir / name
+        root = os.path.abspath(self.install_dir)
+        resolved = os.path.abspath(target_path)
+        if os.path.isabs(name) or (resolved != root and not resolved.startswith(root + os.sep)):
+            raise ValueError(f"Unsafe path in backup: {name}")
+        return target_path
+
+    def _write_entry(self, target_path: Path, entry: Dict[str, Any]) -> None:
+        """Write one entry next to its target and replace it into place"""
+        if entry["type"] == "dir":
+            target_path.mkdir(parents=True, exist_ok=True)
+            return
+
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        if entry["type"] == "symlink":
+            temp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.{id(entry)}.restore")
+            os.symlink(entry["target"], temp_path)
+            os.replace(temp_path, target_path)
+            return
+
+        data = entry["data"] if "data" in entry else entry["load"]()
+        fd, temp_path = tempfile.mkstemp(dir=str(target_path.parent), prefix=f".{target_path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(temp_path, entry.get("mode", 0o644))
+            if "mtime_ns" in entry:
+                os.utime(temp_path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            elif "mtime" in entry:
+                os.utime(temp_path, (entry["mtime"], entry["mtime"]))
+            os.replace(temp_path, target_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _rollback(self, snapshot_dir: Path, names: List[str], created_dirs: List[Path]) -> None:
+        """Put restored paths back to their pre-restore state and remove created directories"""
+        for name in names:
+            target_path = self.install_dir / name
+            original = snapshot_dir / name
+            try:
+                if os.path.lexists(original):
+                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(original, target_path)
+                elif os.path.islink(target_path) or os.path.isfile(target_path):
+                    target_path.unlink()
+            except OSError as e:
+                self.logger.warning(f"Could not roll back {name}: {e}")
+
+        # Deepest first; directories still holding other files are left alone
+        for directory in sorted(created_dirs, key=lambda d: len(d.parts), reverse=True):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+
+    @contextmanager
+    def open_archive(self, archive_path: Path) -> Iterator[tarfile.TarFile]:
+        """
+        Open a backup archive for reading, whatever its compression
+
+        Args:
+            archive_path: Archive file to open
+
+        Yields:
+            Open tarfile.TarFile
+        """
+        if archive_path.name.endswith(".zst"):
+            if not ZSTD_AVAILABLE:
+                raise ValueError("Reading zstd backups requires the 'zstandard' package")
+            # zstd streams are not seekable; spool them so members can be looked up
+            with tempfile.TemporaryFile() as spool:
+                with open(archive_path, "rb") as raw:
+                    zstandard.ZstdDecompressor().copy_stream(raw, spool)
+                spool.seek(0)
+                with tarfile.open(fileobj=spool, mode="r") as tar:
+                    yield tar
+        else:
+            # "r" auto-detects gzip (including multi-member), bzip2 and plain tar
+            with tarfile.open(archive_path, "r") as tar:
+                yield tar
+
+
+class BackupStore:
+    """
+    Content-addressed backup repository
+
+    File contents are stored once as zlib-compressed blobs named by their
+    sha256 under objects/, and every snapshot is a small JSON manifest under
+    snapshots/ mapping relative paths to blob hashes. Creating a snapshot only
+    writes blobs that are not stored yet, and files whose size and mtime match
+    the previous snapshot are not even re-read.
+    """
+
+    def __init__(self, backup_dir: Path):
+        """
+        Initialize backup store
+
+        Args:
+            backup_dir: Backup directory holding the store (e.g. ~/.claude/backups)
+        """
+        self.store_dir = backup_dir / STORE_DIRNAME
+        self.objects_dir = self.store_dir / "objects"
+        self.snapshots_dir = self.store_dir / "snapshots"
+        self.logger = get_logger()
+
+    @classmethod
+    def for_snapshot(cls, manifest_path: Path) -> "BackupStore":
+        """Get the store a snapshot manifest belongs to"""
+        return cls(manifest_path.parent.parent.parent)
+
+    def get_snapshot_path(self, name: str) -> Path:
+        """Get the manifest path of a snapshot"""
+        return self.snapshots_dir / f"{name}.json"
+
+    def get_object_path(self, digest: str) -> Path:
+        """Get the blob path for a content hash"""
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def create_snapshot(self, install_dir: Path, name: str,
+                        metadata: Optional[Dict[str, Any]] = None,
+                        exclude: Tuple[str, ...] = DEFAULT_EXCLUDES,
+                        workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Snapshot an installation directory into the store
+
+        Args:
+            install_dir: Directory to snapshot
+            name: Snapshot name
+            metadata: Optional backup metadata stored in the manifest
+            exclude: Top-level directory names to leave out
+            workers: Number of hashing/compression threads
+
+        Returns:
+            Dict with files, bytes, new_objects, new_bytes, duration and
+            throughput (MB/s)
+        """
+        start_time = time.time()
+        previous = self._load_latest_files()
+        files: Dict[str, Dict[str, Any]] = {}
+        to_store: List[Tuple[str, str]] = []
+
+        for arcname, entry in BackupService(install_dir).iter_files(exclude):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+                if entry.is_symlink():
+                    files[arcname] = {"type": "symlink", "target": os.readlink(entry.path)}
+                    continue
+
+                record = {
+                    "type": "file",
+                    "size": stat.st_size,
+                    "mode": stat.st_mode & 0o7777,
+                    "mtime_ns": stat.st_mtime_ns
+                }
+                known = previous.get(arcname)
+                if (known and known.get("type") == "file"
+                        and known.get("size") == stat.st_size
+                        and known.get("mtime_ns") == stat.st_mtime_ns
+                        and self.get_object_path(known["sha256"]).exists()):
+                    record["sha256"] = known["sha256"]
+                else:
+                    to_store.append((arcname, entry.path))
+                files[arcname] = record
+            except OSError as e:
+                self.logger.warning(f"Could not add {arcname} to snapshot: {e}")
+
+        new_objects = 0
+        new_bytes = 0
+        if to_store:
+            with ThreadPoolExecutor(max_workers=workers or get_default_workers(),
+                                    thread_name_prefix="superclaude-store") as executor:
+                results = executor.map(lambda item: self._store_file(item[1]), to_store)
+                for (arcname, _), result in zip(to_store, results):
+                    if result is None:
+                        self.logger.warning(f"Could not add {arcname} to snapshot")
+                        files.pop(arcname, None)
+                        continue
+                    digest, written = result
+                    files[arcname]["sha256"] = digest
+                    if written:
+                        new_objects += 1
+                        new_bytes += written
+
+        manifest = {
+            "name": name,
+            "created": datetime.now().isoformat(),
+            "metadata": metadata or {},
+            "files": files
+        }
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(self.get_snapshot_path(name),
+                           json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+        duration = time.time() - start_time
+        total_bytes = sum(f.get("size", 0) for f in files.values())
+        throughput = total_bytes / (1024 * 1024) / duration if duration > 0 else 0.0
+        self.logger.info(
+            f"Snapshot {name}: {len(files)} files ({total_bytes / (1024 * 1024):.1f}MB), "
+            f"{new_objects} new objects ({new_bytes / 1024:.1f}KB) "
+            f"in {duration:.2f}s at {throughput:.1f} MB/s"
+        )
+        return {
+            "files": len(files),
+            "bytes": total_bytes,
+            "new_objects": new_objects,
+            "new_bytes": new_bytes,
+            "duration": duration,
+            "throughput": throughput
+        }
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """
+        Read all snapshot manifests
+
+        Returns:
+            List of manifests (newest first), each with an added "path" key
+        """
+        snapshots = []
+        if not self.snapshots_dir.exists():
+            return snapshots
+
+        for manifest_path in self.snapshots_dir.glob("*.json"):
+            manifest = self.load_snapshot(manifest_path)
+            if manifest is not None:
+                snapshots.append(manifest)
+
+        snapshots.sort(key=lambda m: m.get("created", ""), reverse=True)
+        return snapshots
+
+    def load_snapshot(self, manifest_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load one snapshot manifest
+
+        Args:
+            manifest_path: Manifest file of the snapshot
+
+        Returns:
+            Manifest dict with an added "path" key, or None if unreadable
+        """
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            manifest["path"] = manifest_path
+            return manifest
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read snapshot {manifest_path.name}: {e}")
+            return None
+
+    def read_object(self, digest: str) -> bytes:
+        """
+        Read and verify the contents of a blob
+
+        Args:
+            digest: sha256 of the contents
+
+        Returns:
+            Decompressed file contents
+
+        Raises:
+            ValueError: If the blob is corrupt
+        """
+        with open(self.get_object_path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt backup object: {digest}")
+        return data
+
+    def restore_snapshot(self, manifest: Dict[str, Any], target_dir: Path,
+                         overwrite: bool = False,
+                         paths: Optional[List[str]] = None,
+                         workers: Optional[int] = None) -> int:
+        """
+        Rebuild a snapshot into a directory
+
+        Blobs are read, verified and written on a worker pool; see
+        BackupService.restore for the rollback behaviour.
+
+        Args:
+            manifest: Snapshot manifest as returned by load_snapshot
+            target_dir: Directory to restore into
+            overwrite: Replace files that already exist
+            paths: Restore only these relative paths (default: everything)
+            workers: Number of restore threads
+
+        Returns:
+            Number of files restored
+
+        Raises:
+            ValueError: If one of the paths is not part of the snapshot
+        """
+        files = manifest.get("files", {})
+        if paths is not None:
+            missing = [path for path in paths if path not in files]
+            if missing:
+                raise ValueError(f"Not part of the snapshot: {', '.join(missing)}")
+            files = {path: files[path] for path in paths}
+
+        def entries() -> Iterator[Dict[str, Any]]:
+            for arcname, record in files.items():
+                entry = dict(record, name=arcname)
+                if record.get("type") == "file":
+                    entry["load"] = lambda digest=record["sha256"]: self.read_object(digest)
+                yield entry
+
+        return BackupService(target_dir).restore(entries(), overwrite=overwrite, workers=workers)
+
+    def delete_snapshot(self, name: str) -> None:
+        """Delete a snapshot manifest (its blobs are freed by prune)"""
+        self.get_snapshot_path(name).unlink()
+
+    def prune(self) -> Tuple[int, int]:
+        """
+        Delete blobs no longer referenced by any snapshot
+
+        Returns:
+            Tuple of (objects removed, bytes freed)
+        """
+        referenced = set()
+        for manifest in self.list_snapshots():
+            for record in manifest.get("files", {}).values():
+                if "sha256" in record:
+                    referenced.add(record["sha256"])
+
+        removed = 0
+        freed = 0
+        if not self.objects_dir.exists():
+            return removed, freed
+
+        for bucket in self.objects_dir.iterdir():
+            if not bucket.is_dir():
+                continue
+            for blob in bucket.iterdir():
+                if bucket.name + blob.name in referenced:
+                    continue
+                try:
+                    freed += blob.stat().st_size
+                    blob.unlink()
+                    removed += 1
+                except OSError as e:
+                    self.logger.warning(f"Could not remove backup object {blob.name}: {e}")
+
+        return removed, freed
+
+    def _load_latest_files(self) -> Dict[str, Dict[str, Any]]:
+        """Get the file records of the newest snapshot, used to skip re-hashing"""
+        snapshots = self.list_snapshots()
+        return snapshots[0].get("files", {}) if snapshots else {}
+
+    def _store_file(self, path: str) -> Optional[Tuple[str, int]]:
+        """
+        Hash a file and store its contents as a blob if not present yet
+
+        Args:
+            path: File to store
+
+        Returns:
+            Tuple of (sha256, compressed bytes written or 0 if already stored),
+            or None if the file could not be read
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self.get_object_path(digest)
+        if object_path.exists():
+            return digest, 0
+
+        compressed = zlib.compress(data, 6)
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        write_bytes_atomic(object_path, compressed)
+        return digest, len(compressed)
@@ -0,0 +1,320 @@
+"""
+Targeted updates of Claude's user configuration file (~/.claude.json)
+
+The file holds per-project history and grows to many megabytes, while the
+installer only ever touches a single top-level key (mcpServers). Instead of
+parsing and re-serializing the whole document, the byte range of that key's
+value is located and spliced, everything else is written back verbatim.
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from json.decoder import scanstring
+from typing import IO, Any, Iterator, NamedTuple, Optional
+from pathlib import Path
+from ..utils.logger import get_logger
+
+# Platform-specific file locking imports
+try:
+    if sys.platform == "win32":
+        import msvcrt
+        LOCKING_AVAILABLE = "windows"
+    else:
+        import fcntl
+        LOCKING_AVAILABLE = "unix"
+except ImportError:
+    LOCKING_AVAILABLE = None
+
+
+# The configuration itself is replaced by rename, so writers lock a sidecar file
+LOCK_SUFFIX = ".lock"
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+class _MemberLayout(NamedTuple):
+    """Position of one top-level member and its neighbours in the document text"""
+    object_start: int            # Index of the top-level '{'
+    object_end: int              # Index of the top-level '}'
+    key_start: Optional[int]     # Index of the member's key string (None if absent)
+    value_start: Optional[int]
+    value_end: Optional[int]
+    previous_end: Optional[int]  # End of the value before the member (or of the last member)
+    next_start: Optional[int]    # Start of the key after the member
+    indent: Optional[str]        # Indentation of top-level keys (None for single-line JSON)
+
+
+class ClaudeConfigService:
+    """Reads and patches single top-level keys of ~/.claude.json"""
+
+    def __init__(self, config_path: Optional[Path] = None):
+        """
+        Initialize ClaudeConfigService
+
+        Args:
+            config_path: Path of the Claude configuration file (default ~/.claude.json)
+        """
+        self.config_path = config_path or Path.home() / ".claude.json"
+        self.lock_path = self.config_path.with_name(self.config_path.name + LOCK_SUFFIX)
+        self.logger = get_logger()
+
+    def read_key(self, key: str, default: Any = None) -> Any:
+        """
+        Read the value of one top-level key
+
+        Only that value is decoded into Python objects; the other members are
+        merely skipped.
+
+        Args:
+            key: Top-level key
+            default: Value returned if the key is absent
+
+        Returns:
+            Decoded value of the key or default
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a JSON object
+        """
+        text = self._read_text()
+        layout = self._locate(text, key)
+        if layout.key_start is None:
+            return default
+        value, _ = _decoder.raw_decode(text, layout.value_start)
+        return value
+
+    def patch_key(self, key: str, value: Any) -> bool:
+        """
+        Replace (or add) the value of one top-level key in place
+
+        The new document is written to a temporary file and renamed over the
+        configuration.
+
+        Args:
+            key: Top-level key
+            value: New JSON-serializable value
+
+        Returns:
+            True if the file was changed, False if the value was already current
+
+        Raises:
+            OSError: If the file cannot be read or written
+            ValueError: If the file is not a JSON object
+        """
+        with self._locked():
+            text = self._read_text()
+            layout = self._locate(text, key)
+
+            if layout.key_start is not None:
+                current = text[layout.value_start:layout.value_end]
+                if _decoder.raw_decode(current)[0] == value:
+                    return False
+
+            raw_value = self._render_value(value, layout.indent)
+            self._write_text(self._splice(text, key, raw_value, layout))
+
+        self.logger.debug(f"Patched '{key}' in {self.config_path}")
+        return True
+
+    def _read_text(self) -> str:
+        """Read the configuration file"""
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Hold an advisory lock during read-modify-write
+
+        The lock is taken on a sidecar file (~/.claude.json.lock), whether or
+        not the configuration exists yet: the configuration's own inode is
+        swapped out by every rename, so a lock on it would not exclude a
+        writer that opened the new file. The sidecar is removed again on
+        release.
+
+        The lock only serializes SuperClaude processes. Claude Code does not
+        take it, so its own writes to ~/.claude.json are not coordinated.
+        """
+        if LOCKING_AVAILABLE is None:
+            yield
+            return
+
+        lock_handle = self._acquire_lock_file()
+        try:
+            yield
+        finally:
+            try:
+                if LOCKING_AVAILABLE == "unix":
+                    # Unlinked while still held: waiters notice the stale inode and retry
+                    self._remove_lock_file()
+                    fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+                else:
+                    msvcrt.locking(lock_handle.fileno(), msvcrt.LK_UNLCK, 1)
+            finally:
+                lock_handle.close()
+            if LOCKING_AVAILABLE == "windows":
+                # Fails harmlessly while another process has the file open
+                self._remove_lock_file()
+
+    def _acquire_lock_file(self) -> IO[str]:
+        """Open and lock the sidecar lock file, retrying if it was removed meanwhile"""
+        while True:
+            lock_handle = open(self.lock_path, 'a')
+            try:
+                if LOCKING_AVAILABLE == "windows":
+                    msvcrt.locking(lock_handle.fileno(), msvcrt.LK_LOCK, 1)
+                    return lock_handle
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+                # The previous holder may have removed the file before we got the lock
+                try:
+                    current = os.stat(self.lock_path)
+                except FileNotFoundError:
+                    current = None
+                held = os.fstat(lock_handle.fileno())
+                if current is not None and (current.st_dev, current.st_ino) == (held.st_dev, held.st_ino):
+                    return lock_handle
+            except BaseException:
+                lock_handle.close()
+                raise
+            lock_handle.close()
+
+    def _remove_lock_file(self) -> None:
+        """Delete the sidecar lock file"""
+        try:
+            os.unlink(self.lock_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _locate(text: str, key: str) -> _MemberLayout:
+        """
+        Find a top-level member without building the other members' values
+
+        Members are skipped with the C JSON scanner; duplicate keys resolve
+        to the last occurrence, as in json.loads.
+
+        Raises:
+            ValueError: If the text is not a JSON object
+        """
+        idx = _WHITESPACE.match(text, 0).end()
+        if text[idx:idx + 1] != '{':
+            raise ValueError("Claude configuration is not a JSON object")
+        object_start = idx
+        idx = _WHITESPACE.match(text, idx + 1).end()
+
+        found = None
+        indent = None
+        first_key = True
+        last_end = None
+        pending_next = False
+        next_start = None
+
+        if text[idx:idx + 1] != '}':
+            while True:
+                if text[idx:idx + 1] != '"':
+                    raise ValueError(f"Invalid JSON at offset {idx}: expected a key")
+                key_start = idx
+                if pending_next:
+                    next_start = key_start
+                    pending_next = False
+                if first_key:
+                    # Pretty-printed documents put the first key on its own line
+                    line_start = text.rfind('\n', object_start, key_start)
+                    indent = text[line_start + 1:key_start] if line_start != -1 else None
+                    first_key = False
+
+                name, idx = scanstring(text, idx + 1)
+                idx = _WHITESPACE.match(text, idx).end()
+                if text[idx:idx + 1] != ':':
+                    raise ValueError(f"Invalid JSON at offset {idx}: expected ':'")
+                value_start = _WHITESPACE.match(text, idx + 1).end()
+                _, value_end = _decoder.raw_decode(text, value_start)
+
+                if name == key:
+                    found = (key_start, value_start, value_end, last_end)
+                    next_start = None
+                    pending_next = True
+                last_end = value_end
+
+                idx = _WHITESPACE.match(text, value_end).end()
+                if text[idx:idx + 1] == ',':
+                    idx = _WHITESPACE.match(text, idx + 1).end()
+                    continue
+                if text[idx:idx + 1] == '}':
+                    break
+                raise ValueError(f"Invalid JSON at offset {idx}: expected ',' or '}}'")
+
+        object_end = idx
+        if text[_WHITESPACE.match(text, object_end + 1).end():].strip():
+            raise ValueError("Unexpected data after the Claude configuration object")
+
+        if found is None:
+            return _MemberLayout(object_start, object_end, None, None, None, last_end, None, indent)
+
+        key_start, value_start, value_end, previous_end = found
+        return _MemberLayout(object_start, object_end, key_start, value_start, value_end,
+                             previous_end, next_start, indent)
+
+    @staticmethod
+    def _render_value(value: Any, indent: Optional[str]) -> str:
+        """Serialize a value the way the surrounding document is formatted"""
+        if indent is None:
+            return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        return json.dumps(value, ensure_ascii=False, indent=indent).replace("\n", "\n" + indent)
+
+    @staticmethod
+    def _splice(text: str, key: str, raw_value: Optional[str], layout: _MemberLayout) -> str:
+        """
+        Replace, insert or (raw_value None) remove a top-level member
+
+        Returns:
+            New document text
+        """
+        if layout.key_start is not None:
+            if raw_value is not None:
+                return text[:layout.value_start] + raw_value + text[layout.value_end:]
+            # Remove the member together with one separating comma
+            if layout.previous_end is not None:
+                return text[:layout.previous_end] + text[layout.value_end:]
+            if layout.next_start is not None:
+                return text[:layout.key_start] + text[layout.next_start:]
+            return text[:layout.object_start + 1] + text[layout.object_end:]
+
+        if raw_value is None:
+            return text
+
+        member = json.dumps(key) + (": " if layout.indent is not None else ":") + raw_value
+        if layout.previous_end is not None:
+            separator = ",\n" + layout.indent if layout.indent is not None else ","
+            return text[:layout.previous_end] + separator + member + text[layout.previous_end:]
+        # Empty object
+        return text[:layout.object_start + 1] + "\n  " + member + "\n" + text[layout.object_end:]
+
+    def _write_text(self, text: str) -> None:
+        """Replace the configuration file atomically"""
+        self._write_atomic(self.config_path, text)
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        """Write text to a temporary file next to path and rename it into place"""
+        fd, temp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            if path.exists():
+                shutil.copymode(path, temp_name)
+            os.replace(temp_name, path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
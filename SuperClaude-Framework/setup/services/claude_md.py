@@ -2,10 +2,53 @@
 CLAUDE.md Manager for preserving user customizations while managing framework imports
 """
 
+import os
 import re
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Set, Dict, Optional
+from typing import List, Set, Dict, Iterator, Optional
+from .files import default_file_mode
 from ..utils.logger import get_logger
+from ..utils.tracing import traced
+
+
+# Serializes CLAUDE.md updates from components installed in parallel
+_claude_md_lock = threading.RLock()
+
+FRAMEWORK_MARKER = "# ═══════════════════════════════════════════════════\n# SuperClaude Framework Components"
+
+_IMPORT_RE = re.compile(r'^@([^\s\n]+\.md)\s*$', re.MULTILINE)
+
+DEFAULT_CONTENT = """# SuperClaude Entry Point
+
+This file serves as the entry point for the SuperClaude framework.
+You can add your own custom instructions and configurations here.
+
+The SuperClaude framework components will be automatically imported below.
+"""
+
+
+class _ClaudeMdDocument:
+    """Parsed CLAUDE.md shared by all services of one install directory during a session"""
+    
+    def __init__(self):
+        self.loaded = False
+        self.original: Optional[str] = None  # Content on disk, None if the file does not exist
+        self.content = ""
+        self.user_content = ""
+        self.imports: Dict[str, List[str]] = {}
+        self.imported: Set[str] = set()
+        self.added = 0    # Imports added during the session, reported once written
+        self.removed = 0  # Imports removed during the session, reported once written
+        self.depth = 0
+        self.failed = False
+
+
+# Open document sessions keyed by resolved CLAUDE.md path
+_documents: Dict[Path, _ClaudeMdDocument] = {}
 
 
 class CLAUDEMdService:
@@ -20,8 +63,121 @@ class CLAUDEMdService:
         """
         self.install_dir = install_dir
         self.claude_md_path = install_dir / "CLAUDE.md"
+        self._document_key = self.claude_md_path.expanduser().resolve()
         self.logger = get_logger()
     
+    @contextmanager
+    def document_session(self) -> Iterator[None]:
+        """
+        Batch CLAUDE.md changes into a single write
+        
+        CLAUDE.md is read once, on first use inside the outermost session;
+        add_imports/remove_imports on any CLAUDEMdService of the same install
+        directory then update the parsed document in memory. When the
+        outermost session exits cleanly the document is rendered and written
+        atomically, only if its content changed. Changes are discarded if the
+        session exits with an exception.
+        
+        Nested sessions (including from other threads) join the open one.
+        """
+        key = self._document_key
+        with _claude_md_lock:
+            document = _documents.get(key)
+            if document is None:
+                document = _ClaudeMdDocument()
+                _documents[key] = document
+            document.depth += 1
+        
+        try:
+            yield
+        except BaseException:
+            document.failed = True
+            raise
+        finally:
+            with _claude_md_lock:
+                document.depth -= 1
+                if document.depth == 0:
+                    del _documents[key]
+                    if not document.failed:
+                        self._save_document(document)
+    
+    def _get_document(self) -> _ClaudeMdDocument:
+        """
+        Get the document of the open session, reading CLAUDE.md on first use
+        
+        Raises:
+            OSError, UnicodeDecodeError: If CLAUDE.md exists but cannot be read
+        """
+        document = _documents[self._document_key]
+        if not document.loaded:
+            try:
+                with open(self.claude_md_path, 'r', encoding='utf-8') as f:
+                    document.original = f.read()
+            except FileNotFoundError:
+                document.original = None
+            self._parse_document(document, document.original or "")
+            document.loaded = True
+        return document
+    
+    @traced("CLAUDE.md parse", "io")
+    def _parse_document(self, document: _ClaudeMdDocument, content: str) -> None:
+        """Split content into user content and categorized framework imports"""
+        document.content = content
+        document.user_content = self.extract_user_content(content)
+        document.imports = self._parse_existing_framework_imports(content)
+        document.imported = set(_IMPORT_RE.findall(content))
+    
+    def _render_document(self, document: _ClaudeMdDocument) -> None:
+        """Rebuild the document content from user content and import sections"""
+        new_content_parts = []
+        
+        # Add user content
+        if document.user_content.strip():
+            new_content_parts.append(document.user_content)
+            new_content_parts.append("")  # Add blank line before framework section
+        
+        # Add organized framework imports
+        framework_section = self.organize_imports_by_category(document.imports)
+        if framework_section:
+            new_content_parts.append(framework_section)
+        
+        document.content = "\n".join(new_content_parts)
+        document.imported = set(_IMPORT_RE.findall(document.content))
+    
+    @traced("CLAUDE.md write", "io")
+    def _save_document(self, document: _ClaudeMdDocument) -> None:
+        """Write the document atomically if its content differs from the file"""
+        if not document.loaded or document.content == document.original:
+            self.logger.debug("CLAUDE.md unchanged, not writing")
+            return
+        
+        self.claude_md_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=str(self.claude_md_path.parent),
+                                         prefix=".CLAUDE.md.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(document.content)
+            if self.claude_md_path.exists():
+                shutil.copymode(self.claude_md_path, temp_name)
+            else:
+                os.chmod(temp_name, default_file_mode())
+            os.replace(temp_name, self.claude_md_path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        
+        if document.original is None:
+            self.logger.info("Created CLAUDE.md")
+        else:
+            self.logger.debug("Wrote CLAUDE.md")
+        if document.added:
+            self.logger.success(f"Updated CLAUDE.md with {document.added} new imports")
+        if document.removed:
+            self.logger.info(f"Removed {document.removed} imports from CLAUDE.md")
+    
     def read_existing_imports(self) -> Set[str]:
         """
         Parse CLAUDE.md for existing @import statements
@@ -29,6 +185,11 @@ class CLAUDEMdService:
         Returns:
             Set of already imported filenames (without @)
         """
+        with _claude_md_lock:
+            document = _documents.get(self._document_key)
+            if document is not None and document.loaded:
+                return set(document.imported)
+        
         existing_imports = set()
         
         if not self.claude_md_path.exists():
@@ -38,10 +199,8 @@ class CLAUDEMdService:
             with open(self.claude_md_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Find all @import statements using regex
-            import_pattern = r'^@([^\s\n]+\.md)\s*$'
-            matches = re.findall(import_pattern, content, re.MULTILINE)
-            existing_imports.update(matches)
+            # Find all @import statements
+            existing_imports.update(_IMPORT_RE.findall(content))
             
             self.logger.debug(f"Found existing imports: {existing_imports}")
             
@@ -57,6 +216,11 @@ class CLAUDEMdService:
         Returns:
             Existing content or empty string if file doesn't exist
         """
+        with _claude_md_lock:
+            document = _documents.get(self._document_key)
+            if document is not None and document.loaded:
+                return document.content
+        
         if not self.claude_md_path.exists():
             return ""
         
@@ -78,10 +242,8 @@ class CLAUDEMdService:
             User content without framework imports
         """
         # Look for framework imports section marker
-        framework_marker = "# ═══════════════════════════════════════════════════\n# SuperClaude Framework Components"
-        
-        if framework_marker in content:
-            user_content = content.split(framework_marker)[0].rstrip()
+        if FRAMEWORK_MARKER in content:
+            user_content = content.split(FRAMEWORK_MARKER)[0].rstrip()
         else:
             # If no framework section exists, preserve all content
             user_content = content.rstrip()
@@ -123,6 +285,9 @@ class CLAUDEMdService:
         """
         Add new imports with duplicate checking and user content preservation
         
+        Inside a document_session() the imports are registered in memory and
+        written when the session ends; otherwise CLAUDE.md is updated at once.
+        
         Args:
             files: List of filenames to import
             category: Category name for organizing imports
@@ -131,53 +296,25 @@ class CLAUDEMdService:
             True if successful, False otherwise
         """
         try:
-            # Ensure CLAUDE.md exists
-            self.ensure_claude_md_exists()
-            
-            # Read existing content and imports
-            existing_content = self.read_existing_content()
-            existing_imports = self.read_existing_imports()
-            
-            # Filter out files already imported
-            new_files = [f for f in files if f not in existing_imports]
-            
-            if not new_files:
-                self.logger.info("All files already imported, no changes needed")
-                return True
-            
-            self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
-            
-            # Extract user content (preserve everything before framework section)
-            user_content = self.extract_user_content(existing_content)
-            
-            # Parse existing framework imports by category
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
+            with _claude_md_lock, self.document_session():
+                # Ensure CLAUDE.md exists
+                document = self._get_document()
+                self._ensure_default_content(document)
+                
+                # Filter out files already imported
+                new_files = [f for f in files if f not in document.imported]
+                
+                if not new_files:
+                    self.logger.info("All files already imported, no changes needed")
+                    return True
+                
+                self.logger.info(f"Adding {len(new_files)} new imports to category '{category}': {new_files}")
+                
+                # Add new files to the specified category
+                document.imports.setdefault(category, []).extend(new_files)
+                document.added += len(new_files)
+                self._render_document(document)
             
-            # Add new files to the specified category
-            if category not in existing_framework_imports:
-                existing_framework_imports[category] = []
-            existing_framework_imports[category].extend(new_files)
-            
-            # Build new content
-            new_content_parts = []
-            
-            # Add user content
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")  # Add blank line before framework section
-            
-            # Add organized framework imports
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.logger.success(f"Updated CLAUDE.md with {len(new_files)} new imports")
             return True
             
         except Exception as e:
@@ -197,13 +334,11 @@ class CLAUDEMdService:
         imports_by_category = {}
         
         # Look for framework imports section
-        framework_marker = "# ═══════════════════════════════════════════════════\n# SuperClaude Framework Components"
-        
-        if framework_marker not in content:
+        if FRAMEWORK_MARKER not in content:
             return imports_by_category
         
         # Extract framework section
-        framework_section = content.split(framework_marker)[1] if framework_marker in content else ""
+        framework_section = content.split(FRAMEWORK_MARKER)[1]
         
         # Parse categories and imports
         lines = framework_section.split('\n')
@@ -234,31 +369,18 @@ class CLAUDEMdService:
         """
         Create CLAUDE.md with default content if it doesn't exist
         """
-        if self.claude_md_path.exists():
-            return
-        
         try:
-            # Create directory if it doesn't exist
-            self.claude_md_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Default CLAUDE.md content
-            default_content = """# SuperClaude Entry Point
-
-This file serves as the entry point for the SuperClaude framework.
-You can add your own custom instructions and configurations here.
-
-The SuperClaude framework components will be automatically imported below.
-"""
-            
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(default_content)
-            
-            self.logger.info("Created CLAUDE.md with default content")
-            
+            with _claude_md_lock, self.document_session():
+                self._ensure_default_content(self._get_document())
         except Exception as e:
             self.logger.error(f"Failed to create CLAUDE.md: {e}")
             raise
     
+    def _ensure_default_content(self, document: _ClaudeMdDocument) -> None:
+        """Start a document for a missing CLAUDE.md from the default content"""
+        if document.original is None and not document.content:
+            self._parse_document(document, DEFAULT_CONTENT)
+    
     def remove_imports(self, files: List[str]) -> bool:
         """
         Remove specific imports from CLAUDE.md
@@ -270,47 +392,29 @@ The SuperClaude framework components will be automatically imported below.
             True if successful, False otherwise
         """
         try:
-            if not self.claude_md_path.exists():
-                return True  # Nothing to remove
+            with _claude_md_lock, self.document_session():
+                document = self._get_document()
+                if document.original is None and not document.content:
+                    return True  # Nothing to remove
+                
+                # Remove files from all categories
+                removed = 0
+                for category_files in document.imports.values():
+                    for file in files:
+                        if file in category_files:
+                            category_files.remove(file)
+                            removed += 1
+                
+                if not removed:
+                    return True  # Nothing was removed
+                
+                # Remove empty categories
+                document.imports = {k: v for k, v in document.imports.items() if v}
+                document.removed += removed
+                self._render_document(document)
             
-            existing_content = self.read_existing_content()
-            user_content = self.extract_user_content(existing_content)
-            existing_framework_imports = self._parse_existing_framework_imports(existing_content)
-            
-            # Remove files from all categories
-            removed_any = False
-            for category, category_files in existing_framework_imports.items():
-                for file in files:
-                    if file in category_files:
-                        category_files.remove(file)
-                        removed_any = True
-            
-            # Remove empty categories
-            existing_framework_imports = {k: v for k, v in existing_framework_imports.items() if v}
-            
-            if not removed_any:
-                return True  # Nothing was removed
-            
-            # Rebuild content
-            new_content_parts = []
-            
-            if user_content.strip():
-                new_content_parts.append(user_content)
-                new_content_parts.append("")
-            
-            framework_section = self.organize_imports_by_category(existing_framework_imports)
-            if framework_section:
-                new_content_parts.append(framework_section)
-            
-            # Write updated content
-            new_content = "\n".join(new_content_parts)
-            
-            with open(self.claude_md_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
-            
-            self.logger.info(f"Removed {len(files)} imports from CLAUDE.md")
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to remove imports from CLAUDE.md: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -2,17 +2,69 @@
 Cross-platform file management for SuperClaude installation system
 """
 
+import os
 import shutil
 import stat
+import threading
 from typing import List, Optional, Callable, Dict, Any
 from pathlib import Path
 import fnmatch
 import hashlib
 
+from ..utils import events
+from ..utils.tracing import traced
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+# ioctl request cloning a whole file (linux/fs.h), supported by btrfs, XFS, OCFS2, ...
+FICLONE = 0x40049409
+
+
+def _read_umask() -> int:
+    """Get the process umask without changing it where the platform allows"""
+    try:
+        with open('/proc/self/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # Setting and restoring the umask is racy with other threads, which is
+    # why this only runs once, at import time
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Read once: the umask is not changed while SuperClaude runs
+_UMASK = _read_umask()
+
+
+def default_file_mode() -> int:
+    """
+    Get the mode a newly created regular file receives (0o666 minus the umask)
+    
+    tempfile.mkstemp() creates files with 0o600; files written through a
+    temporary file get this mode when they did not exist before.
+    """
+    return 0o666 & ~_UMASK
+
 
 class FileService:
     """Cross-platform file operations manager"""
     
+    # How installed files are materialized from the package data:
+    #   copy     - regular copy (default)
+    #   reflink  - copy-on-write clone (FICLONE), else os.copy_file_range, else copy
+    #   hardlink - hard link to the package file, else copy (e.g. across filesystems)
+    #   symlink  - symbolic link to the package file
+    LINK_STRATEGIES = ("copy", "reflink", "hardlink", "symlink")
+    
     def __init__(self, dry_run: bool = False):
         """
         Initialize file manager
@@ -36,32 +88,114 @@ class FileService:
         Returns:
             True if successful, False otherwise
         """
+        return self.install_file(source, target, "copy", preserve_permissions) is not None
+    
+    @traced("install file", "io")
+    def install_file(self, source: Path, target: Path, strategy: str = "copy",
+                     preserve_permissions: bool = True) -> Optional[str]:
+        """
+        Materialize a source file at target using a link strategy
+        
+        The file is created next to the target and renamed over it, so an
+        existing target is replaced atomically and never written through
+        (an old hardlink or symlink to the package data stays intact).
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            strategy: One of LINK_STRATEGIES
+            preserve_permissions: Whether to preserve file permissions
+            
+        Returns:
+            Method actually used ("copy", "reflink", "copy_file_range",
+            "hardlink" or "symlink"), or None if the file could not be installed
+        """
         if not source.exists():
             raise FileNotFoundError(f"Source file not found: {source}")
         
         if not source.is_file():
             raise ValueError(f"Source is not a file: {source}")
         
+        if strategy not in self.LINK_STRATEGIES:
+            raise ValueError(f"Unknown link strategy: {strategy}")
+        
         if self.dry_run:
-            print(f"[DRY RUN] Would copy {source} -> {target}")
-            return True
+            print(f"[DRY RUN] Would {strategy} {source} -> {target}")
+            return strategy
         
+        temp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
         try:
             # Ensure target directory exists
             target.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy file
-            if preserve_permissions:
-                shutil.copy2(source, target)
-            else:
-                shutil.copy(source, target)
+            method = self._materialize(source, temp_path, strategy, preserve_permissions)
+            os.replace(temp_path, target)
             
             self.copied_files.append(target)
-            return True
+            if events.progress_active():
+                # Links share the package file, no data is written for them
+                copied = 0 if method in ("hardlink", "symlink") else os.path.getsize(target)
+                events.emit(events.FILE_COPIED, path=str(target), bytes=copied, method=method)
+            return method
             
         except Exception as e:
             print(f"Error copying {source} to {target}: {e}")
-            return False
+            try:
+                if os.path.lexists(temp_path):
+                    os.unlink(temp_path)
+            except OSError:
+                pass
+            return None
+    
+    def _materialize(self, source: Path, destination: Path, strategy: str,
+                     preserve_permissions: bool) -> str:
+        """Create destination from source with the given strategy, falling back to a copy"""
+        if strategy == "symlink":
+            os.symlink(source.resolve(), destination)
+            return "symlink"
+        
+        if strategy == "hardlink":
+            try:
+                os.link(source, destination)
+                return "hardlink"
+            except OSError:
+                pass  # e.g. different filesystem; copy instead
+        
+        if strategy == "reflink":
+            for method, clone in (("reflink", self._clone_file), ("copy_file_range", self._copy_file_range)):
+                try:
+                    clone(source, destination)
+                except (OSError, AttributeError):
+                    continue
+                if preserve_permissions:
+                    shutil.copystat(source, destination)
+                else:
+                    shutil.copymode(source, destination)
+                return method
+        
+        if preserve_permissions:
+            shutil.copy2(source, destination)
+        else:
+            shutil.copy(source, destination)
+        return "copy"
+    
+    def _clone_file(self, source: Path, destination: Path) -> None:
+        """Clone a file with the FICLONE ioctl (copy-on-write, no data copied)"""
+        if not FCNTL_AVAILABLE:
+            raise OSError("reflinks are not supported on this platform")
+        
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    
+    def _copy_file_range(self, source: Path, destination: Path) -> None:
+        """Copy a file inside the kernel with os.copy_file_range"""
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
     
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
@@ -158,7 +292,7 @@ class FileService:
         Returns:
             True if successful, False otherwise
         """
-        if not file_path.exists():
+        if not os.path.lexists(file_path):
             return True  # Already gone
         
         if self.dry_run:
@@ -166,7 +300,8 @@ class FileService:
             return True
         
         try:
-            if file_path.is_file():
+            # Symlinks (including dangling ones) are removed, never their targets
+            if file_path.is_symlink() or file_path.is_file():
                 file_path.unlink()
             else:
                 print(f"Warning: {file_path} is not a file, skipping")
@@ -0,0 +1,299 @@
+"""
+Compiled registry of the MCP server templates shipped in SuperClaude/MCP/configs
+
+The template files are compiled once into setup/data/mcp_templates.json
+together with a hash of their contents. At runtime the bundle is used as
+long as that hash matches the source files; otherwise the templates are
+compiled from source. The bundle is only written at build time
+(scripts/build_and_upload.py), as the package may be read-only or shared.
+Each process keeps the compiled registry in memory, keyed by content hash.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from ..utils.logger import get_logger
+
+
+# Precompiled template bundle shipped with the package
+BUNDLE_FILE = Path(__file__).parent.parent / "data" / "mcp_templates.json"
+
+# Template source directory of the framework
+CONFIGS_DIR = Path(__file__).parent.parent.parent / "SuperClaude" / "MCP" / "configs"
+
+BUNDLE_FORMAT = 1
+
+# Content hash -> compiled registry
+_registries: Dict[str, "MCPTemplateRegistry"] = {}
+# Resolved config dir -> ((name, mtime_ns, size) of every template file, content hash)
+_source_hashes: Dict[Path, Tuple[Tuple[Tuple[str, int, int], ...], str]] = {}
+_registry_lock = threading.Lock()
+
+
+def server_fingerprint(server_name: str, server_config: Any) -> Optional[str]:
+    """
+    Fingerprint of a server definition as used for "managed by us" checks
+
+    Two definitions share a fingerprint if they have the same server name
+    and command; user edits to args, env or other keys do not change it.
+
+    Args:
+        server_name: Key of the server in mcpServers
+        server_config: Server definition
+
+    Returns:
+        Hex fingerprint, or None if the definition has no command and args
+    """
+    if (not isinstance(server_config, dict) or
+            "command" not in server_config or "args" not in server_config):
+        return None
+    key = json.dumps([server_name, server_config["command"]], ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+class MCPTemplateRegistry:
+    """Validated MCP server templates with precomputed fingerprints"""
+
+    def __init__(self, source_hash: str, templates: Dict[str, Dict[str, Any]],
+                 fingerprints: Dict[str, str]):
+        """
+        Initialize registry
+
+        Args:
+            source_hash: Content hash of the template files
+            templates: Config file name -> {server name: server definition}
+            fingerprints: Server name -> fingerprint of its template
+        """
+        self.source_hash = source_hash
+        self._templates = templates
+        self._fingerprints = fingerprints
+        self._servers_by_file = {config_file: list(servers) for config_file, servers in templates.items()}
+
+    @classmethod
+    def compile(cls, config_dir: Path, source_hash: str) -> Tuple["MCPTemplateRegistry", List[str]]:
+        """
+        Parse and validate every template file of a directory
+
+        Invalid files are left out of the registry.
+
+        Args:
+            config_dir: Template source directory
+            source_hash: Content hash of the directory (see compute_source_hash)
+
+        Returns:
+            Tuple of (registry, error_messages)
+        """
+        templates = {}
+        fingerprints = {}
+        errors = []
+
+        for config_path in sorted(config_dir.glob("*.json")):
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    template = json.load(f)
+            except (OSError, ValueError) as e:
+                errors.append(f"Could not read MCP template {config_path.name}: {e}")
+                continue
+
+            template_errors = cls._validate_template(config_path.name, template)
+            if template_errors:
+                errors.extend(template_errors)
+                continue
+
+            for server_name, server_def in template.items():
+                if server_name in fingerprints:
+                    errors.append(f"MCP server '{server_name}' is defined in more than one template")
+                    continue
+                fingerprints[server_name] = server_fingerprint(server_name, server_def)
+            templates[config_path.name] = template
+
+        return cls(source_hash, templates, fingerprints), errors
+
+    @staticmethod
+    def _validate_template(config_file: str, template: Any) -> List[str]:
+        """Check the structure of one template file"""
+        if not isinstance(template, dict) or not template:
+            return [f"MCP template {config_file} must be a non-empty JSON object"]
+
+        errors = []
+        for server_name, server_def in template.items():
+            prefix = f"MCP template {config_file}, server '{server_name}'"
+            if not isinstance(server_def, dict):
+                errors.append(f"{prefix}: definition must be an object")
+                continue
+            if not isinstance(server_def.get("command"), str) or not server_def["command"]:
+                errors.append(f"{prefix}: 'command' must be a non-empty string")
+            args = server_def.get("args")
+            if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+                errors.append(f"{prefix}: 'args' must be a list of strings")
+            env = server_def.get("env", {})
+            if not isinstance(env, dict) or not all(isinstance(value, str) for value in env.values()):
+                errors.append(f"{prefix}: 'env' must map names to strings")
+        return errors
+
+    @classmethod
+    def from_bundle(cls, bundle: Dict[str, Any]) -> "MCPTemplateRegistry":
+        """Create registry from a loaded bundle dict"""
+        return cls(bundle["source_hash"], bundle["templates"], bundle["fingerprints"])
+
+    def to_bundle(self) -> Dict[str, Any]:
+        """Get the bundle dict written to setup/data/mcp_templates.json"""
+        return {
+            "format": BUNDLE_FORMAT,
+            "source_hash": self.source_hash,
+            "templates": self._templates,
+            "fingerprints": self._fingerprints
+        }
+
+    def get_template(self, config_file: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a template by config file name
+
+        Args:
+            config_file: Template file name, e.g. "context7.json"
+
+        Returns:
+            Independent copy of {server name: server definition}, or None if unknown
+        """
+        template = self._templates.get(config_file)
+        return copy.deepcopy(template) if template is not None else None
+
+    def get_server_names(self, config_file: str) -> List[str]:
+        """Get the names of the servers defined by a template file"""
+        return list(self._servers_by_file.get(config_file, []))
+
+    def is_managed(self, server_name: str, server_config: Any) -> bool:
+        """
+        Check whether a configured server still matches one of our templates
+
+        Args:
+            server_name: Key of the server in mcpServers
+            server_config: Definition found in the user's configuration
+
+        Returns:
+            True if the name and command match a template
+        """
+        expected = self._fingerprints.get(server_name)
+        return expected is not None and server_fingerprint(server_name, server_config) == expected
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+
+def compute_source_hash(config_dir: Path) -> str:
+    """
+    Hash the template files of a directory
+
+    The hash of an unchanged directory (same file names, sizes and mtimes)
+    is remembered for the rest of the process.
+
+    Args:
+        config_dir: Template source directory
+
+    Returns:
+        Hex digest over all template file names and contents
+    """
+    config_paths = sorted(config_dir.glob("*.json"))
+    signature = []
+    for config_path in config_paths:
+        stat = config_path.stat()
+        signature.append((config_path.name, stat.st_mtime_ns, stat.st_size))
+    signature = tuple(signature)
+
+    key = config_dir.resolve()
+    cached = _source_hashes.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    for config_path in config_paths:
+        digest.update(config_path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(config_path.read_bytes())
+    source_hash = digest.hexdigest()
+    _source_hashes[key] = (signature, source_hash)
+    return source_hash
+
+
+def get_mcp_templates(config_dir: Optional[Path] = None,
+                      bundle_file: Optional[Path] = None) -> Optional[MCPTemplateRegistry]:
+    """
+    Get the compiled template registry of a config directory
+
+    Args:
+        config_dir: Template source directory (defaults to SuperClaude/MCP/configs)
+        bundle_file: Precompiled bundle (defaults to setup/data/mcp_templates.json)
+
+    Returns:
+        MCPTemplateRegistry, or None if the directory does not exist
+    """
+    config_dir = config_dir or CONFIGS_DIR
+    bundle_file = bundle_file or BUNDLE_FILE
+    if not config_dir.is_dir():
+        return None
+
+    with _registry_lock:
+        source_hash = compute_source_hash(config_dir)
+        registry = _registries.get(source_hash)
+        if registry is not None:
+            return registry
+
+        registry = _load_bundle(bundle_file, source_hash)
+        if registry is None:
+            logger = get_logger()
+            logger.debug("MCP template bundle missing or stale, compiling templates")
+            registry, errors = MCPTemplateRegistry.compile(config_dir, source_hash)
+            for error in errors:
+                logger.warning(error)
+
+        _registries[source_hash] = registry
+        return registry
+
+
+def _load_bundle(bundle_file: Path, source_hash: str) -> Optional[MCPTemplateRegistry]:
+    """
+    Load the precompiled bundle if it was built from the given sources
+
+    Returns:
+        MCPTemplateRegistry or None if missing, unreadable or stale
+    """
+    try:
+        with open(bundle_file, 'r', encoding='utf-8') as f:
+            bundle = json.load(f)
+
+        if (bundle.get("format") != BUNDLE_FORMAT or
+                bundle.get("source_hash") != source_hash or
+                not isinstance(bundle.get("templates"), dict) or
+                not isinstance(bundle.get("fingerprints"), dict)):
+            return None
+
+        return MCPTemplateRegistry.from_bundle(bundle)
+    except (OSError, ValueError):
+        return None
+
+
+def write_bundle(registry: MCPTemplateRegistry, bundle_file: Optional[Path] = None) -> bool:
+    """
+    Write the precompiled template bundle
+
+    Used at build time (scripts/build_and_upload.py).
+
+    Args:
+        registry: Compiled registry
+        bundle_file: Output path (defaults to setup/data/mcp_templates.json)
+
+    Returns:
+        True if written, False otherwise
+    """
+    target = bundle_file or BUNDLE_FILE
+    try:
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(registry.to_bundle(), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        return True
+    except OSError as e:
+        get_logger().debug(f"Could not write MCP template bundle {target}: {e}")
+        return False
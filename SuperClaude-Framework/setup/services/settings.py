@@ -5,12 +5,95 @@ Allows for manipulation of these json files with deep merge and backup
 """
 
 import json
+import os
 import shutil
-from typing import Dict, Any, Optional, List
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Iterator, Tuple
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from .files import default_file_mode
+from ..utils.tracing import traced
+
+
+# Serializes read-modify-write cycles on settings and metadata files, which
+# components may perform concurrently during parallel installation
+_file_update_lock = threading.RLock()
+
+
+class _MetadataTransaction:
+    """In-memory metadata state shared by all services of one install directory"""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.depth = 0
+        self.dirty = False
+        self.failed = False
+
+
+# Open metadata transactions keyed by resolved metadata file path
+_metadata_transactions: Dict[Path, _MetadataTransaction] = {}
+
+# Parsed JSON files keyed by path, valid while (st_mtime_ns, st_size) match.
+# Cached dicts are shared and must never be handed out without copying.
+_json_cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _read_json_cached(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a JSON file through the shared parse cache
+    
+    Args:
+        path: JSON file path
+        
+    Returns:
+        Shared parsed dict (do not mutate) or None if the file doesn't exist
+        
+    Raises:
+        json.JSONDecodeError, IOError: If the file cannot be read or parsed
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _json_cache.pop(path, None)
+        return None
+    
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _json_cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+def _copy_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy the top two levels of a metadata dict
+    
+    Enough for the read-modify-write helpers, which add, replace or delete
+    entries such as components[name] or file_manifests[name], without
+    copying every file manifest on each call. Deeper values stay shared and
+    must be replaced rather than modified in place.
+    """
+    return {key: dict(value) if isinstance(value, dict) else copy.copy(value)
+            for key, value in data.items()}
+
+
+def _lookup_path(data: Dict[str, Any], key_path: str, default: Any) -> Any:
+    """Resolve a dot-notation path in data, returning a private copy of the value"""
+    try:
+        value = data
+        for key in key_path.split('.'):
+            value = value[key]
+        return copy.deepcopy(value)
+    except (KeyError, TypeError):
+        return default
+
 
 class SettingsService:
     """Manages settings.json file operations"""
@@ -26,6 +109,7 @@ class SettingsService:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self._metadata_key = self.metadata_file.expanduser().resolve()
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -34,15 +118,16 @@ class SettingsService:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
-        if not self.settings_file.exists():
-            return {}
-        
+        return copy.deepcopy(self._settings_view())
+    
+    def _settings_view(self) -> Dict[str, Any]:
+        """Get the shared, cached settings dict (read-only)"""
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json_cached(self.settings_file) or {}
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
     
+    @traced("settings write", "io")
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
         Save settings to settings.json with optional backup
@@ -60,8 +145,7 @@ class SettingsService:
         
         # Save with pretty formatting
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
+            self._write_json_atomic(self.settings_file, settings)
         except IOError as e:
             raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
     
@@ -69,34 +153,131 @@ class SettingsService:
         """
         Load SuperClaude metadata from .superclaude-metadata.json
         
+        Inside a metadata transaction this returns a copy of the pending
+        in-memory state instead of reading the file. Only the top two levels
+        are copied (see _copy_metadata); use get_metadata_setting() or
+        get_file_manifest() for a private copy of a nested value.
+        
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
+        transaction = _metadata_transactions.get(self._metadata_key)
+        if transaction is not None:
+            with _file_update_lock:
+                return _copy_metadata(transaction.data)
         
-        try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+        return _copy_metadata(self._read_metadata_file())
+    
+    def _metadata_view(self) -> Dict[str, Any]:
+        """Get the shared metadata dict (read-only), honoring open transactions"""
+        transaction = _metadata_transactions.get(self._metadata_key)
+        if transaction is not None:
+            return transaction.data
+        return self._read_metadata_file()
     
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
         Save SuperClaude metadata to .superclaude-metadata.json
         
+        Inside a metadata transaction the write is deferred until the
+        outermost transaction is committed.
+        
         Args:
             metadata: Metadata dict to save
         """
+        transaction = _metadata_transactions.get(self._metadata_key)
+        if transaction is not None:
+            with _file_update_lock:
+                transaction.data = _copy_metadata(metadata)
+                transaction.dirty = True
+            return
+        
+        self._write_metadata_file(metadata)
+
+    @contextmanager
+    def metadata_transaction(self) -> Iterator[None]:
+        """
+        Batch metadata changes into a single atomic write
+        
+        The metadata file is loaded once when the outermost transaction
+        starts; every load/save on any SettingsService of the same install
+        directory then works on the in-memory state. Changes are flushed
+        once, with an atomic rename, when the outermost transaction exits
+        cleanly and are discarded if it exits with an exception.
+        
+        Nested transactions (including from other threads) join the open one.
+        """
+        key = self._metadata_key
+        with _file_update_lock:
+            transaction = _metadata_transactions.get(key)
+            if transaction is None:
+                transaction = _MetadataTransaction(_copy_metadata(self._read_metadata_file()))
+                _metadata_transactions[key] = transaction
+            transaction.depth += 1
+        
+        try:
+            yield
+        except BaseException:
+            transaction.failed = True
+            raise
+        finally:
+            with _file_update_lock:
+                transaction.depth -= 1
+                if transaction.depth == 0:
+                    del _metadata_transactions[key]
+                    if transaction.dirty and not transaction.failed:
+                        self._write_metadata_file(transaction.data)
+    
+    @traced("metadata read", "io")
+    def _read_metadata_file(self) -> Dict[str, Any]:
+        """Read the metadata file through the shared cache (result is read-only)"""
+        try:
+            return _read_json_cached(self.metadata_file) or {}
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+    
+    @traced("metadata write", "io")
+    def _write_metadata_file(self, metadata: Dict[str, Any]) -> None:
+        """Atomically write the metadata file to disk"""
         # Ensure directory exists
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Save with pretty formatting
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
+            self._write_json_atomic(self.metadata_file, metadata)
         except IOError as e:
             raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+    
+    def _write_json_atomic(self, path: Path, data: Dict[str, Any]) -> None:
+        """
+        Write JSON to a temporary file next to path and rename it into place
+        
+        Readers never observe a partially written file.
+        
+        Args:
+            path: Target file path
+            data: JSON-serializable data
+        """
+        fd, temp_name = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            if path.exists():
+                shutil.copymode(path, temp_name)
+            else:
+                os.chmod(temp_name, default_file_mode())
+            os.replace(temp_name, path)
+            # Keep the read cache in sync with what we just wrote
+            stat = path.stat()
+            _json_cache[path] = (stat.st_mtime_ns, stat.st_size, copy.deepcopy(data))
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
 
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -119,8 +300,9 @@ class SettingsService:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_metadata(modifications)
-        self.save_metadata(merged)
+        with _file_update_lock:
+            merged = self.merge_metadata(modifications)
+            self.save_metadata(merged)
 
     def migrate_superclaude_data(self) -> bool:
         """
@@ -129,36 +311,37 @@ class SettingsService:
         Returns:
             True if migration occurred, False if no data to migrate
         """
-        settings = self.load_settings()
+        with _file_update_lock:
+            settings = self.load_settings()
         
-        # SuperClaude-specific fields to migrate
-        superclaude_fields = ["components", "framework", "superclaude", "mcp"]
-        data_to_migrate = {}
-        fields_found = False
+            # SuperClaude-specific fields to migrate
+            superclaude_fields = ["components", "framework", "superclaude", "mcp"]
+            data_to_migrate = {}
+            fields_found = False
         
-        # Extract SuperClaude data
-        for field in superclaude_fields:
-            if field in settings:
-                data_to_migrate[field] = settings[field]
-                fields_found = True
+            # Extract SuperClaude data
+            for field in superclaude_fields:
+                if field in settings:
+                    data_to_migrate[field] = settings[field]
+                    fields_found = True
         
-        if not fields_found:
-            return False
+            if not fields_found:
+                return False
         
-        # Load existing metadata (if any) and merge
-        existing_metadata = self.load_metadata()
-        merged_metadata = self._deep_merge(existing_metadata, data_to_migrate)
+            # Load existing metadata (if any) and merge
+            existing_metadata = self.load_metadata()
+            merged_metadata = self._deep_merge(existing_metadata, data_to_migrate)
         
-        # Save to metadata file
-        self.save_metadata(merged_metadata)
+            # Save to metadata file
+            self.save_metadata(merged_metadata)
         
-        # Remove SuperClaude fields from settings
-        clean_settings = {k: v for k, v in settings.items() if k not in superclaude_fields}
+            # Remove SuperClaude fields from settings
+            clean_settings = {k: v for k, v in settings.items() if k not in superclaude_fields}
         
-        # Save cleaned settings
-        self.save_settings(clean_settings, create_backup=True)
+            # Save cleaned settings
+            self.save_settings(clean_settings, create_backup=True)
         
-        return True
+            return True
     
     def merge_settings(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -181,8 +364,9 @@ class SettingsService:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_settings(modifications)
-        self.save_settings(merged, create_backup)
+        with _file_update_lock:
+            merged = self.merge_settings(modifications)
+            self.save_settings(merged, create_backup)
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
@@ -195,15 +379,7 @@ class SettingsService:
         Returns:
             Setting value or default
         """
-        settings = self.load_settings()
-        
-        try:
-            value = settings
-            for key in key_path.split('.'):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return _lookup_path(self._settings_view(), key_path, default)
     
     def set_setting(self, key_path: str, value: Any, create_backup: bool = True) -> None:
         """
@@ -238,25 +414,26 @@ class SettingsService:
         Returns:
             True if setting was removed, False if not found
         """
-        settings = self.load_settings()
-        keys = key_path.split('.')
+        with _file_update_lock:
+            settings = self.load_settings()
+            keys = key_path.split('.')
         
-        # Navigate to parent of target key
-        current = settings
-        try:
-            for key in keys[:-1]:
-                current = current[key]
+            # Navigate to parent of target key
+            current = settings
+            try:
+                for key in keys[:-1]:
+                    current = current[key]
             
-            # Remove the target key
-            if keys[-1] in current:
-                del current[keys[-1]]
-                self.save_settings(settings, create_backup)
-                return True
-            else:
-                return False
+                # Remove the target key
+                if keys[-1] in current:
+                    del current[keys[-1]]
+                    self.save_settings(settings, create_backup)
+                    return True
+                else:
+                    return False
                 
-        except (KeyError, TypeError):
-            return False
+            except (KeyError, TypeError):
+                return False
     
     def add_component_registration(self, component_name: str, component_info: Dict[str, Any]) -> None:
         """
@@ -266,16 +443,17 @@ class SettingsService:
             component_name: Name of component
             component_info: Component metadata dict
         """
-        metadata = self.load_metadata()
-        if "components" not in metadata:
-            metadata["components"] = {}
+        with _file_update_lock:
+            metadata = self.load_metadata()
+            if "components" not in metadata:
+                metadata["components"] = {}
         
-        metadata["components"][component_name] = {
-            **component_info,
-            "installed_at": datetime.now().isoformat()
-        }
+            metadata["components"][component_name] = {
+                **component_info,
+                "installed_at": datetime.now().isoformat()
+            }
         
-        self.save_metadata(metadata)
+            self.save_metadata(metadata)
     
     def remove_component_registration(self, component_name: str) -> bool:
         """
@@ -287,12 +465,39 @@ class SettingsService:
         Returns:
             True if component was removed, False if not found
         """
-        metadata = self.load_metadata()
-        if "components" in metadata and component_name in metadata["components"]:
-            del metadata["components"][component_name]
+        with _file_update_lock:
+            metadata = self.load_metadata()
+            if "components" in metadata and component_name in metadata["components"]:
+                del metadata["components"][component_name]
+                metadata.get("file_manifests", {}).pop(component_name, None)
+                self.save_metadata(metadata)
+                return True
+            return False
+    
+    def get_file_manifest(self, component_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the installed file manifest of a component
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Dict of install-dir relative path -> {sha256, size, mtime_ns}
+        """
+        return _lookup_path(self._metadata_view(), f"file_manifests.{component_name}", {})
+    
+    def set_file_manifest(self, component_name: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Record the installed file manifest of a component
+        
+        Args:
+            component_name: Name of component
+            manifest: Dict of install-dir relative path -> {sha256, size, mtime_ns}
+        """
+        with _file_update_lock:
+            metadata = self.load_metadata()
+            metadata.setdefault("file_manifests", {})[component_name] = manifest
             self.save_metadata(metadata)
-            return True
-        return False
     
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -301,8 +506,7 @@ class SettingsService:
         Returns:
             Dict of component_name -> component_info
         """
-        metadata = self.load_metadata()
-        return metadata.get("components", {})
+        return _lookup_path(self._metadata_view(), "components", {})
     
     def is_component_installed(self, component_name: str) -> bool:
         """
@@ -314,8 +518,7 @@ class SettingsService:
         Returns:
             True if component is installed, False otherwise
         """
-        components = self.get_installed_components()
-        return component_name in components
+        return component_name in self._metadata_view().get("components", {})
     
     def get_component_version(self, component_name: str) -> Optional[str]:
         """
@@ -327,9 +530,8 @@ class SettingsService:
         Returns:
             Version string or None if not installed
         """
-        components = self.get_installed_components()
-        component_info = components.get(component_name, {})
-        return component_info.get("version")
+        components = self._metadata_view().get("components", {})
+        return components.get(component_name, {}).get("version")
     
     def update_framework_version(self, version: str) -> None:
         """
@@ -338,14 +540,15 @@ class SettingsService:
         Args:
             version: Framework version string
         """
-        metadata = self.load_metadata()
-        if "framework" not in metadata:
-            metadata["framework"] = {}
+        with _file_update_lock:
+            metadata = self.load_metadata()
+            if "framework" not in metadata:
+                metadata["framework"] = {}
         
-        metadata["framework"]["version"] = version
-        metadata["framework"]["updated_at"] = datetime.now().isoformat()
+            metadata["framework"]["version"] = version
+            metadata["framework"]["updated_at"] = datetime.now().isoformat()
         
-        self.save_metadata(metadata)
+            self.save_metadata(metadata)
     
     def check_installation_exists(self) -> bool:
         """
@@ -354,6 +557,9 @@ class SettingsService:
         Returns:
             Version string or None if not set
         """
+        transaction = _metadata_transactions.get(self._metadata_key)
+        if transaction is not None and transaction.data:
+            return True
         return self.metadata_file.exists()
 
     def check_v2_installation_exists(self) -> bool:
@@ -376,15 +582,7 @@ class SettingsService:
         Returns:
             Metadata value or default
         """
-        metadata = self.load_metadata()
-        
-        try:
-            value = metadata
-            for key in key_path.split('.'):
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return _lookup_path(self._metadata_view(), key_path, default)
     
     def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -395,9 +593,9 @@ class SettingsService:
             overlay: Dictionary to merge on top
             
         Returns:
-            Merged dictionary
+            Merged dictionary (shares the values of base that overlay leaves alone)
         """
-        result = copy.deepcopy(base)
+        result = dict(base)
         
         for key, value in overlay.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
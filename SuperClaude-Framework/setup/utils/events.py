@@ -0,0 +1,107 @@
+"""
+Progress event bus
+
+The installer, components and the file service report what they are doing
+as structured events:
+
+    emit(PHASE, phase="copy")
+    emit(FILE_DONE, component="core", bytes=1234, copied=True)
+
+Subscribers (the progress bar, the JSON progress stream) receive every
+event synchronously on the emitting thread, which may be a component worker
+thread. While nobody is subscribed emit() returns immediately, so reporting
+progress costs nothing outside the CLI.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple
+
+
+# Event names
+PLAN = "plan"                        # totals: components, files, bytes
+PHASE = "phase"                      # phase
+COMPONENT_START = "component_start"  # component
+COMPONENT_DONE = "component_done"    # component, success
+FILE_DONE = "file_done"              # component, bytes, copied (False: unchanged, skipped)
+FILE_COPIED = "file_copied"          # path, bytes, method (emitted by FileService)
+FILE_REMOVED = "file_removed"        # component, bytes
+
+
+class Event(NamedTuple):
+    """One progress event"""
+    name: str
+    timestamp: float  # time.perf_counter() at emission
+    data: Dict[str, Any]
+
+
+Subscriber = Callable[[Event], None]
+
+
+class EventBus:
+    """Delivers events to the subscribed callbacks"""
+
+    def __init__(self):
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """Whether anybody listens; emitters can skip gathering event data otherwise"""
+        return bool(self._subscribers)
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """
+        Register a callback for all events
+
+        Args:
+            callback: Called with each Event; exceptions it raises are ignored
+
+        Returns:
+            Function removing the subscription again
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + [callback]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = [sub for sub in self._subscribers if sub is not callback]
+        return unsubscribe
+
+    def emit(self, name: str, **data: Any) -> None:
+        """
+        Send an event to all subscribers
+
+        Args:
+            name: Event name (see the constants of this module)
+            **data: JSON-serializable event details
+        """
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        event = Event(name, time.perf_counter(), data)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                pass  # A broken display must not break the operation
+
+
+# Process-wide event bus
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus"""
+    return _bus
+
+
+def emit(name: str, **data: Any) -> None:
+    """Send an event on the process-wide bus (see EventBus.emit)"""
+    if _bus._subscribers:
+        _bus.emit(name, **data)
+
+
+def progress_active() -> bool:
+    """Whether the process-wide bus has subscribers"""
+    return bool(_bus._subscribers)
@@ -2,14 +2,119 @@
 Logging system for SuperClaude installation suite
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 from enum import Enum
 
-from .ui import Colors
+from .ui import Colors, get_active_progress_bar
+
+
+# Size-based rotation of the log file: the current file plus LOG_BACKUP_COUNT rotated ones
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 9
+
+
+class _ColorFormatter(logging.Formatter):
+    """Console formatter with colored level prefixes"""
+    
+    COLORS = {
+        'DEBUG': Colors.WHITE,
+        'INFO': Colors.BLUE,
+        'WARNING': Colors.YELLOW,
+        'ERROR': Colors.RED,
+        'CRITICAL': Colors.RED + Colors.BRIGHT
+    }
+    
+    PREFIXES = {
+        'DEBUG': '[DEBUG]',
+        'INFO': '[INFO]',
+        'WARNING': '[!]',
+        'ERROR': '[✗]',
+        'CRITICAL': '[CRITICAL]'
+    }
+    
+    def format(self, record: logging.LogRecord) -> str:
+        # Logger.success() marks its records instead of swapping formatters
+        if getattr(record, 'success', False):
+            return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
+        
+        color = self.COLORS.get(record.levelname, Colors.WHITE)
+        prefix = self.PREFIXES.get(record.levelname, '[LOG]')
+        return f"{color}{prefix} {record.getMessage()}{Colors.RESET}"
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """Console handler printing log lines above an active progress bar"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        bar = get_active_progress_bar()
+        if bar is None:
+            super().emit(record)
+            return
+        with bar.suspended():
+            super().emit(record)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that enqueues records unformatted
+    
+    The listener runs in the same process, so records need not be pickled;
+    merging %-style arguments and formatting tracebacks is left to the
+    writer thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _RotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotated file handler for the writer thread
+    
+    Keeps a running count of the bytes written instead of formatting each
+    record twice and asking the stream for its position, and leaves flushing
+    to the listener, which flushes whenever the queue runs empty.
+    """
+    
+    def _open(self):
+        stream = super()._open()
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record) + self.terminator
+            size = len(message.encode('utf-8'))
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size > 0 and self._size + size > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(message)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers each time it has caught up"""
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
 
 
 class LogLevel(Enum):
@@ -40,11 +145,18 @@ class Logger:
         self.file_level = file_level
         self.session_start = datetime.now()
         
+        self.log_file: Optional[Path] = None
+        self._console_handler: Optional[logging.Handler] = None
+        self._file_handler: Optional[logging.Handler] = None
+        self._rotating_handler: Optional[logging.Handler] = None
+        self._queue: Optional[queue.Queue] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        
         # Create logger
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)  # Accept all levels, handlers will filter
         
         # Remove existing handlers to avoid duplicates
+        _stop_listeners(self.logger)
         self.logger.handlers.clear()
         
         # Setup handlers
@@ -58,52 +170,34 @@ class Logger:
             'error': 0,
             'critical': 0
         }
+        
+        self._update_logger_level()
     
     def _setup_console_handler(self) -> None:
         """Setup colorized console handler"""
-        handler = logging.StreamHandler(sys.stdout)
+        # Console output stays synchronous so it interleaves correctly with prompts and progress bars
+        handler = _ConsoleHandler(sys.stdout)
         handler.setLevel(self.console_level.value)
-        
-        # Custom formatter with colors
-        class ColorFormatter(logging.Formatter):
-            def format(self, record):
-                # Color mapping
-                colors = {
-                    'DEBUG': Colors.WHITE,
-                    'INFO': Colors.BLUE,
-                    'WARNING': Colors.YELLOW,
-                    'ERROR': Colors.RED,
-                    'CRITICAL': Colors.RED + Colors.BRIGHT
-                }
-                
-                # Prefix mapping
-                prefixes = {
-                    'DEBUG': '[DEBUG]',
-                    'INFO': '[INFO]',
-                    'WARNING': '[!]',
-                    'ERROR': '[✗]',
-                    'CRITICAL': '[CRITICAL]'
-                }
-                
-                color = colors.get(record.levelname, Colors.WHITE)
-                prefix = prefixes.get(record.levelname, '[LOG]')
-                
-                return f"{color}{prefix} {record.getMessage()}{Colors.RESET}"
-        
-        handler.setFormatter(ColorFormatter())
+        handler.setFormatter(_ColorFormatter())
         self.logger.addHandler(handler)
+        self._console_handler = handler
     
     def _setup_file_handler(self) -> None:
-        """Setup file handler with rotation"""
+        """Setup rotating file handler behind a background writer thread"""
         try:
             # Ensure log directory exists
             self.log_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create timestamped log file
-            timestamp = self.session_start.strftime("%Y%m%d_%H%M%S")
-            log_file = self.log_dir / f"{self.name}_{timestamp}.log"
+            # One log file per logger, rotated by size instead of pruned on every start
+            log_file = self.log_dir / f"{self.name}.log"
             
-            handler = logging.FileHandler(log_file, encoding='utf-8')
+            handler = _RotatingFileHandler(
+                log_file,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding='utf-8',
+                delay=True
+            )
             handler.setLevel(self.file_level.value)
             
             # Detailed formatter for files
@@ -113,80 +207,59 @@ class Logger:
             )
             handler.setFormatter(formatter)
             
-            self.logger.addHandler(handler)
-            self.log_file = log_file
+            # Records are handed to the writer thread; formatting and disk I/O happen there
+            self._queue = queue.Queue()
+            queue_handler = _LazyQueueHandler(self._queue)
+            queue_handler.setLevel(self.file_level.value)
+            self._listener = _FlushingQueueListener(self._queue, handler, respect_handler_level=True)
+            self._listener.start()
+            queue_handler.listener = self._listener
             
-            # Clean up old log files (keep last 10)
-            self._cleanup_old_logs()
+            self.logger.addHandler(queue_handler)
+            self._file_handler = queue_handler
+            self._rotating_handler = handler
+            self.log_file = log_file
             
         except Exception as e:
             # If file logging fails, continue with console only
             print(f"{Colors.YELLOW}[!] Could not setup file logging: {e}{Colors.RESET}")
             self.log_file = None
     
-    def _cleanup_old_logs(self, keep_count: int = 10) -> None:
-        """Clean up old log files"""
-        try:
-            # Get all log files for this logger
-            log_files = list(self.log_dir.glob(f"{self.name}_*.log"))
-            
-            # Sort by modification time, newest first
-            log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            # Remove old files
-            for old_file in log_files[keep_count:]:
-                try:
-                    old_file.unlink()
-                except OSError:
-                    pass  # Ignore errors when cleaning up
-                    
-        except Exception:
-            pass  # Ignore cleanup errors
+    def _update_logger_level(self) -> None:
+        """Let the logger drop records no handler would accept before they are created"""
+        levels = [handler.level for handler in (self._console_handler, self._file_handler) if handler]
+        self.logger.setLevel(min(levels) if levels else logging.CRITICAL)
     
-    def debug(self, message: str, **kwargs) -> None:
-        """Log debug message"""
-        self.logger.debug(message, **kwargs)
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """Log debug message (%-style args are merged only if the record is emitted)"""
+        self.logger.debug(message, *args, **kwargs)
         self.log_counts['debug'] += 1
     
-    def info(self, message: str, **kwargs) -> None:
-        """Log info message"""
-        self.logger.info(message, **kwargs)
+    def info(self, message: str, *args, **kwargs) -> None:
+        """Log info message (%-style args are merged only if the record is emitted)"""
+        self.logger.info(message, *args, **kwargs)
         self.log_counts['info'] += 1
     
-    def warning(self, message: str, **kwargs) -> None:
-        """Log warning message"""
-        self.logger.warning(message, **kwargs)
+    def warning(self, message: str, *args, **kwargs) -> None:
+        """Log warning message (%-style args are merged only if the record is emitted)"""
+        self.logger.warning(message, *args, **kwargs)
         self.log_counts['warning'] += 1
     
-    def error(self, message: str, **kwargs) -> None:
-        """Log error message"""
-        self.logger.error(message, **kwargs)
+    def error(self, message: str, *args, **kwargs) -> None:
+        """Log error message (%-style args are merged only if the record is emitted)"""
+        self.logger.error(message, *args, **kwargs)
         self.log_counts['error'] += 1
     
-    def critical(self, message: str, **kwargs) -> None:
-        """Log critical message"""
-        self.logger.critical(message, **kwargs)
+    def critical(self, message: str, *args, **kwargs) -> None:
+        """Log critical message (%-style args are merged only if the record is emitted)"""
+        self.logger.critical(message, *args, **kwargs)
         self.log_counts['critical'] += 1
     
-    def success(self, message: str, **kwargs) -> None:
+    def success(self, message: str, *args, **kwargs) -> None:
         """Log success message (info level with special formatting)"""
-        # Use a custom success formatter for console
-        if self.logger.handlers:
-            console_handler = self.logger.handlers[0]
-            if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
-                def success_format(record):
-                    return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
-                
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
-            else:
-                self.logger.info(f"SUCCESS: {message}", **kwargs)
-        else:
-            self.logger.info(f"SUCCESS: {message}", **kwargs)
-        
+        extra = dict(kwargs.pop('extra', None) or {})
+        extra['success'] = True
+        self.logger.info(message, *args, extra=extra, **kwargs)
         self.log_counts['info'] += 1
     
     def step(self, step: int, total: int, message: str, **kwargs) -> None:
@@ -201,9 +274,9 @@ class Logger:
         self.info(f"  {title}", **kwargs)
         self.info(separator, **kwargs)
     
-    def exception(self, message: str, exc_info: bool = True, **kwargs) -> None:
+    def exception(self, message: str, *args, exc_info: bool = True, **kwargs) -> None:
         """Log exception with traceback"""
-        self.logger.error(message, exc_info=exc_info, **kwargs)
+        self.logger.error(message, *args, exc_info=exc_info, **kwargs)
         self.log_counts['error'] += 1
     
     def log_system_info(self, info: Dict[str, Any]) -> None:
@@ -237,24 +310,35 @@ class Logger:
             'runtime_seconds': runtime.total_seconds(),
             'log_counts': self.log_counts.copy(),
             'total_messages': sum(self.log_counts.values()),
-            'log_file': str(self.log_file) if hasattr(self, 'log_file') and self.log_file else None,
+            'log_file': str(self.log_file) if self.log_file else None,
             'has_errors': self.log_counts['error'] + self.log_counts['critical'] > 0
         }
     
     def set_console_level(self, level: LogLevel) -> None:
         """Change console logging level"""
         self.console_level = level
-        if self.logger.handlers:
-            self.logger.handlers[0].setLevel(level.value)
+        if self._console_handler:
+            self._console_handler.setLevel(level.value)
+            self._update_logger_level()
+    
+    def set_console_stream(self, stream) -> None:
+        """Change the stream console output is written to (e.g. sys.stderr)"""
+        if self._console_handler:
+            self._console_handler.setStream(stream)
     
     def set_file_level(self, level: LogLevel) -> None:
         """Change file logging level"""
         self.file_level = level
-        if len(self.logger.handlers) > 1:
-            self.logger.handlers[1].setLevel(level.value)
+        if self._file_handler:
+            self._file_handler.setLevel(level.value)
+            self._rotating_handler.setLevel(level.value)
+            self._update_logger_level()
     
     def flush(self) -> None:
-        """Flush all handlers"""
+        """Flush all handlers, waiting for queued records to be written"""
+        if self._listener and self._listener._thread is not None:
+            self._queue.join()
+            self._rotating_handler.flush()
         for handler in self.logger.handlers:
             if hasattr(handler, 'flush'):
                 handler.flush()
@@ -272,22 +356,48 @@ class Logger:
         if stats['log_file']:
             self.info(f"Full log saved to: {stats['log_file']}")
         
-        # Close all handlers
+        # Drain the queue, then close all handlers
+        _stop_listeners(self.logger)
         for handler in self.logger.handlers[:]:
             handler.close()
             self.logger.removeHandler(handler)
 
 
+def _stop_listeners(logger: logging.Logger) -> None:
+    """Stop the writer threads of a logger's queue handlers, writing out queued records"""
+    for handler in logger.handlers:
+        listener = getattr(handler, 'listener', None)
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+            for target in listener.handlers:
+                target.close()
+
+
+def _shutdown() -> None:
+    """Write out queued records at interpreter exit"""
+    if _global_logger is not None:
+        _stop_listeners(_global_logger.logger)
+
+
 # Global logger instance
 _global_logger: Optional[Logger] = None
 
+atexit.register(_shutdown)
 
-def get_logger(name: str = "superclaude") -> Logger:
-    """Get or create global logger instance"""
+
+def get_logger(name: Optional[str] = None) -> Logger:
+    """
+    Get or create global logger instance
+    
+    Without a name the current global logger is returned, whichever name
+    setup_logging() gave it; a "superclaude" logger is created if none exists.
+    """
     global _global_logger
     
-    if _global_logger is None or _global_logger.name != name:
-        _global_logger = Logger(name)
+    if _global_logger is None or (name is not None and _global_logger.name != name):
+        if _global_logger is not None:
+            _stop_listeners(_global_logger.logger)
+        _global_logger = Logger(name or "superclaude")
     
     return _global_logger
 
@@ -295,36 +405,38 @@ def get_logger(name: str = "superclaude") -> Logger:
 def setup_logging(name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG) -> Logger:
     """Setup logging with specified configuration"""
     global _global_logger
+    if _global_logger is not None:
+        _stop_listeners(_global_logger.logger)
     _global_logger = Logger(name, log_dir, console_level, file_level)
     return _global_logger
 
 
 # Convenience functions using global logger
-def debug(message: str, **kwargs) -> None:
+def debug(message: str, *args, **kwargs) -> None:
     """Log debug message using global logger"""
-    get_logger().debug(message, **kwargs)
+    get_logger().debug(message, *args, **kwargs)
 
 
-def info(message: str, **kwargs) -> None:
+def info(message: str, *args, **kwargs) -> None:
     """Log info message using global logger"""
-    get_logger().info(message, **kwargs)
+    get_logger().info(message, *args, **kwargs)
 
 
-def warning(message: str, **kwargs) -> None:
+def warning(message: str, *args, **kwargs) -> None:
     """Log warning message using global logger"""
-    get_logger().warning(message, **kwargs)
+    get_logger().warning(message, *args, **kwargs)
 
 
-def error(message: str, **kwargs) -> None:
+def error(message: str, *args, **kwargs) -> None:
     """Log error message using global logger"""
-    get_logger().error(message, **kwargs)
+    get_logger().error(message, *args, **kwargs)
 
 
-def critical(message: str, **kwargs) -> None:
+def critical(message: str, *args, **kwargs) -> None:
     """Log critical message using global logger"""
-    get_logger().critical(message, **kwargs)
+    get_logger().critical(message, *args, **kwargs)
 
 
-def success(message: str, **kwargs) -> None:
+def success(message: str, *args, **kwargs) -> None:
     """Log success message using global logger"""
-    get_logger().success(message, **kwargs)
\ No newline at end of file
+    get_logger().success(message, *args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+CPU and memory profiling of CLI operations
+
+OperationProfiler wraps one operation in cProfile and/or tracemalloc and
+writes the results to a profiles directory, so a slow run on a user's
+machine can be captured without editing the package:
+
+    SuperClaude update --profile both
+
+CPU profiling covers the calling thread and every thread started while
+the profiler is active (components are installed on worker threads).
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, List, Optional
+from pathlib import Path
+from .ui import format_duration, format_size
+
+
+PROFILE_MODES = ("cpu", "mem", "both")
+
+# Frames kept per allocation traceback
+TRACEMALLOC_FRAMES = 10
+
+# Number of entries in the written reports and in the printed summary
+REPORT_LIMIT = 40
+SUMMARY_LIMIT = 5
+
+# From Python 3.12 cProfile is built on sys.monitoring: one enabled profiler
+# sees every thread, and a second one cannot be enabled while it is active
+PROFILER_COVERS_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+class OperationProfiler:
+    """Context manager profiling the code run inside it"""
+
+    def __init__(self, mode: str, output_dir: Path, operation: str):
+        """
+        Initialize profiler
+
+        Args:
+            mode: One of PROFILE_MODES
+            output_dir: Directory the profile files are written to
+            operation: Operation name used in the file names
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.operation = operation
+        self.cpu = mode in ("cpu", "both")
+        self.mem = mode in ("mem", "both")
+        self.files: List[Path] = []
+        self.summary: List[str] = []
+        self._profiles: List[cProfile.Profile] = []
+        self._profiles_lock = threading.Lock()
+        self._thread_hook = False
+        self._started_tracemalloc = False
+        self._start = 0.0
+        self._duration = 0.0
+        self._stats: Optional[pstats.Stats] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak = 0
+
+    def __enter__(self) -> "OperationProfiler":
+        if self.mem and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        if self.cpu:
+            if not PROFILER_COVERS_ALL_THREADS:
+                # Threads started from now on get their own profiler, merged on exit
+                threading.setprofile(self._profile_new_thread)
+                self._thread_hook = True
+            profile = cProfile.Profile()
+            self._profiles.append(profile)
+            profile.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._duration = time.perf_counter() - self._start
+        if self.cpu:
+            if self._thread_hook:
+                threading.setprofile(None)
+                self._thread_hook = False
+            self._profiles[0].disable()
+        if self.mem:
+            # Snapshot before merging the CPU profiles so their allocations are not counted
+            self._snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            self._peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        if self.cpu:
+            self._stats = self._merge_profiles()
+
+    def _profile_new_thread(self, frame: Any, event: str, arg: Any) -> None:
+        """Profile hook installed in new threads: replace itself with a cProfile profiler"""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler owns the interpreter (e.g. sys.monitoring based
+            # cProfile); profile the main thread only instead of failing the thread
+            sys.setprofile(None)
+            threading.setprofile(None)
+            return
+        with self._profiles_lock:
+            self._profiles.append(profile)
+
+    def _merge_profiles(self) -> pstats.Stats:
+        """Combine the profiles of all threads into one Stats object"""
+        with self._profiles_lock:
+            profiles = list(self._profiles)
+        stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        for profile in profiles[1:]:
+            # Worker threads have finished; create_stats() also disables their profilers
+            profile.create_stats()
+            if profile.stats:
+                stats.add(profile)
+        return stats
+
+    def write(self) -> List[Path]:
+        """
+        Write the collected profiles and build the summary
+
+        Files are named <operation>_<timestamp>_<kind> in output_dir:
+        .prof (pstats dump, e.g. for snakeviz), _cpu.txt (sorted stats)
+        and _mem.txt (top allocation sites).
+
+        Returns:
+            Paths of the written files
+
+        Raises:
+            OSError: If the output directory or a file cannot be written
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = self.output_dir / f"{self.operation}_{timestamp}"
+
+        self.summary = [f"Profiled '{self.operation}' ({self.mode}): {format_duration(self._duration)} wall time"]
+        if self._stats is not None:
+            self._write_cpu(base)
+        if self._snapshot is not None:
+            self._write_mem(base)
+        return self.files
+
+    def _write_cpu(self, base: Path) -> None:
+        """Write the pstats dump and a text report sorted by cumulative and own time"""
+        prof_file = base.with_name(base.name + ".prof")
+        self._stats.dump_stats(str(prof_file))
+        self.files.append(prof_file)
+
+        report = io.StringIO()
+        self._stats.stream = report
+        report.write(f"Threads profiled: {self._describe_threads()}\n\n")
+        report.write("=== Sorted by cumulative time ===\n")
+        self._stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_LIMIT)
+        report.write("\n=== Sorted by own time ===\n")
+        self._stats.sort_stats(pstats.SortKey.TIME).print_stats(REPORT_LIMIT)
+
+        text_file = base.with_name(base.name + "_cpu.txt")
+        text_file.write_text(report.getvalue(), encoding='utf-8')
+        self.files.append(text_file)
+
+        self.summary.append(f"CPU: {self._stats.total_calls} calls, {self._stats.total_tt:.2f}s profiled "
+                            f"across {self._describe_threads()} threads; top functions by own time:")
+        entries = sorted(self._stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+        for (filename, line, function), (_, calls, own_time, cumulative, _) in entries[:SUMMARY_LIMIT]:
+            self.summary.append(f"  {own_time * 1000:8.1f}ms own {cumulative * 1000:8.1f}ms cum  "
+                                f"{function} ({Path(filename).name}:{line}, {calls} calls)")
+
+    def _describe_threads(self) -> str:
+        """Number of threads covered by the CPU profile"""
+        if PROFILER_COVERS_ALL_THREADS:
+            return "all"
+        return str(len(self._profiles))
+
+    def _write_mem(self, base: Path) -> None:
+        """Write the top allocation sites by line and by traceback"""
+        by_line = self._snapshot.statistics("lineno")
+        by_traceback = self._snapshot.statistics("traceback")
+        total = sum(stat.size for stat in by_line)
+
+        lines = [
+            f"Peak traced memory: {format_size(self._peak)}",
+            f"Still allocated at the end: {format_size(total)}",
+            "",
+            "=== Top allocation sites ===",
+        ]
+        lines.extend(str(stat) for stat in by_line[:REPORT_LIMIT])
+        lines.extend(["", "=== Top allocation tracebacks ==="])
+        for stat in by_traceback[:SUMMARY_LIMIT * 2]:
+            lines.append(f"{format_size(stat.size)} in {stat.count} blocks")
+            lines.extend(f"    {line}" for line in stat.traceback.format())
+
+        text_file = base.with_name(base.name + "_mem.txt")
+        text_file.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        self.files.append(text_file)
+
+        self.summary.append(f"Memory: peak {format_size(self._peak)}, "
+                            f"{format_size(total)} still allocated; top allocation sites:")
+        for stat in by_line[:SUMMARY_LIMIT]:
+            frame = stat.traceback[0]
+            self.summary.append(f"  {format_size(stat.size):>10}  {Path(frame.filename).name}:{frame.lineno} "
+                                f"({stat.count} blocks)")
+
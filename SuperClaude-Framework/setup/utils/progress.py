@@ -0,0 +1,220 @@
+"""
+Progress reporting for CLI operations, driven by the event bus
+
+    with report_progress(args.progress, "Installing: ", "Installation complete"):
+        installer.install_components(components, config)
+
+"bar" draws a ProgressBar from the events as they arrive; "json" writes
+one JSON object per line to stdout for automation. Both render at most
+every RENDER_INTERVAL seconds (plus on phase and component changes), so
+tens of thousands of file events do not turn into as many screen updates.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from . import events
+from .events import Event, get_event_bus
+from .ui import ProgressBar, set_active_progress_bar
+
+
+PROGRESS_MODES = ("bar", "json", "none")
+
+# Minimum seconds between two renderings of file-level progress
+RENDER_INTERVAL = 0.1
+
+# Events rendered immediately instead of rate-limited
+_MILESTONES = (events.PLAN, events.PHASE, events.COMPONENT_START, events.COMPONENT_DONE)
+
+
+class ProgressState:
+    """Running totals of one operation, built from its events"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phase: Optional[str] = None
+        self.component: Optional[str] = None
+        self.components_total = 0
+        self.components_done = 0
+        self.files_total = 0
+        self.files_done = 0
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.bytes_copied = 0
+        self.failed: List[str] = []
+
+    def apply(self, event: Event) -> None:
+        """Update the totals with one event"""
+        data = event.data
+        if event.name == events.FILE_DONE or event.name == events.FILE_REMOVED:
+            self.files_done += 1
+            self.bytes_done += data.get("bytes", 0)
+        elif event.name == events.FILE_COPIED:
+            self.bytes_copied += data.get("bytes", 0)
+        elif event.name == events.PLAN:
+            self.components_total = data.get("components", 0)
+            self.files_total = data.get("files", 0)
+            self.bytes_total = data.get("bytes", 0)
+        elif event.name == events.PHASE:
+            self.phase = data.get("phase")
+            self.component = None
+        elif event.name == events.COMPONENT_START:
+            self.component = data.get("component")
+        elif event.name == events.COMPONENT_DONE:
+            self.components_done += 1
+            if not data.get("success", True):
+                self.failed.append(data.get("component"))
+
+    @property
+    def units(self) -> Tuple[int, int]:
+        """(done, total) in files, or in components if there are no files to process"""
+        if self.files_total:
+            return min(self.files_done, self.files_total), self.files_total
+        return min(self.components_done, self.components_total), self.components_total
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the operation started"""
+        return time.perf_counter() - self.start
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds left, from the rate so far (None before any progress)"""
+        done, total = self.units
+        if not done or not total:
+            return None
+        return self.elapsed / done * (total - done)
+
+    @property
+    def message(self) -> str:
+        """Short description of the current activity"""
+        return self.component or self.phase or ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Progress snapshot for the JSON stream"""
+        eta = self.eta
+        return {
+            "phase": self.phase,
+            "components_done": self.components_done,
+            "components_total": self.components_total,
+            "files_done": self.files_done,
+            "files_total": self.files_total,
+            "bytes_done": self.bytes_done,
+            "bytes_total": self.bytes_total,
+            "bytes_copied": self.bytes_copied,
+            "eta": round(eta, 3) if eta is not None else None,
+        }
+
+
+class BarProgressRenderer:
+    """Event subscriber drawing a console progress bar"""
+
+    def __init__(self, prefix: str = '', interval: float = RENDER_INTERVAL):
+        """
+        Initialize renderer
+
+        Args:
+            prefix: Text shown before the bar
+            interval: Minimum seconds between redraws for file events
+        """
+        self.prefix = prefix
+        self.interval = interval
+        self.state = ProgressState()
+        self._bar: Optional[ProgressBar] = None
+        self._last_render = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            self.state.apply(event)
+            if event.name == events.PLAN:
+                # The bar (and its ETA clock) starts once the amount of work is known
+                self._bar = ProgressBar(total=self.state.units[1], prefix=self.prefix)
+                set_active_progress_bar(self._bar)
+            if event.name in _MILESTONES or event.timestamp - self._last_render >= self.interval:
+                self._render(event.timestamp)
+
+    def _render(self, now: float) -> None:
+        if self._bar is None:
+            return
+        done, total = self.state.units
+        self._bar.total = total
+        self._bar.update(done, self.state.message)
+        self._last_render = now
+
+    def finish(self, message: str) -> None:
+        """Draw the final state and end the bar's line"""
+        with self._lock:
+            set_active_progress_bar(None)
+            if self._bar is not None:
+                self._bar.finish(message)
+
+
+class JsonProgressRenderer:
+    """Event subscriber writing newline-delimited JSON progress records"""
+
+    def __init__(self, stream: Optional[TextIO] = None, interval: float = RENDER_INTERVAL):
+        """
+        Initialize renderer
+
+        Args:
+            stream: Output stream (defaults to sys.stdout)
+            interval: Minimum seconds between "progress" records for file events
+        """
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self.state = ProgressState()
+        self._last_render = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            self.state.apply(event)
+            if event.name in _MILESTONES:
+                self._write(event.name, event.timestamp, event.data)
+            elif event.timestamp - self._last_render >= self.interval:
+                self._write("progress", event.timestamp, self.state.to_dict())
+                self._last_render = event.timestamp
+
+    def _write(self, name: str, timestamp: float, data: Dict[str, Any]) -> None:
+        record = {"event": name, "time": round(timestamp - self.state.start, 4)}
+        record.update(data)
+        self.stream.write(json.dumps(record, default=str) + "\n")
+        self.stream.flush()
+
+    def finish(self, message: str) -> None:
+        """Write the final totals"""
+        with self._lock:
+            now = time.perf_counter()
+            self._write("progress", now, self.state.to_dict())
+            self._write("finish", now, {"message": message, "failed": self.state.failed})
+
+
+@contextmanager
+def report_progress(mode: Optional[str], prefix: str = '',
+                    finish_message: str = 'Complete') -> Iterator[None]:
+    """
+    Render the progress events emitted while the block runs
+
+    Args:
+        mode: One of PROGRESS_MODES (None behaves like "none")
+        prefix: Text shown before the progress bar
+        finish_message: Message shown once the block has finished
+    """
+    if mode == "json":
+        renderer = JsonProgressRenderer()
+    elif mode == "bar":
+        renderer = BarProgressRenderer(prefix)
+    else:
+        yield
+        return
+
+    unsubscribe = get_event_bus().subscribe(renderer)
+    try:
+        yield
+    finally:
+        unsubscribe()
+        renderer.finish(finish_message)
@@ -29,10 +29,18 @@ Architecture:
 
 import re
 import os
+import threading
 from pathlib import Path
-from typing import List, Optional, Tuple, Set
+from typing import Dict, Iterable, List, Optional, Tuple, Set
 import urllib.parse
 
+from .tracing import traced
+
+
+def _combine_patterns(patterns: List[str]) -> "re.Pattern":
+    """Compile a pattern list into one case-insensitive alternation"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
 
 class SecurityValidator:
     """Security validation utilities"""
@@ -94,6 +102,20 @@ class SecurityValidator:
         r'\.secret',
     ]
     
+    # One precompiled regex per category; the individual pattern is only
+    # looked up again to build the error message once a category matches
+    _TRAVERSAL_RE = _combine_patterns(TRAVERSAL_PATTERNS)
+    _UNIX_SYSTEM_RE = _combine_patterns(UNIX_SYSTEM_PATTERNS)
+    _WINDOWS_SYSTEM_RE = _combine_patterns(WINDOWS_SYSTEM_PATTERNS)
+    _DANGEROUS_FILENAMES_RE = _combine_patterns(DANGEROUS_FILENAMES)
+    
+    # Memo of resolved parent directories, keyed by absolute unresolved path.
+    # Valid for one validation pass: cleared when an install starts and after
+    # operations that may turn paths into symlinks (staging commits, symlink installs)
+    _resolved_dirs: Dict[str, Path] = {}
+    _resolved_dirs_lock = threading.Lock()
+    MAX_RESOLVED_DIRS = 4096
+    
     # Allowed file extensions for installation
     ALLOWED_EXTENSIONS = {
         '.md', '.json', '.py', '.js', '.ts', '.jsx', '.tsx',
@@ -132,9 +154,104 @@ class SecurityValidator:
             - is_safe: True if path passes all security checks
             - error_message: Detailed error message with suggestions if validation fails
         """
+        try:
+            base_abs = cls._resolve(base_dir) if base_dir else None
+        except Exception as e:
+            return False, f"Path validation error: {e}"
+        
+        return cls._validate_path(path, base_abs)
+    
+    @classmethod
+    def validate_paths(cls, paths: Iterable[Path], base_dir: Optional[Path] = None,
+                       follow_symlinks: bool = True) -> List[Tuple[bool, str]]:
+        """
+        Validate many paths in one pass
+        
+        The base directory is resolved once and parent directories are
+        resolved once per directory, so thousands of files in a handful of
+        directories cost a handful of resolve() calls.
+        
+        Args:
+            paths: Paths to validate
+            base_dir: Base directory all paths should be within (optional)
+            follow_symlinks: If False, a symlink as the final component is
+                             validated as the link itself (for targets that are
+                             replaced rather than written through)
+            
+        Returns:
+            List of (is_safe, error_message) tuples in the order of paths
+        """
+        try:
+            base_abs = cls._resolve(base_dir) if base_dir else None
+        except Exception as e:
+            return [(False, f"Path validation error: {e}") for _ in paths]
+        
+        return [cls._validate_path(path, base_abs, follow_symlinks) for path in paths]
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget memoized directory resolutions (e.g. after creating symlinks)"""
+        with cls._resolved_dirs_lock:
+            cls._resolved_dirs.clear()
+    
+    @classmethod
+    def _resolve(cls, path: Path, follow_symlinks: bool = True) -> Path:
+        """
+        Resolve a path, reusing the memoized resolution of its parent
+        
+        Only the final component is examined: if it is a symlink (or '.'/'..')
+        the path is fully resolved, otherwise it is appended to the resolved
+        parent, which gives the same result as path.resolve().
+        
+        Args:
+            path: Path to resolve
+            follow_symlinks: Whether a symlink as the final component is followed
+            
+        Returns:
+            Absolute resolved path
+        """
+        name = path.name
+        if name in ('', '.', '..') or (follow_symlinks and os.path.islink(path)):
+            return path.resolve()
+        
+        parent = path.parent
+        key = str(parent) if parent.is_absolute() else os.path.join(os.getcwd(), str(parent))
+        with cls._resolved_dirs_lock:
+            resolved_parent = cls._resolved_dirs.get(key)
+        if resolved_parent is None:
+            resolved_parent = parent.resolve()
+            with cls._resolved_dirs_lock:
+                if len(cls._resolved_dirs) >= cls.MAX_RESOLVED_DIRS:
+                    cls._resolved_dirs.clear()
+                cls._resolved_dirs[key] = resolved_parent
+        
+        return resolved_parent / name
+    
+    @classmethod
+    def _find_pattern(cls, patterns: List[str], *values: str) -> str:
+        """Find which pattern of a category matched, for the error message"""
+        for pattern in patterns:
+            if any(re.search(pattern, value, re.IGNORECASE) for value in values):
+                return pattern
+        return patterns[0]
+    
+    @classmethod
+    def _validate_path(cls, path: Path, base_abs: Optional[Path],
+                       follow_symlinks: bool = True) -> Tuple[bool, str]:
+        """
+        Validate one path against an already resolved base directory
+        
+        Args:
+            path: Path to validate
+            base_abs: Resolved base directory or None
+            follow_symlinks: Whether a symlink as the final component is followed
+            
+        Returns:
+            Tuple of (is_safe: bool, error_message: str)
+        """
         try:
             # Convert to absolute path
-            abs_path = path.resolve()
+            abs_path = cls._resolve(path, follow_symlinks)
             
             # For system directory validation, use the original path structure
             # to avoid issues with symlinks and cross-platform path resolution
@@ -153,33 +270,32 @@ class SecurityValidator:
             # Always check traversal patterns (platform independent) - use original path string
             # to detect patterns before normalization removes them
             original_str = str(path).lower()
-            for pattern in cls.TRAVERSAL_PATTERNS:
-                if re.search(pattern, original_str, re.IGNORECASE):
-                    return False, cls._get_user_friendly_error_message("traversal", pattern, abs_path)
+            if cls._TRAVERSAL_RE.search(original_str):
+                pattern = cls._find_pattern(cls.TRAVERSAL_PATTERNS, original_str)
+                return False, cls._get_user_friendly_error_message("traversal", pattern, abs_path)
             
             # Check platform-specific system directory patterns - use original path first, then resolved
             # Always check both Windows and Unix patterns to handle cross-platform scenarios
             
             # Check Windows system directory patterns
-            for pattern in cls.WINDOWS_SYSTEM_PATTERNS:
-                if (re.search(pattern, original_path_str, re.IGNORECASE) or 
-                    re.search(pattern, resolved_path_str, re.IGNORECASE)):
-                    return False, cls._get_user_friendly_error_message("windows_system", pattern, abs_path)
+            if (cls._WINDOWS_SYSTEM_RE.search(original_path_str) or
+                    cls._WINDOWS_SYSTEM_RE.search(resolved_path_str)):
+                pattern = cls._find_pattern(cls.WINDOWS_SYSTEM_PATTERNS, original_path_str, resolved_path_str)
+                return False, cls._get_user_friendly_error_message("windows_system", pattern, abs_path)
             
             # Check Unix system directory patterns
-            for pattern in cls.UNIX_SYSTEM_PATTERNS:
-                if (re.search(pattern, original_path_str, re.IGNORECASE) or 
-                    re.search(pattern, resolved_path_str, re.IGNORECASE)):
-                    return False, cls._get_user_friendly_error_message("unix_system", pattern, abs_path)
+            if (cls._UNIX_SYSTEM_RE.search(original_path_str) or
+                    cls._UNIX_SYSTEM_RE.search(resolved_path_str)):
+                pattern = cls._find_pattern(cls.UNIX_SYSTEM_PATTERNS, original_path_str, resolved_path_str)
+                return False, cls._get_user_friendly_error_message("unix_system", pattern, abs_path)
             
             # Check for dangerous filenames
-            for pattern in cls.DANGEROUS_FILENAMES:
-                if re.search(pattern, abs_path.name, re.IGNORECASE):
-                    return False, f"Dangerous filename pattern detected: {pattern}"
+            if cls._DANGEROUS_FILENAMES_RE.search(abs_path.name):
+                pattern = cls._find_pattern(cls.DANGEROUS_FILENAMES, abs_path.name)
+                return False, f"Dangerous filename pattern detected: {pattern}"
             
             # Check if path is within base directory
-            if base_dir:
-                base_abs = base_dir.resolve()
+            if base_abs:
                 try:
                     abs_path.relative_to(base_abs)
                 except ValueError:
@@ -378,6 +494,7 @@ class SecurityValidator:
             return False, missing
     
     @classmethod
+    @traced("validate installation target", "security")
     def validate_installation_target(cls, target_dir: Path) -> Tuple[bool, List[str]]:
         """
         Validate installation target directory with enhanced Windows compatibility
@@ -518,6 +635,7 @@ class SecurityValidator:
         return len(errors) == 0, errors
     
     @classmethod
+    @traced("validate component files", "security")
     def validate_component_files(cls, file_list: List[Tuple[Path, Path]], base_source_dir: Path, base_target_dir: Path) -> Tuple[bool, List[str]]:
         """
         Validate list of files for component installation
@@ -532,16 +650,21 @@ class SecurityValidator:
         """
         errors = []
         
-        for source, target in file_list:
+        source_results = cls.validate_paths([source for source, _ in file_list], base_source_dir)
+        # Installed files are replaced, never written through, so a target that is
+        # a symlink into the package data (link_strategy "symlink") is still inside
+        target_results = cls.validate_paths([target for _, target in file_list], base_target_dir,
+                                            follow_symlinks=False)
+        
+        for (source, target), (source_safe, source_msg), (target_safe, target_msg) in zip(
+                file_list, source_results, target_results):
             # Validate source path
-            is_safe, msg = cls.validate_path(source, base_source_dir)
-            if not is_safe:
-                errors.append(f"Invalid source path {source}: {msg}")
+            if not source_safe:
+                errors.append(f"Invalid source path {source}: {source_msg}")
             
             # Validate target path
-            is_safe, msg = cls.validate_path(target, base_target_dir)
-            if not is_safe:
-                errors.append(f"Invalid target path {target}: {msg}")
+            if not target_safe:
+                errors.append(f"Invalid target path {target}: {target_msg}")
             
             # Validate file extension
             is_allowed, msg = cls.validate_file_extension(source)
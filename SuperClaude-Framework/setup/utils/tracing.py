@@ -0,0 +1,194 @@
+"""
+Lightweight operation tracing with Chrome trace export
+
+Phases of an operation are wrapped in nested spans:
+
+    with span("copy", component="core", files=12):
+        ...
+
+While tracing is off (the default) span() returns a shared no-op context
+manager, so instrumented code pays a function call and nothing else.
+With tracing on, every span becomes a complete ("X") event in the Chrome
+trace event format, which chrome://tracing and https://ui.perfetto.dev
+display as one timeline row per thread.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+from pathlib import Path
+
+
+class _NullSpan:
+    """Shared span used while tracing is off"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        """Ignore span arguments"""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Context manager recording one complete event"""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer._record(self._name, self._category, self._start, end, self._args)
+
+    def set(self, **args: Any) -> None:
+        """Attach more arguments to the span, e.g. results known only at the end"""
+        self._args.update(args)
+
+
+class Tracer:
+    """Collects spans of all threads of the process"""
+
+    def __init__(self):
+        self.enabled = False
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start collecting spans, discarding earlier ones"""
+        with self._lock:
+            self._events = []
+            self._thread_names = {}
+            self._origin = time.perf_counter_ns()
+            self.enabled = True
+
+    def stop(self) -> None:
+        """Stop collecting spans"""
+        self.enabled = False
+
+    def span(self, name: str, category: str = "setup", **args: Any) -> ContextManager:
+        """
+        Time a block of code
+
+        Args:
+            name: Span name shown in the trace viewer
+            category: Event category (e.g. "installer", "component", "io")
+            **args: JSON-serializable details shown with the span
+
+        Returns:
+            Context manager; a shared no-op one while tracing is off
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def _record(self, name: str, category: str, start: int, end: int, args: Dict[str, Any]) -> None:
+        """Store a finished span as a complete event (timestamps in microseconds)"""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def get_events(self) -> List[Dict[str, Any]]:
+        """Get the recorded events including thread name metadata"""
+        with self._lock:
+            events = [
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                for tid, name in self._thread_names.items()
+            ]
+            events.extend(sorted(self._events, key=lambda event: event["ts"]))
+        return events
+
+    def write(self, path: Path) -> int:
+        """
+        Write the recorded spans as a Chrome trace file
+
+        Args:
+            path: Output file
+
+        Returns:
+            Number of spans written
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        events = self.get_events()
+        trace = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms"
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, default=str)
+        return sum(1 for event in events if event["ph"] == "X")
+
+
+# Process-wide tracer
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
+
+
+def span(name: str, category: str = "setup", **args: Any) -> ContextManager:
+    """Time a block of code with the process-wide tracer (see Tracer.span)"""
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return _Span(_tracer, name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "setup") -> Callable:
+    """
+    Decorator wrapping every call of a function in a span
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Event category
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(_tracer, span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
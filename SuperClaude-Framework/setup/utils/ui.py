@@ -7,7 +7,9 @@ import sys
 import time
 import shutil
 import getpass
-from typing import List, Optional, Any, Dict, Union
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Any, Dict, Union
 from enum import Enum
 
 # Try to import colorama for cross-platform color support
@@ -68,6 +70,8 @@ class ProgressBar:
         self.suffix = suffix
         self.current = 0
         self.start_time = time.time()
+        self._line = ''
+        self._lock = threading.RLock()
         
         # Get terminal width for responsive display
         try:
@@ -118,7 +122,31 @@ class ProgressBar:
             if len(plain_line) > max_length:
                 progress_line = progress_line[:max_length] + "..."
         
-        print(progress_line, end='', flush=True)
+        with self._lock:
+            self._line = progress_line
+            print(progress_line, end='', flush=True)
+    
+    def clear(self) -> None:
+        """Erase the bar from the current console line"""
+        with self._lock:
+            if self._line:
+                print('\r' + ' ' * (self.terminal_width - 1) + '\r', end='', flush=True)
+    
+    def redraw(self) -> None:
+        """Draw the last state of the bar again, e.g. after clear()"""
+        with self._lock:
+            if self._line:
+                print(self._line, end='', flush=True)
+    
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Hide the bar while other output is printed, then draw it again"""
+        with self._lock:
+            self.clear()
+            try:
+                yield
+            finally:
+                self.redraw()
     
     def increment(self, message: str = '') -> None:
         """
@@ -136,8 +164,10 @@ class ProgressBar:
         Args:
             message: Completion message
         """
-        self.update(self.total, message)
-        print()  # New line after completion
+        with self._lock:
+            self.update(self.total, message)
+            print()  # New line after completion
+            self._line = ''
     
     def _format_time(self, seconds: float) -> str:
         """Format time duration as human-readable string"""
@@ -151,6 +181,21 @@ class ProgressBar:
             return f"{hours:.0f}h {minutes:.0f}m"
 
 
+# Progress bar currently drawn on the last console line; console log output clears and redraws it
+_active_progress_bar: Optional[ProgressBar] = None
+
+
+def set_active_progress_bar(bar: Optional[ProgressBar]) -> None:
+    """Register the progress bar drawn while an operation runs (None when it has finished)"""
+    global _active_progress_bar
+    _active_progress_bar = bar
+
+
+def get_active_progress_bar() -> Optional[ProgressBar]:
+    """Get the progress bar currently drawn, if any"""
+    return _active_progress_bar
+
+
 class Menu:
     """Interactive menu system with keyboard navigation"""
     
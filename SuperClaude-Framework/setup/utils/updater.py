@@ -9,7 +9,7 @@ import json
 import time
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Any
 from packaging import version
 import urllib.request
 import urllib.error
@@ -26,16 +26,18 @@ class UpdateChecker:
     CACHE_FILE = Path.home() / ".claude" / ".update_check"
     CHECK_INTERVAL = 86400  # 24 hours in seconds
     TIMEOUT = 2  # seconds
+    REFRESH_GRACE = 60  # seconds a running background refresh is given before retrying
     
-    def __init__(self, current_version: str):
+    def __init__(self, current_version: str, enable_logging: bool = True):
         """
         Initialize update checker
         
         Args:
             current_version: Current installed version
+            enable_logging: Use the global logger (disabled for background refreshes)
         """
         self.current_version = current_version
-        self.logger = get_logger()
+        self.logger = get_logger() if enable_logging else None
         
     def should_check_update(self, force: bool = False) -> bool:
         """
@@ -50,39 +52,117 @@ class UpdateChecker:
         if force:
             return True
             
-        if not self.CACHE_FILE.exists():
-            return True
-            
+        last_check = self.load_cache().get('last_check', 0)
+        
+        # Check if 24 hours have passed
+        return time.time() - last_check > self.CHECK_INTERVAL
+        
+    def load_cache(self) -> Dict[str, Any]:
+        """
+        Load the cached update check result
+        
+        Returns:
+            Cache dict with last_check, latest_version and install_method (empty if missing)
+        """
         try:
             with open(self.CACHE_FILE, 'r') as f:
                 data = json.load(f)
-                last_check = data.get('last_check', 0)
-                
-            # Check if 24 hours have passed
-            if time.time() - last_check > self.CHECK_INTERVAL:
-                return True
-                
-        except (json.JSONDecodeError, KeyError):
-            return True
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
             
-        return False
+    def save_cache(self, updates: Dict[str, Any]):
+        """
+        Merge values into the cache file, replacing it atomically
+        
+        Args:
+            updates: Cache entries to set
+        """
+        data = self.load_cache()
+        data.update(updates)
+        
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.CACHE_FILE.with_name(f"{self.CACHE_FILE.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.CACHE_FILE)
+        except OSError as e:
+            if self.logger:
+                self.logger.debug(f"Could not write update cache: {e}")
         
     def save_check_timestamp(self):
         """Save the current timestamp as last check time"""
-        self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
-        data = {}
-        if self.CACHE_FILE.exists():
-            try:
-                with open(self.CACHE_FILE, 'r') as f:
-                    data = json.load(f)
-            except:
-                pass
-                
-        data['last_check'] = time.time()
+        self.save_cache({'last_check': time.time()})
+        
+    def refresh_cache(self) -> Optional[str]:
+        """
+        Query PyPI and the installation method and store the results
+        
+        The check timestamp is saved even when PyPI is unreachable, so offline
+        machines retry once per CHECK_INTERVAL instead of on every command.
+        
+        Returns:
+            Latest version string or None if check fails
+        """
+        latest = self.get_latest_version()
+        updates = {
+            'last_check': time.time(),
+            'install_method': self.detect_installation_method()
+        }
+        if latest:
+            updates['latest_version'] = latest
+        self.save_cache(updates)
+        return latest
+        
+    def start_background_refresh(self) -> bool:
+        """
+        Refresh the cache in a detached process so the current command never waits
+        
+        Returns:
+            True if a refresh process was started
+        """
+        cache = self.load_cache()
+        refresh_started = cache.get('refresh_started', 0)
+        if refresh_started > cache.get('last_check', 0):
+            # The last refresh has not stored a result yet
+            if time.time() - refresh_started < self.REFRESH_GRACE:
+                return False  # Still running
+            # It died without writing the cache; record the failed check so it
+            # is retried after CHECK_INTERVAL instead of on every command
+            self.save_cache({'last_check': time.time(), 'refresh_failed': refresh_started})
+            return False
+        self.save_cache({'refresh_started': time.time()})
+        
+        # Make the setup package importable regardless of how we were launched;
+        # the child runs in project_root, so a setup.py in the user's working
+        # directory cannot shadow our package
+        project_root = str(Path(__file__).resolve().parent.parent.parent)
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [project_root, env.get('PYTHONPATH')]))
         
-        with open(self.CACHE_FILE, 'w') as f:
-            json.dump(data, f)
+        kwargs = {}
+        if sys.platform == 'win32':
+            kwargs['creationflags'] = (getattr(subprocess, 'DETACHED_PROCESS', 0) |
+                                       getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0))
+        else:
+            kwargs['start_new_session'] = True
+        
+        try:
+            subprocess.Popen(
+                [sys.executable, '-m', 'setup.utils.updater', '--refresh', self.current_version],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=project_root,
+                env=env,
+                **kwargs
+            )
+            return True
+        except OSError as e:
+            if self.logger:
+                self.logger.debug(f"Could not start background update check: {e}")
+            return False
             
     def get_latest_version(self) -> Optional[str]:
         """
@@ -177,7 +257,11 @@ class UpdateChecker:
         Returns:
             Update command string
         """
-        method = self.detect_installation_method()
+        # Prefer the method detected by the last (background) check
+        method = self.load_cache().get('install_method')
+        if not method:
+            method = self.detect_installation_method()
+            self.save_cache({'install_method': method})
         
         commands = {
             'pipx': 'pipx upgrade SuperClaude',
@@ -272,22 +356,29 @@ class UpdateChecker:
         if os.getenv('SUPERCLAUDE_AUTO_UPDATE', '').lower() in ['true', '1', 'yes']:
             auto_update = True
             
-        # Check if enough time has passed
-        if not self.should_check_update(force):
-            return False
+        if force:
+            # Explicit checks wait for a fresh answer
+            latest = self.refresh_cache()
+        else:
+            # Answer from the cache and refresh it in the background when stale
+            cache = self.load_cache()
+            if self.should_check_update():
+                self.start_background_refresh()
+            latest = cache.get('latest_version')
+            
+            # Notify about an available update at most once per check interval
+            if time.time() - cache.get('last_notified', 0) < self.CHECK_INTERVAL:
+                return False
             
-        # Get latest version
-        latest = self.get_latest_version()
         if not latest:
             return False
             
-        # Save timestamp
-        self.save_check_timestamp()
-        
         # Compare versions
         if not self.compare_versions(latest):
             return False
             
+        self.save_cache({'last_notified': time.time()})
+            
         # Show banner and potentially update
         if self.show_update_banner(latest, auto_update):
             return self.perform_update()
@@ -310,4 +401,24 @@ def check_for_updates(current_version: str = None, **kwargs) -> bool:
         from setup import __version__
         current_version = __version__
     checker = UpdateChecker(current_version)
-    return checker.check_and_notify(**kwargs)
\ No newline at end of file
+    return checker.check_and_notify(**kwargs)
+
+
+def refresh_update_cache(current_version: str) -> None:
+    """
+    Refresh the update check cache (entry point of the background process)
+    
+    Args:
+        current_version: Current installed version
+    """
+    checker = UpdateChecker(current_version, enable_logging=False)
+    try:
+        checker.refresh_cache()
+    except Exception:
+        # Record the failed check so the next command does not start another refresh at once
+        checker.save_cache({'last_check': time.time(), 'refresh_failed': time.time()})
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == '--refresh':
+        refresh_update_cache(sys.argv[2])
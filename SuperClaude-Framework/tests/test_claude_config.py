@@ -0,0 +1,154 @@
+"""
+Tests for setup.services.claude_config
+
+patch_key() splices bytes into every user's ~/.claude.json, so the
+surrounding document must come back verbatim in all of these layouts.
+"""
+
+import json
+import threading
+
+import pytest
+
+from setup.services.claude_config import ClaudeConfigService
+
+
+NEW_SERVERS = {"new": {"command": "x"}}
+
+
+def _patch(tmp_path, text, value=NEW_SERVERS):
+    config = tmp_path / ".claude.json"
+    config.write_text(text, encoding="utf-8")
+    changed = ClaudeConfigService(config).patch_key("mcpServers", value)
+    return changed, config.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{}', '{\n  "mcpServers":{"new":{"command":"x"}}\n}'),
+    ('{\n}\n', '{\n  "mcpServers":{"new":{"command":"x"}}\n}\n'),
+])
+def test_patch_empty_object(tmp_path, text, expected):
+    changed, result = _patch(tmp_path, text)
+
+    assert changed
+    assert result == expected
+
+
+def test_patch_leaves_nested_mcp_servers_alone(tmp_path):
+    text = '{\n  "projects": {"/p": {"mcpServers": {"keep": 1}}},\n  "numStartups": 3\n}\n'
+
+    changed, result = _patch(tmp_path, text)
+
+    assert changed
+    assert result == (
+        '{\n  "projects": {"/p": {"mcpServers": {"keep": 1}}},\n  "numStartups": 3,\n'
+        '  "mcpServers": {\n    "new": {\n      "command": "x"\n    }\n  }\n}\n'
+    )
+    assert json.loads(result)["projects"]["/p"]["mcpServers"] == {"keep": 1}
+
+
+def test_patch_replaces_last_duplicate_key(tmp_path):
+    text = '{"mcpServers": {"a": 1}, "x": 1, "mcpServers": {"b": 2}}'
+    config = tmp_path / ".claude.json"
+    config.write_text(text, encoding="utf-8")
+    service = ClaudeConfigService(config)
+
+    # Like json.loads, the last occurrence wins
+    assert service.read_key("mcpServers") == {"b": 2}
+    assert service.patch_key("mcpServers", NEW_SERVERS)
+    assert config.read_text(encoding="utf-8") == (
+        '{"mcpServers": {"a": 1}, "x": 1, "mcpServers": {"new":{"command":"x"}}}'
+    )
+    assert json.loads(config.read_text(encoding="utf-8"))["mcpServers"] == NEW_SERVERS
+
+
+def test_patch_matches_unicode_escaped_key(tmp_path):
+    text = '{"mcp\\u0053ervers": {"old": 1}, "y": "z"}'
+
+    changed, result = _patch(tmp_path, text)
+
+    assert changed
+    assert result == '{"mcp\\u0053ervers": {"new":{"command":"x"}}, "y": "z"}'
+
+
+def test_patch_ignores_braces_inside_strings(tmp_path):
+    text = '{"a": "}{\\"[", "mcpServers": {"old": "{"}, "b": ["}"]}'
+
+    changed, result = _patch(tmp_path, text)
+
+    assert changed
+    assert result == '{"a": "}{\\"[", "mcpServers": {"new":{"command":"x"}}, "b": ["}"]}'
+    assert json.loads(result) == {"a": '}{"[', "mcpServers": NEW_SERVERS, "b": ["}"]}
+
+
+def test_patch_keeps_indentation_of_last_member(tmp_path):
+    text = '{\n  "a": 1,\n  "mcpServers": {\n    "old": {}\n  }\n}'
+
+    changed, result = _patch(tmp_path, text)
+
+    assert changed
+    assert result == '{\n  "a": 1,\n  "mcpServers": {\n    "new": {\n      "command": "x"\n    }\n  }\n}'
+
+
+def test_patch_with_current_value_does_not_write(tmp_path):
+    text = '{"mcpServers": {"new": {"command": "x"}}, "projects": {}}'
+    config = tmp_path / ".claude.json"
+    config.write_text(text, encoding="utf-8")
+    mtime = config.stat().st_mtime_ns
+
+    assert not ClaudeConfigService(config).patch_key("mcpServers", NEW_SERVERS)
+    assert config.read_text(encoding="utf-8") == text
+    assert config.stat().st_mtime_ns == mtime
+
+
+def test_read_key_missing_returns_default(tmp_path):
+    config = tmp_path / ".claude.json"
+    config.write_text('{"projects": {"/p": {"mcpServers": {"x": 1}}}}', encoding="utf-8")
+
+    assert ClaudeConfigService(config).read_key("mcpServers", {}) == {}
+
+
+def test_patch_rejects_non_object(tmp_path):
+    config = tmp_path / ".claude.json"
+    config.write_text('[1, 2]', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        ClaudeConfigService(config).patch_key("mcpServers", NEW_SERVERS)
+    assert config.read_text(encoding="utf-8") == '[1, 2]'
+
+
+def test_lock_file_removed_after_patch(tmp_path):
+    _patch(tmp_path, '{}')
+
+    assert not (tmp_path / ".claude.json.lock").exists()
+
+
+def test_lock_taken_without_config(tmp_path):
+    service = ClaudeConfigService(tmp_path / ".claude.json")
+
+    with service._locked():
+        assert service.lock_path.exists()
+    assert not service.lock_path.exists()
+
+
+def test_concurrent_patches_are_serialized(tmp_path):
+    config = tmp_path / ".claude.json"
+    config.write_text('{"numStartups": 1}', encoding="utf-8")
+
+    def increment():
+        for _ in range(25):
+            service = ClaudeConfigService(config)
+            with service._locked():
+                value = service.read_key("counter", 0)
+                text = service._read_text()
+                service._write_text(service._splice(text, "counter", str(value + 1),
+                                                    service._locate(text, "counter")))
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert json.loads(config.read_text(encoding="utf-8")) == {"numStartups": 1, "counter": 100}
+    assert not (tmp_path / ".claude.json.lock").exists()
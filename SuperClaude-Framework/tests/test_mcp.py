@@ -0,0 +1,26 @@
+"""
+Tests for uninstalling the MCP component
+"""
+
+import logging
+
+from setup.components.mcp import MCPComponent
+
+
+SERVERS = {"context7": {"command": "npx", "args": ["-y", "@upstash/context7-mcp"]}}
+
+
+def test_uninstall_without_templates_warns_and_keeps_servers(tmp_path, monkeypatch, caplog):
+    component = MCPComponent(tmp_path)
+    saved = []
+    monkeypatch.setattr(component, "_get_templates", lambda: None)
+    monkeypatch.setattr(component, "_load_mcp_servers", lambda: dict(SERVERS))
+    monkeypatch.setattr(component, "_get_installed_servers", lambda: ["context7"])
+    monkeypatch.setattr(component, "_save_mcp_servers", saved.append)
+
+    with caplog.at_level(logging.WARNING):
+        assert component.uninstall()
+
+    assert not saved
+    assert any("leaving MCP servers in place: context7" in record.getMessage()
+               for record in caplog.records if record.levelno == logging.WARNING)
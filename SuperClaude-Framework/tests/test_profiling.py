@@ -0,0 +1,76 @@
+"""
+Tests for setup.utils.profiling
+"""
+
+import cProfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from setup.utils import profiling
+from setup.utils.profiling import OperationProfiler
+
+
+WORKERS = 4
+
+
+def _busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _run_pool() -> list:
+    """Run work on a pool of several workers, failing instead of hanging if a worker dies"""
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        futures = [executor.submit(_busy, 20000) for _ in range(WORKERS * 2)]
+        return [future.result(timeout=30) for future in futures]
+
+
+def test_cpu_profile_of_worker_pool(tmp_path):
+    with OperationProfiler("cpu", tmp_path, "install") as profiler:
+        results = _run_pool()
+
+    assert len(results) == WORKERS * 2
+    functions = {function for (_, _, function) in profiler._stats.stats}
+    assert "_busy" in functions
+
+    files = profiler.write()
+    assert any(path.suffix == ".prof" for path in files)
+
+
+def test_both_profile_of_worker_pool(tmp_path):
+    with OperationProfiler("both", tmp_path, "install"):
+        results = _run_pool()
+
+    assert len(results) == WORKERS * 2
+
+
+class _ExclusiveProfile(cProfile.Profile):
+    """Profiler that, like cProfile on Python 3.12+, refuses a second active instance"""
+
+    active = 0
+    lock = threading.Lock()
+
+    def enable(self, *args, **kwargs):
+        with self.lock:
+            if _ExclusiveProfile.active:
+                raise ValueError("Another profiling tool is already active")
+            _ExclusiveProfile.active += 1
+        super().enable(*args, **kwargs)
+
+    def disable(self):
+        super().disable()
+        with self.lock:
+            _ExclusiveProfile.active = 0
+
+
+def test_worker_threads_survive_exclusive_profiler(tmp_path, monkeypatch):
+    # Force the per-thread path so the fallback is exercised on every Python version
+    monkeypatch.setattr(profiling, "PROFILER_COVERS_ALL_THREADS", False)
+    monkeypatch.setattr(profiling.cProfile, "Profile", _ExclusiveProfile)
+
+    with OperationProfiler("cpu", tmp_path, "install") as profiler:
+        results = _run_pool()
+
+    assert len(results) == WORKERS * 2
+    # Only the main thread's profiler could be enabled
+    assert len(profiler._profiles) == 1
+    assert profiler.write()
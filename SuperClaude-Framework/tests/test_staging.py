@@ -0,0 +1,149 @@
+"""
+Tests for setup.core.staging and staged runs of the installer
+"""
+
+import json
+
+import pytest
+
+from setup.core.installer import Installer
+from setup.core.staging import JOURNAL_NAME, StagedInstall, StagingError
+from setup.services.settings import SettingsService
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _stage(staging, relative, text):
+    _write(staging.get_staging_path(relative), text)
+    staging.stage(relative)
+
+
+@pytest.fixture
+def install_dir(tmp_path):
+    install_dir = tmp_path / ".claude"
+    _write(install_dir / "kept.md", "kept")
+    _write(install_dir / "changed.md", "old")
+    _write(install_dir / "removed.md", "removed")
+    _write(install_dir / ".superclaude-metadata.json", '{"version": "old"}')
+    return install_dir
+
+
+def _commit(install_dir):
+    staging = StagedInstall(install_dir)
+    _stage(staging, "changed.md", "new")
+    _stage(staging, "sub/added.md", "added")
+    staging.stage_removal("removed.md")
+    changed = staging.commit()
+    staging.discard()
+    return staging, changed
+
+
+def test_commit_switches_in_staged_files(install_dir):
+    staging, changed = _commit(install_dir)
+
+    assert changed == 3
+    assert (install_dir / "changed.md").read_text(encoding="utf-8") == "new"
+    assert (install_dir / "sub" / "added.md").read_text(encoding="utf-8") == "added"
+    assert not (install_dir / "removed.md").exists()
+    assert (install_dir / "kept.md").read_text(encoding="utf-8") == "kept"
+
+    # Only the replaced files are kept for rollback, the journal is written last
+    assert (staging.previous_dir / "changed.md").read_text(encoding="utf-8") == "old"
+    assert (staging.previous_dir / "removed.md").read_text(encoding="utf-8") == "removed"
+    assert not (staging.previous_dir / "kept.md").exists()
+    assert staging.has_previous()
+    journal = json.loads((staging.previous_dir / JOURNAL_NAME).read_text(encoding="utf-8"))
+    assert [change["path"] for change in journal["changes"]] == [
+        "changed.md", "removed.md", "sub/added.md"
+    ]
+    assert not staging.staging_dir.exists()
+
+
+def test_commit_without_changes_keeps_previous(install_dir):
+    _commit(install_dir)
+    staging = StagedInstall(install_dir)
+
+    assert staging.commit() == 0
+    assert staging.has_previous()
+
+
+def test_commit_rejects_incomplete_staging(install_dir):
+    staging = StagedInstall(install_dir)
+    _stage(staging, "changed.md", "new")
+    staging.get_staging_path("changed.md").write_text("truncated?", encoding="utf-8")
+
+    with pytest.raises(StagingError):
+        staging.commit()
+    assert (install_dir / "changed.md").read_text(encoding="utf-8") == "old"
+    assert not staging.has_previous()
+
+
+def test_rollback_after_later_user_edit(install_dir):
+    staging, _ = _commit(install_dir)
+    (install_dir / ".superclaude-metadata.json").write_text('{"version": "new"}', encoding="utf-8")
+    # The user edits installed files after the staged install
+    (install_dir / "changed.md").write_text("user edit", encoding="utf-8")
+    (install_dir / "sub" / "added.md").write_text("user edit", encoding="utf-8")
+
+    assert StagedInstall(install_dir).rollback() == 3
+
+    # Rollback returns to the files before the staged install, later edits included
+    assert (install_dir / "changed.md").read_text(encoding="utf-8") == "old"
+    assert (install_dir / "removed.md").read_text(encoding="utf-8") == "removed"
+    assert not (install_dir / "sub" / "added.md").exists()
+    assert (install_dir / "kept.md").read_text(encoding="utf-8") == "kept"
+    assert json.loads((install_dir / ".superclaude-metadata.json").read_text(encoding="utf-8")) == {
+        "version": "old"
+    }
+    assert not staging.previous_dir.exists()
+
+    with pytest.raises(StagingError):
+        StagedInstall(install_dir).rollback()
+
+
+class _FakeComponent:
+    """Component that stages one file and registers itself, or fails"""
+
+    def __init__(self, install_dir, name, fail=False):
+        self.install_dir = install_dir
+        self.name = name
+        self.fail = fail
+
+    def get_metadata(self):
+        return {"name": self.name}
+
+    def get_dependencies(self):
+        return ["staged"] if self.fail else []
+
+    def validate_prerequisites(self, installSubPath=None):
+        return True, []
+
+    def install(self, config):
+        if self.fail:
+            return False
+        staging = config["staging"]
+        _stage(staging, "changed.md", "new")
+        SettingsService(self.install_dir).add_component_registration(self.name, {})
+        return True
+
+
+def test_discard_after_component_failure(install_dir):
+    metadata = (install_dir / ".superclaude-metadata.json").read_text(encoding="utf-8")
+    installer = Installer(install_dir)
+    installer.register_components([
+        _FakeComponent(install_dir, "staged"),
+        _FakeComponent(install_dir, "failing", fail=True)
+    ])
+
+    assert not installer.install_components(["staged", "failing"], {"staged": True})
+
+    # A file was staged, but nothing is switched in once a component failed
+    assert installer.failed_components == {"failing"}
+    assert (install_dir / "changed.md").read_text(encoding="utf-8") == "old"
+    assert (install_dir / ".superclaude-metadata.json").read_text(encoding="utf-8") == metadata
+    staging = StagedInstall(install_dir)
+    assert not staging.staging_dir.exists()
+    assert not staging.has_previous()
@@ -0,0 +1,26 @@
+"""
+Tests for the persistent probe cache of setup.core.validator
+"""
+
+import sys
+
+from setup.core.validator import Validator
+
+
+PROBE = [sys.executable, "--version"]
+
+
+def test_probe_cache_lives_in_install_dir(tmp_path):
+    Validator(tmp_path).probe_commands([PROBE])
+
+    assert (tmp_path / Validator.PROBE_CACHE_NAME).exists()
+    validator = Validator(tmp_path)
+    assert " ".join(PROBE) in validator._load_probe_cache()
+
+
+def test_dry_run_does_not_write_probe_cache(tmp_path):
+    validator = Validator(tmp_path, dry_run=True)
+    validator.probe_commands([PROBE])
+
+    assert validator.probe_results[" ".join(PROBE)]["returncode"] == 0
+    assert not (tmp_path / Validator.PROBE_CACHE_NAME).exists()